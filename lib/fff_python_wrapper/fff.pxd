@@ -53,8 +53,8 @@ cdef extern from "fff_vector.h":
     long double fff_vector_sum(fff_vector* x)
     long double fff_vector_ssd(fff_vector* x, double* m, int fixed)
     long double fff_vector_sad(fff_vector* x, double m)
-    double fff_vector_median(fff_vector* x)
-    double fff_vector_quantile(fff_vector* x, double r, int interp)
+    double fff_vector_median(fff_vector* x) nogil
+    double fff_vector_quantile(fff_vector* x, double r, int interp) nogil
     double fff_vector_wmedian_from_sorted_data(fff_vector* x_sorted, fff_vector* w)
 
 # Exports from fff_matrix.h
@@ -168,7 +168,10 @@ cdef extern from "fffpy.h":
     void fff_vector_fetch_using_NumPy(fff_vector* y, char* data, npy_intp stride, int type, int itemsize)
     fffpy_multi_iterator* fffpy_multi_iterator_new(int narr, int axis, ...) 
     void fffpy_multi_iterator_delete(fffpy_multi_iterator* thisone)
-    void fffpy_multi_iterator_update(fffpy_multi_iterator* thisone)
-    void fffpy_multi_iterator_reset(fffpy_multi_iterator* thisone)
+    # The two functions below only touch the Python C-API to copy
+    # non-double data: they are safe without the GIL when all the
+    # iterated arrays are double
+    void fffpy_multi_iterator_update(fffpy_multi_iterator* thisone) nogil
+    void fffpy_multi_iterator_reset(fffpy_multi_iterator* thisone) nogil
 
     
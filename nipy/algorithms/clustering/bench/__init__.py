@@ -0,0 +1,2 @@
+# Init for benchmarks for clustering algorithms
+from __future__ import absolute_import
@@ -0,0 +1,56 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+from __future__ import print_function
+from __future__ import absolute_import
+
+import sys
+import warnings
+
+import numpy as np
+
+from ..hierarchical_clustering import average_link_graph_segment, ward_segment
+from ...graph.graph import wgraph_from_3d_grid
+
+import numpy.testing as npt
+
+
+def _grid_graph(size, dim=3):
+    """ 6-neighbours graph on a cubic grid of side size,
+    with smooth random features and similarities
+    """
+    xyz = np.array(np.where(np.ones((size,) * 3))).T
+    G = wgraph_from_3d_grid(xyz, 6)
+    X = np.cumsum(np.random.standard_normal((size ** 3, dim)), 0)
+    G.weights = np.exp(- np.sum((X[G.edges[:, 0]] - X[G.edges[:, 1]]) ** 2,
+                                1))
+    return G, X
+
+
+def bench_average_link():
+    np.random.seed(20111001)
+    repeat = 1
+    sys.stdout.flush()
+    print("\nAverage link on a 3D grid")
+    print("-------------------------")
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)
+        for size in (10, 20, 30, 40):
+            G, X = _grid_graph(size)
+            print('%6d voxels %6.2f' % (G.V, npt.measure(
+                'average_link_graph_segment(G, qmax=100)', repeat)))
+    sys.stdout.flush()
+
+
+def bench_ward():
+    np.random.seed(20111001)
+    repeat = 1
+    sys.stdout.flush()
+    print("\nWard on a 3D grid")
+    print("-----------------")
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)
+        for size in (10, 20, 30, 40):
+            G, X = _grid_graph(size)
+            print('%6d voxels %6.2f' % (G.V, npt.measure(
+                'ward_segment(G, X, qmax=100)', repeat)))
+    sys.stdout.flush()
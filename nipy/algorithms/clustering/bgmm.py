@@ -24,7 +24,8 @@ from scipy.special import gammaln
 import math
 
 from .utils import kmeans
-from .gmm import GMM
+from .gmm import (GMM, precision_cholesky, gaussian_log_densities,
+                  logsumexp)
 
 ##################################################################
 # ancillary functions ############################################
@@ -112,6 +113,43 @@ def generate_Wishart(n, V):
     return W
 
 
+def generate_Wishart_factors(n, V):
+    """
+    Generate a set of independent samples from Wishart densities,
+    returned in factored form
+
+    Parameters
+    ----------
+    n: array of shape (k),
+       the numbers of degrees of freedom of the Wishart densities
+    V: array of shape (k, p, p),
+       the scale matrices of the Wishart densities
+
+    Returns
+    -------
+    R: array of shape (k, p, p),
+       factors of the draws, i.e. np.dot(R[j], R[j].T) has the same
+       distribution as generate_Wishart(n[j], V[j])
+    log_det: array of shape (k),
+             the log-determinants of the draws
+
+    Notes
+    -----
+    The random matrices of all the draws are generated at once, and the
+    determinants are read on the triangular factors
+    """
+    n = np.asarray(n, dtype=np.double)
+    k, p = V.shape[0], V.shape[1]
+    icv = np.array([cholesky(v) for v in V]).reshape(k, p, p)
+    A = nr.randn(k, p, p) * np.tri(p)
+    diag = np.sqrt(nr.chisquare(np.reshape(n, (k, 1)) - np.arange(p)))
+    A[:, np.arange(p), np.arange(p)] = diag
+    R = np.einsum('kij,kjl->kil', icv, A)
+    log_det = 2 * (np.sum(np.log(np.abs(np.diagonal(icv, 0, 1, 2))), 1) +
+                   np.sum(np.log(diag), 1))
+    return R, log_det
+
+
 def wishart_eval(n, V, W, dV=None, dW=None, piV=None):
     """Evaluation of the  probability of W under Wishart(n,V)
 
@@ -241,6 +279,76 @@ def multinomial(probabilities):
     return z
 
 
+def gumbel_multinomial(log_probabilities):
+    """
+    Generate samples from a multivariate distribution given in the log
+    domain, using the Gumbel-max trick
+
+    Parameters
+    ----------
+    log_probabilities: array of shape (nelements, nclasses):
+                       log-likelihood of each element belonging to each class,
+                       up to an additive constant per row
+
+    Returns
+    -------
+    z array of shape (nelements): the draws,
+      that take values in [0..nclasses-1]
+
+    Notes
+    -----
+    The rows need not be normalized, and classes with log-probability
+    -np.inf are never drawn; this avoids the underflow of small likelihoods.
+    """
+    log_probabilities = np.asarray(log_probabilities, dtype=np.double)
+    with np.errstate(divide='ignore'):
+        gumbel = - np.log(- np.log(np.random.rand(*log_probabilities.shape)))
+    return np.argmax(log_probabilities + gumbel, 1)
+
+
+def label_moments(x, z, k):
+    """
+    Compute the sufficient statistics of the data within each class
+
+    Parameters
+    ----------
+    x: array of shape (nb_samples, dim),
+       the data
+    z: array of shape (nb_samples),
+       the class of each sample; samples with values outside of [0, k)
+       are ignored
+    k: int,
+       the number of classes
+
+    Returns
+    -------
+    pop: array of shape (k), the population of each class
+    sums: array of shape (k, dim), the sum of the data in each class
+    scatter: array of shape (k, dim, dim),
+             the scatter matrix of the data around each class mean
+    """
+    x = np.asarray(x, dtype=np.double)
+    z = np.asarray(z).astype(np.intp)
+    valid = (z >= 0) & (z < k)
+    if not valid.all():
+        x, z = x[valid], z[valid]
+    dim = x.shape[1]
+    pop = np.bincount(z, minlength=k)[:k]
+    sums = np.zeros((k, dim))
+    for i in range(dim):
+        sums[:, i] = np.bincount(z, weights=x[:, i], minlength=k)[:k]
+
+    # center each sample on its class mean before forming the products
+    dx = x - (sums / np.maximum(pop, 1)[:, np.newaxis])[z]
+    scatter = np.zeros((k, dim, dim))
+    for i in range(dim):
+        for j in range(i + 1):
+            scatter[:, i, j] = np.bincount(z, weights=dx[:, i] * dx[:, j],
+                                           minlength=k)[:k]
+            scatter[:, j, i] = scatter[:, i, j]
+    return pop, sums, scatter
+
+
 def dkl_gaussian(m1, P1, m2, P2):
     """
     Returns the KL divergence between gausians densities
@@ -461,13 +569,27 @@ class BGMM(GMM):
         nocheck: boolean, optional,
                  if nocheck==True, check is skipped
         """
+        mx = x.mean(0)
+        self._guess_priors_from_moments(mx, np.mean((x - mx) ** 2, 0),
+                                        nocheck)
+
+    def _guess_priors_from_moments(self, mx, vx, nocheck=0):
+        """
+        Set the priors given the mean and the variance of the data in each
+        dimension, see guess_priors
+
+        Parameters
+        ----------
+        mx: array of shape (dim), the mean of the data
+        vx: array of shape (dim), the variance of the data
+        nocheck: boolean, optional,
+                 if nocheck==True, check is skipped
+        """
         # a few parameters
         small = 0.01
         elshape = (1, self.dim, self.dim)
-        mx = np.reshape(x.mean(0), (1, self.dim))
-        dx = x - mx
-        vx = np.dot(dx.T, dx) / x.shape[0]
-        px = np.reshape(np.diag(1.0 / np.diag(vx)), elshape)
+        mx = np.reshape(mx, (1, self.dim))
+        px = np.reshape(np.diag(1.0 / vx), elshape)
         px *= np.exp(2.0 / self.dim * math.log(self.k))
 
         # set the priors
@@ -514,8 +636,9 @@ class BGMM(GMM):
         -------
         hist : array shape (self.k) count variable
         """
-        hist = np.array([np.sum(z == k) for k in range(self.k)])
-        return hist
+        z = np.asarray(z).astype(np.intp)
+        hist = np.bincount(z[(z >= 0) & (z < self.k)], minlength=self.k)
+        return hist[:self.k]
 
     def update_weights(self, z):
         """
@@ -543,20 +666,25 @@ class BGMM(GMM):
         z: array of shape (nb_samples), type = np.int
           the corresponding classification
         """
-        pop = self.pop(z)
+        self._update_means(label_moments(x, z, self.k))
+
+    def _update_means(self, moments):
+        """
+        Resample the means given the class-wise statistics of the data,
+        as returned by label_moments
+        """
+        pop, sums, _ = moments
         self.shrinkage = self.prior_shrinkage + pop
-        empmeans = np.zeros(np.shape(self.means))
         prior_shrinkage = np.reshape(self.prior_shrinkage, (self.k, 1))
         shrinkage = np.reshape(self.shrinkage, (self.k, 1))
 
-        for k in range(self.k):
-            empmeans[k] = np.sum(x[z == k], 0)
-
-        means = empmeans + self.prior_means * prior_shrinkage
+        means = sums + self.prior_means * prior_shrinkage
         means /= shrinkage
+        noise = nr.randn(self.k, self.dim) / np.sqrt(shrinkage)
         for k in range(self.k):
-            self.means[k] = generate_normals(\
-                means[k], self.precisions[k] * self.shrinkage[k])
+            # same draw as generate_normals, with precisions[k] * shrinkage[k]
+            means[k] += np.dot(noise[k], inv(cholesky(self.precisions[k])))
+        self.means = means
 
     def update_precisions(self, x, z):
         """
@@ -571,30 +699,36 @@ class BGMM(GMM):
         z array of shape (nb_samples), type = np.int
           the corresponding classification
         """
-        pop = self.pop(z)
-        self.dof = self.prior_dof + pop + 1
-        rpop = pop + (pop == 0)
-        self._detp = np.zeros(self.k)
+        self._update_precisions(label_moments(x, z, self.k))
 
-        for k in range(self.k):
-            # empirical means
-            empmeans = np.sum(x[z == k], 0) / rpop[k]
-            dm = np.reshape(empmeans - self.prior_means[k], (1, self.dim))
+    def _update_precisions(self, moments):
+        """
+        Resample the precisions given the class-wise statistics of the data,
+        as returned by label_moments
 
-            # scatter
-            dx = np.reshape(x[z == k] - empmeans, (pop[k], self.dim))
-            scatter = np.dot(dx.T, dx)
+        The Wishart factors of the draws are kept as the Cholesky cache of
+        the precisions, so that the next likelihood evaluation does not
+        factor them again.
+        """
+        pop, sums, scatter = moments
+        self.dof = self.prior_dof + pop + 1
+        rpop = pop + (pop == 0)
 
-            # bias
-            addcov = np.dot(dm.T, dm) * self.prior_shrinkage[k]
+        # bias of the empirical means with respect to the prior
+        dm = sums / np.reshape(rpop, (self.k, 1)) - self.prior_means
+        addcov = dm[:, :, np.newaxis] * dm[:, np.newaxis]
+        addcov *= np.reshape(self.prior_shrinkage, (self.k, 1, 1))
 
-            # covariance = prior term + scatter + bias
-            covariance = self._inv_prior_scale[k] + scatter + addcov
+        # covariance = prior term + scatter + bias
+        covariance = self._inv_prior_scale + scatter + addcov
 
-            #precision
-            scale = inv(covariance)
-            self.precisions[k] = generate_Wishart(self.dof[k], scale)
-            self._detp[k] = detsh(self.precisions[k])
+        # precision
+        scale = np.reshape([inv(c) for c in covariance],
+                           (self.k, self.dim, self.dim))
+        chol, log_det = generate_Wishart_factors(self.dof, scale)
+        self.precisions = np.einsum('kij,klj->kil', chol, chol)
+        self._detp = np.exp(log_det)
+        self._precision_cache = (self.precisions.copy(), chol, log_det)
 
     def update(self, x, z):
         """
@@ -607,9 +741,10 @@ class BGMM(GMM):
         z array of shape (nb_samples), type = np.int
           the corresponding classification
         """
+        moments = label_moments(x, z, self.k)
         self.update_weights(z)
-        self.update_precisions(x, z)
-        self.update_means(x, z)
+        self._update_precisions(moments)
+        self._update_means(moments)
 
     def sample_indicator(self, like):
         """
@@ -624,10 +759,8 @@ class BGMM(GMM):
         -------
         z: array of shape(nb_samples): a draw of the membership variable
         """
-        tiny = 1 + 1.e-15
-        like = (like.T / like.sum(1)).T
-        like /= tiny
-        z = multinomial(like)
+        with np.errstate(divide='ignore'):
+            z = gumbel_multinomial(np.log(like))
         return z
 
     def sample(self, x, niter=1, mem=0, verbose=0):
@@ -659,8 +792,8 @@ class BGMM(GMM):
         bpz = - np.inf
 
         for i in range(niter):
-            like = self.likelihood(x)
-            sll = np.mean(np.log(np.sum(like, 1)))
+            log_like = self.log_likelihood(x)
+            sll = np.mean(logsumexp(log_like, 1))
             sll += np.log(self.probability_under_prior())
             if sll > score:
                 score = sll
@@ -668,7 +801,7 @@ class BGMM(GMM):
                 best_means = self.means.copy()
                 best_precisions = self.precisions.copy()
 
-            z = self.sample_indicator(like)
+            z = gumbel_multinomial(log_like)
             if mem:
                 possibleZ[:, i] = z
             puz = sll # to save time
@@ -714,8 +847,7 @@ class BGMM(GMM):
         ameans = np.zeros(np.shape(self.means))
 
         for i in range(niter):
-            like = self.likelihood(x)
-            z = self.sample_indicator(like)
+            z = gumbel_multinomial(self.log_likelihood(x))
             self.update(x, z)
             aprec += self.precisions
             aweights += self.weights
@@ -898,29 +1030,39 @@ class VBGMM(BGMM):
         like: array of shape(nb_samples,self.k),
               component-wise likelihood
         """
-        n = x.shape[0]
-        like = np.zeros((n, self.k))
-        from scipy.special import psi
+        return np.exp(self.log_likelihood(x))
 
-        spsi = psi(np.sum(self.weights))
-        for k in range(self.k):
-            # compute the data-independent factor first
-            w0 = psi(self.weights[k]) - spsi
-            w0 += 0.5 * np.log(detsh(self.scale[k]))
-            w0 -= self.dim * 0.5 / self.shrinkage[k]
-            w0 += 0.5 * np.log(2) * self.dim
-            for i in range(self.dim):
-                w0 += 0.5 * psi((self.dof[k] - i) / 2)
-            m = np.reshape(self.means[k], (1, self.dim))
-            b = self.dof[k] * self.scale[k]
-            q = np.sum(np.dot(m - x, b) * (m - x), 1)
-            w = w0 - q / 2
-            w -= 0.5 * np.log(2 * np.pi) * self.dim
-            like[:, k] = np.exp(w)
-
-        if like.min() < 0:
-            raise ValueError('Likelihood cannot be negative')
-        return like
+    def log_likelihood(self, x):
+        """VB-E step, in the log domain
+
+        Parameters
+        ----------
+        x array of shape (nb_samples,dim)
+          the data used in the estimation process
+
+        Returns
+        -------
+        log_like: array of shape(nb_samples,self.k),
+                  component-wise log-likelihood
+        """
+        from scipy.special import psi
+        chol, log_det_scale = precision_cholesky(self.scale)
+        # factors of the expected precisions self.dof * self.scale
+        chol *= np.sqrt(self.dof)[:, np.newaxis, np.newaxis]
+        log_det = log_det_scale + self.dim * np.log(self.dof)
+
+        # the data-independent factor
+        w0 = psi(self.weights) - psi(np.sum(self.weights))
+        w0 += 0.5 * log_det_scale
+        w0 -= self.dim * 0.5 / self.shrinkage
+        w0 += 0.5 * np.log(2) * self.dim
+        for i in range(self.dim):
+            w0 += 0.5 * psi((self.dof - i) / 2)
+        # gaussian_log_densities includes 0.5 * log_det, which is not
+        # part of the VB expectation
+        w0 -= 0.5 * log_det
+        return gaussian_log_densities(np.asarray(x, dtype=np.double),
+                                      self.means, chol, log_det) + w0
 
     def evidence(self, x, like=None, verbose=0):
         """computation of evidence bound aka free energy
@@ -942,8 +1084,7 @@ class VBGMM(BGMM):
         from numpy.linalg import inv
         tiny = 1.e-15
         if like is None:
-            like = self._Estep(x)
-            like = (like.T / np.maximum(like.sum(1), tiny)).T
+            like, _ = self.responsibilities(x)
 
         pop = like.sum(0)[:self.k]
         pop = np.reshape(pop, (self.k, 1))
@@ -998,14 +1139,21 @@ class VBGMM(BGMM):
         like: array of shape(nb_samples, self.k)
            the likelihood of the data under each class
         """
+        self._Mstep_from_moments(self._moments(x, like[:, :self.k]))
+
+    def _Mstep_from_moments(self, moments):
+        """VB-M step, given the sufficient statistics of the data
+
+        Parameters
+        ----------
+        moments: tuple (pop, means, scatter),
+                 as returned by nipy.algorithms.clustering.gmm.weighted_moments
+        """
         from numpy.linalg import inv
-        tiny = 1.e-15
-        pop = like.sum(0)
+        pop, empmeans, empcov = moments
 
         # shrinkage, weights,dof
         self.weights = self.prior_weights + pop
-        pop = pop[0:self.k]
-        like = like[:, :self.k]
         self.shrinkage = self.prior_shrinkage + pop
         self.dof = self.prior_dof + pop
 
@@ -1015,17 +1163,11 @@ class VBGMM(BGMM):
         shrinkage = np.reshape(self.shrinkage, (self.k, 1))
 
         # means
-        means = np.dot(like.T, x) + self.prior_means * prior_shrinkage
+        means = pop * empmeans + self.prior_means * prior_shrinkage
         self.means = means / shrinkage
 
         #precisions
-        empmeans = np.dot(like.T, x) / np.maximum(pop, tiny)
-        empcov = np.zeros(np.shape(self.prior_scale))
-        for k in range(self.k):
-            dx = x - empmeans[k]
-            empcov[k] = np.dot(dx.T, like[:, k:k + 1] * dx)
-            covariance = np.array(self._inv_prior_scale) + empcov
-
+        covariance = np.array(self._inv_prior_scale) + empcov
         dx = np.reshape(empmeans - self.prior_means, (self.k, self.dim, 1))
         addcov = np.array([np.dot(dx[k], dx[k].T) for k in range(self.k)])
         apms = np.reshape(prior_shrinkage * pop / shrinkage, (self.k, 1, 1))
@@ -1069,7 +1211,7 @@ class VBGMM(BGMM):
            of the rows of x
         """
         if like is None:
-            like = self.likelihood(x)
+            like = self.log_likelihood(x)
         z = np.argmax(like, 1)
         return z
 
@@ -1089,11 +1231,10 @@ class VBGMM(BGMM):
                 verbosity mode
         """
         # alternation of E/M step until convergence
-        tiny = 1.e-15
         av_ll_old = - np.inf
         for i in range(niter):
-            like = self._Estep(x)
-            av_ll = np.mean(np.log(np.maximum(np.sum(like, 1), tiny)))
+            like, log_norm = self.responsibilities(x)
+            av_ll = np.mean(log_norm)
             if av_ll < av_ll_old + delta:
                 if verbose:
                     print('iteration:', i, 'log-likelihood:', av_ll,
@@ -1102,8 +1243,7 @@ class VBGMM(BGMM):
             else:
                 av_ll_old = av_ll
             if verbose:
-                print(i, av_ll, self.bic(like))
-            like = (like.T / np.maximum(like.sum(1), tiny)).T
+                print(i, av_ll, self._bic_from_log_like(log_norm))
             self._Mstep(x, like)
 
     def likelihood(self, x):
@@ -12,7 +12,122 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import numpy as np
-from scipy.linalg import eigvalsh
+from scipy.linalg import eigh
+
+from nipy.utils.parallel import parallel_map, random_seeds, local_random_state
+
+
+def logsumexp(a, axis=None):
+    """ Compute log(sum(exp(a), axis)) in a numerically stable way
+
+    Parameters
+    ----------
+    a: array,
+       the input values, typically log-likelihoods
+    axis: int, optional,
+          the axis along which the sum is performed
+
+    Returns
+    -------
+    res: array, the log of the sum of exponentials along axis
+    """
+    a = np.asarray(a)
+    if axis is None:
+        a, axis = a.ravel(), 0
+    amax = np.expand_dims(np.max(a, axis), axis)
+    amax[~ np.isfinite(amax)] = 0
+    with np.errstate(divide='ignore'):
+        res = np.log(np.sum(np.exp(a - amax), axis))
+    return res + np.squeeze(amax, axis)
+
+
+def precision_cholesky(precisions):
+    """ Cholesky factorization of a set of precision matrices
+
+    Parameters
+    ----------
+    precisions: array of shape (k, dim, dim)
+                symmetric positive definite matrices
+
+    Returns
+    -------
+    chol: array of shape (k, dim, dim),
+          lower triangular factors such that
+          precisions[j] = np.dot(chol[j], chol[j].T)
+    log_det: array of shape (k),
+             the log-determinants of the precision matrices
+
+    Notes
+    -----
+    Matrices that are not numerically positive definite are factored
+    through their eigenvalue decomposition, negative eigenvalues being
+    clipped to zero; their log-determinant is then -np.inf.
+    """
+    precisions = np.asarray(precisions, dtype=np.double)
+    chol = np.empty_like(precisions)
+    log_det = np.empty(precisions.shape[0])
+    for k, prec in enumerate(precisions):
+        try:
+            chol[k] = np.linalg.cholesky(prec)
+            log_det[k] = 2 * np.sum(np.log(np.diag(chol[k])))
+        except np.linalg.LinAlgError:
+            w, v = eigh(prec)
+            w = np.maximum(w, 0)
+            chol[k] = v * np.sqrt(w)
+            with np.errstate(divide='ignore'):
+                log_det[k] = np.sum(np.log(w))
+    return chol, log_det
+
+
+def gaussian_log_densities(x, means, chol, log_det, chunk_size=None):
+    """ Log-densities of the rows of x under a set of Gaussian distributions
+
+    Parameters
+    ----------
+    x: array of shape (n_samples, dim)
+       the data
+    means: array of shape (k, dim)
+           the means of the Gaussians
+    chol: array of shape (k, dim, dim) or (k, dim)
+          Cholesky factors of the precision matrices,
+          as returned by precision_cholesky, or square roots of the
+          diagonal precisions
+    log_det: array of shape (k),
+             log-determinants of the precision matrices
+    chunk_size: int, optional,
+                number of samples processed at once; by default it is chosen
+                so that the (chunk_size, k * dim) temporary stays small
+
+    Returns
+    -------
+    log_dens: array of shape (n_samples, k)
+    """
+    n, dim = x.shape
+    k = means.shape[0]
+    log_dens = np.empty((n, k))
+    if k == 0:
+        return log_dens
+    const = 0.5 * (log_det - dim * np.log(2 * np.pi))
+    if chol.ndim == 2:
+        # diagonal precisions: chol holds the square root of the diagonal
+        prec = chol ** 2
+        mp = means * prec
+        mpm = np.sum(mp * means, 1)
+        q = np.dot(x ** 2, prec.T) - 2 * np.dot(x, mp.T) + mpm
+        log_dens[:] = const - 0.5 * q
+        return log_dens
+
+    # the whitened data (x - m_j) L_j for all j, with one matrix product
+    chol_cat = np.transpose(chol, (1, 0, 2)).reshape(dim, k * dim)
+    mchol = np.einsum('kd,kde->ke', means, chol).ravel()
+    if chunk_size is None:
+        chunk_size = max(2 ** 20 // (k * dim), 1)
+    for start in range(0, n, chunk_size):
+        y = np.dot(x[start: start + chunk_size], chol_cat) - mchol
+        y **= 2
+        q = y.reshape(-1, k, dim).sum(2)
+        log_dens[start: start + chunk_size] = const - 0.5 * q
+    return log_dens
 
 
 class GridDescriptor(object):
@@ -100,8 +215,126 @@ class GridDescriptor(object):
         return grid
 
 
+def weighted_moments(x, resp, full=True, tiny=1.e-15):
+    """ Per-component sufficient statistics of weighted data
+
+    Parameters
+    ----------
+    x: array of shape (n_samples, dim)
+       the data
+    resp: array of shape (n_samples, k)
+          the non-negative weight of each sample in each component
+    full: bool, optional,
+          whether full scatter matrices or only their diagonal are computed
+    tiny: float, optional,
+          a small constant to avoid numerical singularities
+
+    Returns
+    -------
+    moments: tuple (pop, means, scatter), where
+        pop: array of shape (k), the total weight of each component
+        means: array of shape (k, dim), the weighted means
+        scatter: array of shape (k, dim, dim) if full else (k, dim),
+                 the weighted sum of squared deviations from the means
+    """
+    k = resp.shape[1]
+    pop = np.sum(resp, 0)
+    means = np.dot(resp.T, x) / np.reshape(np.maximum(pop, tiny), (k, 1))
+    if full:
+        scatter = np.zeros((k, x.shape[1], x.shape[1]))
+    else:
+        scatter = np.zeros((k, x.shape[1]))
+    for j in range(k):
+        dx = x - means[j]
+        if full:
+            scatter[j] = np.dot(dx.T, resp[:, j:j + 1] * dx)
+        else:
+            scatter[j] = np.sum(dx ** 2 * resp[:, j:j + 1], 0)
+    return pop, means, scatter
+
+
+def merge_moments(moments1, moments2, tiny=1.e-15):
+    """ Combine the statistics returned by weighted_moments on two datasets
+
+    The result is the same as the statistics of the concatenated data,
+    but it is computed without the data, in a numerically stable way
+    (Chan et al., 1979).
+
+    Parameters
+    ----------
+    moments1, moments2: tuples (pop, means, scatter),
+                        as returned by weighted_moments
+    tiny: float, optional,
+          a small constant to avoid numerical singularities
+
+    Returns
+    -------
+    moments: tuple (pop, means, scatter)
+    """
+    if moments1 is None:
+        return moments2
+    pop1, means1, scatter1 = moments1
+    pop2, means2, scatter2 = moments2
+    pop = pop1 + pop2
+    ratio = (pop2 / np.maximum(pop, tiny))[:, np.newaxis]
+    delta = means2 - means1
+    means = means1 + delta * ratio
+    factor = pop1 * pop2 / np.maximum(pop, tiny)
+    if scatter1.ndim == 3:
+        dd = delta[:, :, np.newaxis] * delta[:, np.newaxis, :]
+        scatter = scatter1 + scatter2 + dd * factor[:, np.newaxis, np.newaxis]
+    else:
+        scatter = scatter1 + scatter2 + delta ** 2 * factor[:, np.newaxis]
+    return pop, means, scatter
+
+
+def iter_chunks(data, chunk_size=10000):
+    """ Iterate over the data by chunks of samples
+
+    Parameters
+    ----------
+    data: array of shape (n_samples, dim), or callable,
+          the data: either an array, possibly a memory-mapped one,
+          that is read by blocks of chunk_size rows, or a function that
+          returns a new iterable over chunks of shape (n_i, dim) each time
+          it is called, e.g. a generator function
+    chunk_size: int, optional,
+                number of rows per chunk when data is an array
+
+    Returns
+    -------
+    chunks: iterator over arrays of shape (n_i, dim)
+    """
+    if callable(data):
+        for chunk in data():
+            chunk = np.asarray(chunk, dtype=np.double)
+            if chunk.ndim == 1:
+                chunk = np.reshape(chunk, (chunk.size, 1))
+            yield chunk
+        return
+    for start in range(0, data.shape[0], chunk_size):
+        chunk = np.asarray(data[start: start + chunk_size], dtype=np.double)
+        if chunk.ndim == 1:
+            chunk = np.reshape(chunk, (chunk.size, 1))
+        yield chunk
+
+
+def _fit_gmm(args):
+    """ Initialize and estimate one GMM, as a picklable task
+
+    Returns the estimated GMM and the bic value returned by its estimate
+    method.
+    """
+    x, k, prec_type, niter, delta, seed = args
+    with local_random_state(seed):
+        lgmm = GMM(k, x.shape[1], prec_type)
+        lgmm.initialize(x)
+        bic = lgmm.estimate(x, niter=niter, delta=delta, verbose=0)
+    return lgmm, bic
+
+
 def best_fitting_GMM(x, krange, prec_type='full', niter=100, delta=1.e-4,
-                     ninit=1, verbose=0):
+                     ninit=1, verbose=0, n_jobs=1):
     """
     Given a certain dataset x, find the best-fitting GMM
     with a number k of classes in a certain range defined by krange
@@ -121,6 +354,10 @@ def best_fitting_GMM(x, krange, prec_type='full', niter=100, delta=1.e-4,
     ninit: int
            number of initialization performed
     verbose=0: verbosity mode
+    n_jobs: int, optional,
+            number of processes over which the (k, initialization) pairs
+            are distributed; -1 means all the CPUs.
+            The result does not depend on n_jobs.
 
     Returns
     -------
@@ -129,12 +366,19 @@ def best_fitting_GMM(x, krange, prec_type='full', niter=100, delta=1.e-4,
     if np.size(x) == x.shape[0]:
         x = np.reshape(x, (np.size(x), 1))
 
-    dim = x.shape[1]
+    krange = list(krange)
+    tasks = [(k, seed) for k in krange for seed in random_seeds(ninit)]
+    fits = parallel_map(
+        _fit_gmm, [(x, k, prec_type, niter, delta, seed)
+                   for (k, seed) in tasks], n_jobs)
+
     bestbic = - np.inf
-    for k in krange:
-        lgmm = GMM(k, dim, prec_type)
-        gmmk = lgmm.initialize_and_estimate(x, None, niter, delta, ninit,
-                                            verbose)
+    for i, k in enumerate(krange):
+        # best initialization for this k, as in initialize_and_estimate
+        gmmk, bestinit = None, - np.inf
+        for lgmm, bic in fits[i * ninit: (i + 1) * ninit]:
+            if gmmk is None or bic > bestinit:
+                gmmk, bestinit = lgmm, bic
         bic = gmmk.evidence(x)
         if bic > bestbic:
             bestbic = bic
@@ -417,6 +661,97 @@ class GMM(object):
         like *= self.weights
         return like
 
+    def _precision_factors(self):
+        """ Cholesky factors and log-determinants of the precisions
+
+        The factorization is cached and only recomputed when
+        self.precisions has changed.
+
+        Returns
+        -------
+        chol: array of shape (self.k, self.dim, self.dim)
+              or (self.k, self.dim) if self.prec_type == 'diag'
+        log_det: array of shape (self.k)
+        """
+        cache = getattr(self, '_precision_cache', None)
+        if cache is not None and cache[0].shape == self.precisions.shape \
+                and np.array_equal(cache[0], self.precisions):
+            return cache[1], cache[2]
+        precisions = np.array(self.precisions, dtype=np.double)
+        if self.prec_type == 'full':
+            chol, log_det = precision_cholesky(precisions)
+        else:
+            chol = np.sqrt(precisions)
+            log_det = np.sum(np.log(precisions), 1)
+        self._precision_cache = (precisions, chol, log_det)
+        return chol, log_det
+
+    def unweighted_log_likelihood(self, x):
+        """
+        return the log-likelihood of each data for each component
+        the values are not weighted by the component weights
+
+        Parameters
+        ----------
+        x: array of shape (n_samples,self.dim)
+           the data used in the estimation process
+
+        Returns
+        -------
+        log_like, array of shape(n_samples,self.k)
+          unweighted component-wise log-likelihood
+
+        Notes
+        -----
+        All the components are handled at once, using the cached
+        Cholesky factors of the precisions
+        """
+        chol, log_det = self._precision_factors()
+        return gaussian_log_densities(np.asarray(x, dtype=np.double),
+                                      np.asarray(self.means), chol, log_det)
+
+    def log_likelihood(self, x):
+        """
+        return the log-likelihood of the model for the data x
+        the values are weighted by the components weights
+
+        Parameters
+        ----------
+        x array of shape (n_samples,self.dim)
+           the data used in the estimation process
+
+        Returns
+        -------
+        log_like, array of shape(n_samples,self.k)
+          component-wise log-likelihood
+        """
+        log_like = self.unweighted_log_likelihood(x)
+        with np.errstate(divide='ignore'):
+            log_like += np.log(self.weights)
+        return log_like
+
+    def responsibilities(self, x):
+        """
+        return the posterior probability of each component for the data x,
+        computed in the log domain
+
+        Parameters
+        ----------
+        x array of shape (n_samples,self.dim)
+           the data used in the estimation process
+
+        Returns
+        -------
+        resp: array of shape(n_samples,self.k)
+              the normalized responsibilities
+        log_norm: array of shape(n_samples)
+              the log-likelihood of the mixture for each sample
+        """
+        log_like = self.log_likelihood(x)
+        log_norm = logsumexp(log_like, 1)
+        log_like -= log_norm[:, np.newaxis]
+        return np.exp(log_like), log_norm
+
     def unweighted_likelihood_(self, x):
         """
         return the likelihood of each data for each component
@@ -432,25 +767,7 @@ class GMM(object):
         like, array of shape(n_samples,self.k)
           unweighted component-wise likelihood
         """
-        n = x.shape[0]
-        like = np.zeros((n, self.k))
-
-        for k in range(self.k):
-            # compute the data-independent factor first
-            w = - np.log(2 * np.pi) * self.dim
-            m = np.reshape(self.means[k], (1, self.dim))
-            b = self.precisions[k]
-            if self.prec_type == 'full':
-                w += np.log(eigvalsh(b)).sum()
-                dx = m - x
-                q = np.sum(np.dot(dx, b) * dx, 1)
-            else:
-                w += np.sum(np.log(b))
-                q = np.dot((m - x) ** 2, b)
-            w -= q
-            w /= 2
-            like[:, k] = np.exp(w)
-        return like
+        return self.unweighted_likelihood(x)
 
     def unweighted_likelihood(self, x):
         """
@@ -469,31 +786,10 @@ class GMM(object):
 
         Notes
         -----
-        Hopefully faster
+        This is the exponential of self.unweighted_log_likelihood(x), which
+        should be preferred when the values may underflow
         """
-        xt = x.T.copy()
-        n = x.shape[0]
-        like = np.zeros((n, self.k))
-
-        for k in range(self.k):
-            # compute the data-independent factor first
-            w = - np.log(2 * np.pi) * self.dim
-            m = np.reshape(self.means[k], (self.dim, 1))
-            b = self.precisions[k]
-            if self.prec_type == 'full':
-                w += np.log(eigvalsh(b)).sum()
-                dx = xt - m
-                sqx = dx * np.dot(b, dx)
-                q = np.zeros(n)
-                for d in range(self.dim):
-                    q += sqx[d]
-            else:
-                w += np.sum(np.log(b))
-                q = np.dot(b, (m - xt) ** 2)
-            w -= q
-            w /= 2
-            like[:, k] = np.exp(w)
-        return like
+        return np.exp(self.unweighted_log_likelihood(x))
 
     def mixture_likelihood(self, x):
         """Returns the likelihood of the mixture for x
@@ -504,9 +800,7 @@ class GMM(object):
            the data used in the estimation process
         """
         x = self.check_x(x)
-        like = self.likelihood(x)
-        sl = np.sum(like, 1)
-        return sl
+        return np.exp(logsumexp(self.log_likelihood(x), 1))
 
     def average_log_like(self, x, tiny=1.e-15):
         """returns the averaged log-likelihood of the mode for the dataset x
@@ -518,10 +812,8 @@ class GMM(object):
         tiny = 1.e-15: a small constant to avoid numerical singularities
         """
         x = self.check_x(x)
-        like = self.likelihood(x)
-        sl = np.sum(like, 1)
-        sl = np.maximum(sl, tiny)
-        return np.mean(np.log(sl))
+        log_like = logsumexp(self.log_likelihood(x), 1)
+        return np.mean(np.maximum(log_like, np.log(tiny)))
 
     def evidence(self, x):
         """Computation of bic approximation of evidence
@@ -536,9 +828,8 @@ class GMM(object):
         the bic value
         """
         x = self.check_x(x)
-        tiny = 1.e-15
-        like = self.likelihood(x)
-        return self.bic(like, tiny)
+        log_norm = logsumexp(self.log_likelihood(x), 1)
+        return self._bic_from_log_like(log_norm)
 
     def bic(self, like, tiny=1.e-15):
         """Computation of bic approximation of evidence
@@ -555,10 +846,29 @@ class GMM(object):
         """
         sl = np.sum(like, 1)
         sl = np.maximum(sl, tiny)
-        bicc = np.sum(np.log(sl))
+        return self._bic_from_log_like(np.log(sl))
+
+    def _bic_from_log_like(self, log_norm, n_samples=None):
+        """Computation of bic from the log-likelihood of the samples
+
+        Parameters
+        ----------
+        log_norm, array of shape (n_samples), or float
+           the log-likelihood of the mixture for each sample,
+           or its sum over the samples
+        n_samples: int, optional,
+           the number of samples, required if log_norm is a sum
+
+        Returns
+        -------
+        the bic value, float
+        """
+        bicc = np.sum(log_norm)
 
         # number of parameters
-        n = like.shape[0]
+        n = n_samples
+        if n is None:
+            n = log_norm.shape[0]
         if self.prec_type == 'full':
             eta = self.k * (1 + self.dim + (self.dim * self.dim + 1) / 2) - 1
         else:
@@ -594,17 +904,25 @@ class GMM(object):
         x array of shape (n_samples,dim)
           the data used in the estimation process
         """
-        small = 0.01
-        # the mean of the data
-        mx = np.reshape(x.mean(0), (1, self.dim))
+        mx = x.mean(0)
+        self._guess_priors_from_moments(mx, np.mean((x - mx) ** 2, 0), bcheck)
+
+    def _guess_priors_from_moments(self, mx, vx, bcheck=1):
+        """
+        Set the regularizing priors given the mean and the variance of the
+        data in each dimension, see guess_regularizing
 
-        dx = x - mx
-        vx = np.dot(dx.T, dx) / x.shape[0]
+        Parameters
+        ----------
+        mx: array of shape (dim), the mean of the data
+        vx: array of shape (dim), the variance of the data
+        """
+        small = 0.01
+        mx = np.reshape(mx, (1, self.dim))
         if self.prec_type == 'full':
-            px = np.reshape(np.diag(1.0 / np.diag(vx)),
-                            (1, self.dim, self.dim))
+            px = np.reshape(np.diag(1.0 / vx), (1, self.dim, self.dim))
         else:
-            px = np.reshape(1.0 / np.diag(vx), (1, self.dim))
+            px = np.reshape(1.0 / vx, (1, self.dim))
         px *= np.exp(2.0 / self.dim * np.log(self.k))
         self.prior_means = np.repeat(mx, self.k, 0)
         self.prior_weights = np.ones(self.k) / self.k
@@ -627,11 +945,39 @@ class GMM(object):
         like: array of shape(n_samples,self.k)
            the likelihood of the data under each class
         """
-        from numpy.linalg import pinv
         tiny = 1.e-15
-        pop = self.pop(like)
         sl = np.maximum(tiny, np.sum(like, 1))
         like = (like.T / sl).T
+        self._Mstep_from_moments(self._moments(x, like))
+
+    def _moments(self, x, resp):
+        """ Sufficient statistics of x for the M step
+
+        Parameters
+        ----------
+        x: array of shape(n_samples,self.dim)
+           the data from which the model is estimated
+        resp: array of shape(n_samples,self.k)
+           the normalized responsibilities of the components
+
+        Returns
+        -------
+        moments: tuple (pop, means, scatter), see weighted_moments
+        """
+        return weighted_moments(x, resp, self.prec_type == 'full')
+
+    def _Mstep_from_moments(self, moments):
+        """
+        M step regularized according to the procedure of
+        Fraley et al. 2007, given the sufficient statistics of the data
+
+        Parameters
+        ----------
+        moments: tuple (pop, means, scatter),
+                 as returned by weighted_moments
+        """
+        from numpy.linalg import pinv
+        pop, empmeans, empcov = moments
 
         # shrinkage,weights,dof
         self.weights = self.prior_weights + pop
@@ -643,17 +989,11 @@ class GMM(object):
         shrinkage = pop + prior_shrinkage
 
         # means
-        means = np.dot(like.T, x) + self.prior_means * prior_shrinkage
+        means = pop * empmeans + self.prior_means * prior_shrinkage
         self.means = means / shrinkage
 
         #precisions
-        empmeans = np.dot(like.T, x) / np.maximum(pop, tiny)
-        empcov = np.zeros(np.shape(self.precisions))
-
         if self.prec_type == 'full':
-            for k in range(self.k):
-                dx = x - empmeans[k]
-                empcov[k] = np.dot(dx.T, like[:, k:k + 1] * dx)
             #covariance
             covariance = np.array([pinv(self.prior_scale[k])
                                    for k in range(self.k)])
@@ -670,9 +1010,6 @@ class GMM(object):
             self.precisions = np.array([pinv(covariance[k]) \
                                        for k in range(self.k)])
         else:
-            for k in range(self.k):
-                dx = x - empmeans[k]
-                empcov[k] = np.sum(dx ** 2 * like[:, k:k + 1], 0)
             # covariance
             covariance = np.array([1.0 / self.prior_scale[k]
                                    for k in range(self.k)])
@@ -705,7 +1042,7 @@ class GMM(object):
            of the rows of x
         """
         if like is None:
-            like = self.likelihood(x)
+            like = self.log_likelihood(x)
         z = np.argmax(like, 1)
         return z
 
@@ -724,16 +1061,20 @@ class GMM(object):
         Returns
         -------
         bic : an asymptotic approximation of model evidence
+
+        Notes
+        -----
+        The E step is performed in the log domain, so that the
+        responsibilities do not underflow in high dimension
         """
         # check that the data is OK
         x = self.check_x(x)
 
         # alternation of E/M step until convergence
-        tiny = 1.e-15
         av_ll_old = - np.inf
         for i in range(niter):
-            l = self._Estep(x)
-            av_ll = np.mean(np.log(np.maximum(np.sum(l, 1), tiny)))
+            resp, log_norm = self.responsibilities(x)
+            av_ll = np.mean(log_norm)
             if av_ll < av_ll_old + delta:
                 if verbose:
                     print('iteration:', i, 'log-likelihood:', av_ll,
@@ -742,10 +1083,10 @@ class GMM(object):
             else:
                 av_ll_old = av_ll
             if verbose:
-                print(i, av_ll, self.bic(l))
-            self._Mstep(x, l)
+                print(i, av_ll, self._bic_from_log_like(log_norm))
+            self._Mstep(x, resp)
 
-        return self.bic(l)
+        return self._bic_from_log_like(log_norm)
 
     def initialize_and_estimate(self, x, z=None, niter=100, delta=1.e-4,\
                                 ninit=1, verbose=0):
@@ -789,6 +1130,108 @@ class GMM(object):
         """
         return self.initialize_and_estimate(x, z, niter, delta, ninit, verbose)
 
+    def initialize_streaming(self, data, chunk_size=10000):
+        """Initializes self from data that is read by chunks:
+        1. sets the regularizing hyper-parameters from the moments
+           of all the data, computed in one pass
+        2. initializes the memberships of the first chunk
+           using a k-means algorithm, then
+        3. upate the parameters
+
+        Parameters
+        ----------
+        data: array of shape (n_samples, self.dim) or callable,
+              the data, see iter_chunks
+        chunk_size: int, optional,
+                    number of rows per chunk when data is an array
+        """
+        from .utils import kmeans
+
+        # 1. moments of the data, merged across chunks
+        moments, first = None, None
+        for x in iter_chunks(data, chunk_size):
+            x = self.check_x(x)
+            if first is None:
+                first = x
+            moments = merge_moments(
+                moments, weighted_moments(x, np.ones((x.shape[0], 1)), False))
+        if first is None:
+            raise ValueError('no data to initialize the model')
+        pop, mx, scatter = moments
+        self._guess_priors_from_moments(mx[0], scatter[0] / pop[0])
+
+        # 2. initialize the memberships
+        n = first.shape[0]
+        if self.k > 1:
+            _, z, _ = kmeans(first, self.k)
+        else:
+            z = np.zeros(n).astype(np.int)
+        l = np.zeros((n, self.k))
+        l[np.arange(n), z] = 1
+
+        # 3.update the parameters
+        self._Mstep(first, l)
+
+    def estimate_streaming(self, data, chunk_size=10000, niter=100,
+                           delta=1.e-4, warm_start=False, verbose=0):
+        """ Estimation of the model from data that is read by chunks
+
+        Each EM iteration makes one pass over the data, accumulating the
+        sufficient statistics (counts, means and scatter matrices) of the
+        components across chunks, so that the data never needs to be held
+        in memory at once. The result is the same as that of estimate
+        on the concatenated data.
+
+        Parameters
+        ----------
+        data: array of shape (n_samples, self.dim) or callable,
+              the data: either an array, typically a memory-mapped one,
+              or a function returning a new iterable over chunks of data
+              each time it is called, since several passes are performed.
+              See iter_chunks
+        chunk_size: int, optional,
+                    number of rows per chunk when data is an array
+        niter: int, optional,
+               maximal number of iterations in the estimation process
+        delta: float, optional,
+               increment of data likelihood at which convergence is declared
+        warm_start: bool, optional,
+                    if True, the iterations start from the current
+                    parameters of the model, e.g. those of a previous fit;
+                    otherwise the model is first initialized with
+                    initialize_streaming
+        verbose: verbosity mode, optional
+
+        Returns
+        -------
+        bic : an asymptotic approximation of model evidence
+        """
+        if not warm_start:
+            self.initialize_streaming(data, chunk_size)
+
+        av_ll_old = - np.inf
+        for i in range(niter):
+            moments, ll, n = None, 0, 0
+            for x in iter_chunks(data, chunk_size):
+                x = self.check_x(x)
+                resp, log_norm = self.responsibilities(x)
+                ll += np.sum(log_norm)
+                n += x.shape[0]
+                moments = merge_moments(moments, self._moments(x, resp))
+            av_ll = ll / n
+            if av_ll < av_ll_old + delta:
+                if verbose:
+                    print('iteration:', i, 'log-likelihood:', av_ll,
+                          'old value:', av_ll_old)
+                break
+            else:
+                av_ll_old = av_ll
+            if verbose:
+                print(i, av_ll, self._bic_from_log_like(ll, n))
+            self._Mstep_from_moments(moments)
+
+        return self._bic_from_log_like(ll, n)
+
     def test(self, x, tiny=1.e-15):
         """Returns the log-likelihood of the mixture for x
 
@@ -802,7 +1245,8 @@ class GMM(object):
         ll: array of shape(n_samples)
             the log-likelihood of the rows of x
         """
-        return np.log(np.maximum(self.mixture_likelihood(x), tiny))
+        x = self.check_x(x)
+        return np.maximum(logsumexp(self.log_likelihood(x), 1), np.log(tiny))
 
     def show_components(self, x, gd, density=None, mpaxes=None):
         """Function to plot a GMM -- Currently, works only in 1D
@@ -27,6 +27,7 @@ from __future__ import division
 # ------ Routines for Agglomerative Hierarchical Clustering ----------------
 # --------------------------------------------------------------------------
 
+import heapq
 import numpy as np
 from warnings import warn
 
@@ -324,41 +325,77 @@ def average_link_graph(G):
     warn('Function average_link_graph deprecated, will be removed',
          FutureWarning,
          stacklevel=2)
-    # prepare a graph with twice the number of vertices
     n = G.V
     nbcc = G.cc().max() + 1
-    K = WeightedGraph(2 * G.V)
-    K.E = G.E
-    K.edges = G.edges.copy()
-    K.weights = G.weights.copy()
-
     parent = np.arange(2 * n - nbcc, dtype=np.int)
     pop = np.ones(2 * n - nbcc, np.int)
     height = np.inf * np.ones(2 * n - nbcc)
 
+    # out_[a][b] and in_[a][b] hold the similarity of the edges a->b and
+    # b->a respectively, together with the position of the edge in G.edges,
+    # which breaks ties between equally heavy edges.
+    # best[a] is the key of the heaviest edge leaving a; the heap holds at
+    # least this edge for each active cluster, and entries that involve
+    # a merged cluster are skipped when popped
+    out_ = [{} for _ in range(2 * n - nbcc)]
+    in_ = [{} for _ in range(2 * n - nbcc)]
+    if G.E > 0:
+        for e, (a, b, w) in enumerate(zip(G.edges[:, 0].tolist(),
+                                          G.edges[:, 1].tolist(),
+                                          G.weights.tolist())):
+            if a != b:
+                out_[a][b] = (w, e)
+                in_[b][a] = (w, e)
+    best = [None] * (2 * n - nbcc)
+    heap = []
+    for a in range(n):
+        if out_[a]:
+            best[a] = _heaviest_edge(a, out_[a])
+            heap.append(best[a])
+    heapq.heapify(heap)
+    active = [True] * (2 * n - nbcc)
+
     # iteratively merge clusters
     for q in range(n - nbcc):
 
         # 1. find the heaviest edge
-        m = (K.weights).argmax()
-        cost = K.weights[m]
+        key = heapq.heappop(heap)
+        while not (active[key[2]] and active[key[3]]):
+            key = heapq.heappop(heap)
+        cost, _, i, j = key
+        cost = - cost
         k = q + n
         height[k] = cost
-        i = K.edges[m, 0]
-        j = K.edges[m, 1]
 
-        # 2. remove the current edge
-        K.edges[m] = -1
-        K.weights[m] = - np.inf
-        m = np.nonzero((K.edges[:, 0] == j) * (K.edges[:, 1] == i))[0]
-        K.edges[m] = - 1
-        K.weights[m] = - np.inf
-
-        # 3. merge the edges with third part edges
+        # 2. merge the clusters, averaging the similarities of the
+        # third-party edges
         parent[i] = k
         parent[j] = k
         pop[k] = pop[i] + pop[j]
-        fusion(K, pop, i, j, k)
+        active[i] = False
+        active[j] = False
+        fi = float(pop[i]) / (pop[k])
+        fj = 1.0 - fi
+        out_[k] = _average_edges(out_[i], out_[j], fi, fj, (i, j))
+        in_[k] = _average_edges(in_[i], in_[j], fi, fj, (i, j))
+        out_[i] = out_[j] = in_[i] = in_[j] = None
+        for l, we in in_[k].items():
+            out_[l].pop(i, None)
+            out_[l].pop(j, None)
+            out_[l][k] = we
+            if best[l][3] == i or best[l][3] == j:
+                best[l] = _heaviest_edge(l, out_[l])
+                heapq.heappush(heap, best[l])
+            elif (- we[0], we[1]) < best[l][:2]:
+                best[l] = (- we[0], we[1], l, k)
+                heapq.heappush(heap, best[l])
+        for l, we in out_[k].items():
+            in_[l].pop(i, None)
+            in_[l].pop(j, None)
+            in_[l][k] = we
+        if out_[k]:
+            best[k] = _heaviest_edge(k, out_[k])
+            heapq.heappush(heap, best[k])
 
     height[height < 0] = 0
     height[np.isinf(height)] = height[n] + 1
@@ -366,6 +403,44 @@ def average_link_graph(G):
     return t
 
 
+def _heaviest_edge(a, edges):
+    """ Return the heap key (-weight, position, a, b) of the heaviest edge
+    in edges, a dict that maps b to the (weight, position) of edge a->b
+    """
+    b = min(edges, key=lambda b: (- edges[b][0], edges[b][1]))
+    return (- edges[b][0], edges[b][1], a, b)
+
+
+def _average_edges(edges_i, edges_j, fi, fj, merged):
+    """ Weighted average of the edges of two clusters i and j, as in fusion
+
+    Parameters
+    ----------
+    edges_i, edges_j: dicts that map the neighbours of i and j to the
+                      (weight, position) of the corresponding edges
+    fi, fj: float, the relative weights of i and j
+    merged: the pair (i, j), excluded from the result
+
+    Returns
+    -------
+    edges_k: dict that maps the neighbours of the merged cluster to the
+             (weight, position) of the corresponding edges;
+             the position of the merged edge is the smallest one
+    """
+    edges_k = {}
+    for l, (w, e) in edges_i.items():
+        edges_k[l] = (w * fi, e)
+    for l, (w, e) in edges_j.items():
+        if l in edges_k:
+            wk, ek = edges_k[l]
+            edges_k[l] = (wk + w * fj, min(ek, e))
+        else:
+            edges_k[l] = (w * fj, e)
+    for l in merged:
+        edges_k.pop(l, None)
+    return edges_k
+
+
 def average_link_graph_segment(G, stop=0, qmax=1, verbose=False):
     """Agglomerative function based on a (hopefully sparse) similarity graph
 
@@ -457,22 +532,14 @@ def _initial_inertia(K, Features, seeds=None):
     if seeds if provided (seeds!=None)
     this is done only for vertices adjacent to the seeds
     """
-    if seeds is None:
-        for e in range(K.E):
-            i = K.edges[e, 0]
-            j = K.edges[e, 1]
-            ESS = _inertia(i, j, Features)
-            K.weights[e] = ESS
-    else:
+    if K.E == 0:
+        return
+    K.weights = _inertia_pairs(K.edges[:, 0], K.edges[:, 1], Features)
+    if seeds is not None:
         aux = np.zeros(K.V).astype('bool')
         aux[seeds] = 1
-        for e in range(K.E):
-            i = K.edges[e, 0]
-            j = K.edges[e, 1]
-            if (aux[i] or aux[j]):
-                K.weights[e] = _inertia(i, j, Features)
-            else:
-                K.weights[e] = np.inf
+        K.weights[np.logical_not(aux[K.edges[:, 0]] | aux[K.edges[:, 1]])] = \
+            np.inf
 
 
 def _auxiliary_graph(G, Features):
@@ -905,6 +972,10 @@ def ward(G, feature, verbose=False):
     -----
     When G has more than 1 connected component, t is no longer a tree.  This
     case is handled cleanly now
+
+    The candidate merges between adjacent clusters are kept in a priority
+    queue, so that each merge costs O(d log(E)), where d is the number of
+    neighbours of the new cluster, instead of a scan of all the edges
     """
     warn('Function ward from ' + 
          'nipy.algorithms.clustering.hierrachical_clustering ' + 
@@ -925,58 +996,106 @@ def ward(G, feature, verbose=False):
     Features[1][:G.V] = feature
     Features[2][:G.V] = feature ** 2
 
-    # prepare a graph with twice the number of vertices
-    # this graph will contain the connectivity information
-    # along the merges.
     n = G.V
     nbcc = G.cc().max() + 1
-    K = _auxiliary_graph(G, Features)
-
-    # prepare some variables that are useful tp speed up the algorithm
     parent = np.arange(2 * n - nbcc).astype(np.int)
     height = np.zeros(2 * n - nbcc)
-    linc = K.left_incidence()
-    rinc = K.right_incidence()
+
+    # costs[a] maps the neighbours of the active cluster a to the inertia
+    # of their union with a; the heap holds at least the cheapest merge of
+    # each active cluster, and entries that involve a merged cluster are
+    # skipped when popped
+    edges = _unique_edges(G)
+    costs = [{} for _ in range(2 * n - nbcc)]
+    for a, b, c in zip(edges[:, 0].tolist(), edges[:, 1].tolist(),
+                       _inertia_pairs(edges[:, 0], edges[:, 1],
+                                      Features).tolist()):
+        costs[a][b] = c
+        costs[b][a] = c
+    best = [None] * (2 * n - nbcc)
+    heap = []
+    for a in range(n):
+        if costs[a]:
+            b = min(costs[a], key=costs[a].get)
+            best[a] = (costs[a][b], b)
+            heap.append((costs[a][b], a, b))
+    heapq.heapify(heap)
+    active = [True] * (2 * n - nbcc)
 
     # iteratively merge clusters
     for q in range(n - nbcc):
-        # 1. find the lightest edge
-        m = (K.weights).argmin()
-        cost = K.weights[m]
+        # 1. find the lightest edge between two active clusters
+        cost, i, j = heapq.heappop(heap)
+        while not (active[i] and active[j]):
+            cost, i, j = heapq.heappop(heap)
         k = q + n
-        i = K.edges[m, 0]
-        j = K.edges[m, 1]
         height[k] = cost
         if verbose:
-            print(q, i, j, m, cost)
-
-        # 2. remove the current edge
-        K.edges[m] = - 1
-        K.weights[m] = np.inf
-        linc[i].remove(m)
-        rinc[j].remove(m)
-
-        ml = linc[j]
-        if np.sum(K.edges[ml, 1] == i) > 0:
-            m = ml[int(np.flatnonzero(K.edges[ml, 1] == i))]
-            K.edges[m] = -1
-            K.weights[m] = np.inf
-            linc[j].remove(m)
-            rinc[i].remove(m)
+            print(q, i, j, cost)
 
-        # 3. merge the edges with third part edges
+        # 2. merge the clusters
         parent[i] = k
         parent[j] = k
+        active[i] = False
+        active[j] = False
         for p in range(3):
             Features[p][k] = Features[p][i] + Features[p][j]
 
-        linc, rinc = _remap(K, i, j, k, Features, linc, rinc)
+        # 3. connect k to the neighbours of i and j
+        nk = set(costs[i]) | set(costs[j])
+        nk.discard(i)
+        nk.discard(j)
+        costs[i] = costs[j] = None
+        if not nk:
+            continue
+        nk = list(nk)
+        costs[k] = dict(zip(nk, _inertia_pairs(k, nk, Features).tolist()))
+        b = min(costs[k], key=costs[k].get)
+        best[k] = (costs[k][b], b)
+        heapq.heappush(heap, (costs[k][b], k, b))
+
+        # 4. update the cheapest merge of the neighbours
+        for l, c in costs[k].items():
+            cl = costs[l]
+            cl.pop(i, None)
+            cl.pop(j, None)
+            cl[k] = c
+            if best[l][1] == i or best[l][1] == j:
+                b = min(cl, key=cl.get)
+                best[l] = (cl[b], b)
+                heapq.heappush(heap, (cl[b], l, b))
+            elif c < best[l][0]:
+                best[l] = (c, k)
+                heapq.heappush(heap, (c, l, k))
 
     # build a tree to encode the results
     t = WeightedForest(2 * n - nbcc, parent, height)
     return t
 
 
+def _unique_edges(G):
+    """ Return the edges of G as an array of shape (E, 2),
+    each pair of distinct adjacent vertices appearing once with
+    edges[:, 0] < edges[:, 1]
+    """
+    if G.E == 0:
+        return np.zeros((0, 2), np.int)
+    edges = np.sort(G.edges, 1)
+    edges = edges[edges[:, 0] < edges[:, 1]]
+    code = np.unique(edges[:, 0] * G.V + edges[:, 1])
+    return np.vstack((code // G.V, code % G.V)).T
+
+
+def _inertia_pairs(i, j, Features):
+    """ Vectorized version of _inertia,
+    for two arrays (or an int and an array) i and j of cluster indexes
+    """
+    n = Features[0][i] + Features[0][j]
+    s = Features[1][i] + Features[1][j]
+    q = Features[2][i] + Features[2][j]
+    return np.sum(q - (s ** 2 / n[:, np.newaxis]), 1)
+
+
 #--------------------------------------------------------------------------
 #----------------------- Visualization ------------------------------------
 # -------------------------------------------------------------------------
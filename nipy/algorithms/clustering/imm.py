@@ -31,9 +31,9 @@ def co_labelling(z, kmax=None, kmin=None):
              yields the co labelling of the data
              i.e. c[i,j]= 1 if z[i]==z[j], 0 otherwise
     """
-    from scipy.sparse import coo_matrix
+    from scipy.sparse import csr_matrix
+    z = np.asarray(z)
     n = z.size
-    colabel = coo_matrix((n, n))
 
     if kmax is None:
         kmax = z.max() + 1
@@ -41,16 +41,52 @@ def co_labelling(z, kmax=None, kmin=None):
     if kmin is None:
         kmin = z.min() - 1
 
-    for  k in np.unique(z):
-        if (k < kmax) & (k > kmin):
-            i = np.array(np.nonzero(z == k))
-            row = np.repeat(i, i.size)
-            col = np.ravel(np.tile(i, i.size))
-            data = np.ones((i.size) ** 2)
-            colabel = colabel + coo_matrix((data, (row, col)), shape=(n, n))
+    # the co-labelling matrix is the product of the (sparse) indicator
+    # matrix of the labels with its transpose
+    idx = np.nonzero((z < kmax) & (z > kmin))[0]
+    labels = np.unique(z[idx], return_inverse=True)[1]
+    n_labels = labels.max() + 1 if labels.size else 1
+    indicator = csr_matrix((np.ones(idx.size), (idx, labels)),
+                           shape=(n, n_labels))
+    colabel = (indicator * indicator.T).tocoo()
     return colabel
 
 
+def _fold_indices(kfold, n_samples):
+    """
+    Assign the samples to the folds of a cross-validation loop
+
+    Parameters
+    ----------
+    kfold: int, or array of shape(n_samples)
+           number of folds or fold label of each sample
+    n_samples: int,
+               the number of samples
+
+    Returns
+    -------
+    idx: array of shape(n_samples),
+         the fold index of each sample, the order of the folds being random
+    kmax: int,
+          the number of folds in the loop
+    """
+    if np.isscalar(kfold):
+        aux = np.argsort(np.random.rand(n_samples))
+        j = int(math.ceil(n_samples / kfold))
+        idx = np.zeros(n_samples, np.int_)
+        idx[aux] = np.arange(n_samples) // j
+        kmax = kfold
+    else:
+        if np.array(kfold).size != n_samples:
+            raise ValueError('kfold and x do not have the same size')
+        uk = np.unique(kfold)
+        np.random.shuffle(uk)
+        order = np.argsort(uk)
+        idx = order[np.searchsorted(uk[order], kfold)]
+        kmax = uk.max() + 1
+    return idx, kmax
+
+
 class IMM(BGMM):
     """
     The class implements Infinite Gaussian Mixture model
@@ -233,27 +269,10 @@ class IMM(BGMM):
         """
         n_samples = x.shape[0]
         slike = np.zeros(n_samples)
-
-        if np.isscalar(kfold):
-            aux = np.argsort(np.random.rand(n_samples))
-            idx = - np.ones(n_samples).astype(np.int)
-            j = int(math.ceil(n_samples / kfold))
-            kmax = kfold
-            for k in range(kmax):
-                idx[aux[k * j:min(n_samples, j * (k + 1))]] = k
-        else:
-            if np.array(kfold).size != n_samples:
-                raise ValueError('kfold and x do not have the same size')
-            uk = np.unique(kfold)
-            np.random.shuffle(uk)
-            idx = np.zeros(n_samples).astype(np.int)
-            for i, k in enumerate(uk):
-                idx += (i * (kfold == k))
-            kmax = uk.max() + 1
+        idx, kmax = _fold_indices(kfold, n_samples)
 
         for k in range(kmax):
-            test = np.zeros(n_samples).astype('bool')
-            test[idx == k] = 1
+            test = idx == k
             train = np.logical_not(test)
 
             # remove a fraction of the data
@@ -284,10 +303,9 @@ class IMM(BGMM):
         -------
         z: the remapped values
         """
-        uz = np.unique(z[z > - 1])
-        for i, k in enumerate(uz):
-            z[z == k] = i
-        self.k = z.max() + 1
+        valid = z > - 1
+        z[valid] = np.unique(z[valid], return_inverse=True)[1]
+        self.k = int(z.max()) + 1
         return z
 
     def update(self, x, z):
@@ -367,18 +385,18 @@ class IMM(BGMM):
         tau /= (1 + tau)
         m = self._prior_means
         b = self._prior_scale
-        ib = np.linalg.inv(b[0])
         ldb = np.log(detsh(b[0]))
 
         scalar_w = np.log(tau / np.pi) * self.dim
         scalar_w += 2 * gammaln((a + 1) / 2)
         scalar_w -= 2 * gammaln((a - self.dim) / 2)
         scalar_w -= ldb * a
-        w = scalar_w * np.ones(x.shape[0])
 
-        for i in range(x.shape[0]):
-            w[i] -= (a + 1) * np.log(detsh(ib + tau * (m - x[i:i + 1]) *
-                                           (m - x[i:i + 1]).T))
+        # matrix determinant lemma:
+        # det(inv(b) + tau * d d^T) = (1 + tau * d^T b d) / det(b)
+        dx = x - m
+        mahal = np.sum(np.dot(dx, b[0]) * dx, 1)
+        w = scalar_w - (a + 1) * (np.log1p(tau * mahal) - ldb)
 
         w /= 2
         return np.exp(w)
@@ -598,28 +616,11 @@ class MixedIMM(IMM):
         """
         n_samples = x.shape[0]
         slike = np.zeros(n_samples)
-
-        if np.isscalar(kfold):
-            aux = np.argsort(np.random.rand(n_samples))
-            idx = - np.ones(n_samples).astype(np.int)
-            j = int(math.ceil(n_samples / kfold))
-            kmax = kfold
-            for k in range(kmax):
-                idx[aux[k * j:min(n_samples, j * (k + 1))]] = k
-        else:
-            if np.array(kfold).size != n_samples:
-                raise ValueError('kfold and x do not have the same size')
-            uk = np.unique(kfold)
-            np.random.shuffle(uk)
-            idx = np.zeros(n_samples).astype(np.int)
-            for i, k in enumerate(uk):
-                idx += (i * (kfold == k))
-            kmax = uk.max() + 1
+        idx, kmax = _fold_indices(kfold, n_samples)
 
         for k in range(kmax):
             # split at iteration k
-            test = np.zeros(n_samples).astype('bool')
-            test[idx == k] = 1
+            test = idx == k
             train = np.logical_not(test)
 
             # remove a fraction of the data
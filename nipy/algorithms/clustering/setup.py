@@ -6,6 +6,7 @@ def configuration(parent_package='',top_path=None):
     from numpy.distutils.misc_util import Configuration
 
     config = Configuration('clustering', parent_package, top_path)
+    config.add_subpackage('bench')
     config.add_subpackage('tests')
 
     return config
@@ -13,9 +13,12 @@ from __future__ import absolute_import
 import numpy as np
 import numpy.random as nr
 
-from ..bgmm import BGMM, VBGMM, dirichlet_eval, multinomial, dkl_gaussian 
+from ..bgmm import (BGMM, VBGMM, dirichlet_eval, multinomial, dkl_gaussian,
+                    gumbel_multinomial, label_moments,
+                    generate_Wishart_factors)
 
 from nose.tools import assert_true
+from numpy.testing import assert_array_almost_equal
 
 def test_dirichlet_eval():
     # check that the Dirichlet evaluation function sums to one on a simple
@@ -44,6 +47,56 @@ def test_multinomial():
     assert_true(np.sum((aux-res) ** 2) < 1.e-4)
 
 
+def test_gumbel_multinomial():
+    # same as test_multinomial, with unnormalized log-probabilities
+    # and a class that has zero probability
+    n_samples = 100000
+    n_classes = 5
+    aux = np.random.rand(n_classes)
+    aux[2] = 0
+    aux /= aux.sum()
+    with np.errstate(divide='ignore'):
+        log_like = np.repeat(np.log(aux)[np.newaxis] - 800, n_samples, 0)
+    z = gumbel_multinomial(log_like)
+    res = np.bincount(z, minlength=n_classes) * 1.0 / n_samples
+    assert_true(np.sum(z == 2) == 0)
+    assert_true(np.sum((aux - res) ** 2) < 1.e-4)
+
+
+def test_label_moments():
+    # compare the sufficient statistics with a per-class computation
+    n_samples, k, dim = 200, 4, 3
+    x = nr.randn(n_samples, dim)
+    z = nr.randint(-1, k - 1, n_samples)
+    pop, sums, scatter = label_moments(x, z, k)
+    for j in range(k):
+        xj = x[z == j]
+        assert_true(pop[j] == xj.shape[0])
+        assert_array_almost_equal(sums[j], xj.sum(0))
+        if pop[j] > 0:
+            dx = xj - xj.mean(0)
+            assert_array_almost_equal(scatter[j], np.dot(dx.T, dx))
+    # the last class is empty
+    assert_array_almost_equal(scatter[k - 1], np.zeros((dim, dim)))
+
+
+def test_wishart_factors():
+    # the factored draws have the expected mean and determinants
+    n_draws, dim = 4000, 3
+    aux = nr.randn(dim, dim)
+    V = np.eye(dim) + np.dot(aux, aux.T) / dim
+    dof = dim + 2.
+    R, log_det = generate_Wishart_factors(dof * np.ones(n_draws),
+                                          np.repeat(V[np.newaxis], n_draws, 0))
+    W = np.einsum('kij,klj->kil', R, R)
+    assert_array_almost_equal(log_det,
+                              [np.log(np.linalg.det(w)) for w in W])
+    U = np.linalg.cholesky(V).T
+    expected = dof * np.dot(U, U.T)
+    assert_true(np.abs(W.mean(0) - expected).max() <
+                0.1 * np.abs(expected).max())
+
+
 def test_dkln1():
     dim = 3
     m1 = np.zeros(dim)
@@ -193,6 +246,26 @@ def test_evidence(k=1):
     assert_true(bfchib > vbe)
 
 
+def test_vbgmm_streaming():
+    # streaming estimation gives the same model as in-memory estimation
+    n_samples, dim, offset, k = 300, 2, 3, 2
+    x = nr.randn(n_samples, dim)
+    x[:100] += offset
+    b = VBGMM(k, dim)
+    b.guess_priors(x)
+    b.initialize(x)
+    bs = VBGMM(k, dim, b.means.copy(), b.precisions.copy(),
+               b.weights.copy(), b.shrinkage.copy(), b.dof.copy())
+    bs.guess_priors(x)
+    bs.scale = b.scale.copy()
+    b.estimate(x, niter=20, delta=0)
+    bs.estimate_streaming(x, chunk_size=70, niter=20, delta=0,
+                          warm_start=True)
+    assert_array_almost_equal(b.means, bs.means)
+    assert_array_almost_equal(b.scale, bs.scale)
+    assert_array_almost_equal(b.weights, bs.weights)
+
+
 if __name__ == '__main__':
     import nose
     nose.run(argv=['', __file__])
@@ -4,7 +4,7 @@ from __future__ import absolute_import
 # to run only the simple tests:
 # python testClustering.py Test_Clustering
 
-from ..utils import kmeans
+from ..utils import kmeans, _EStep, _MStep
 import nose
 import numpy as np
 import numpy.random as nr
@@ -29,6 +29,47 @@ class TestClustering(TestCase):
         l = L[:7000].astype(np.float)
         self.assert_(np.mean(l) > 0.9)
 
+    def testkmeans_init(self):
+        X = nr.randn(1000, 2)
+        X[:700] += 5
+        for init in ['random', 'k-means++']:
+            C, L, J = kmeans(X, 2, init=init, ninit=3)
+            self.assert_(np.all(L[:700] == L[0]))
+            self.assert_(np.all(L[700:] == L[-1]))
+        self.assertRaises(ValueError, kmeans, X, 2, init='foo')
+
+    def testkmeans_minibatch(self):
+        X = nr.randn(10000, 2)
+        X[:7000] += 5
+        C, L, J = kmeans(X, 2, init='k-means++', batch_size=100)
+        C_, L_, J_ = kmeans(X, 2, init='k-means++')
+        self.assert_(np.mean(L[:7000] == L[0]) > 0.99)
+        self.assert_(np.mean(L[7000:] == L[-1]) > 0.99)
+        self.assert_(J < 1.01 * J_)
+
+    def testkmeans_n_jobs(self):
+        X = nr.randn(500, 3)
+        results = []
+        for n_jobs in [1, 2]:
+            nr.seed(3)
+            results.append(kmeans(X, 4, ninit=4, n_jobs=n_jobs))
+        self.assert_(np.all(results[0][1] == results[1][1]))
+        self.assertEqual(results[0][2], results[1][2])
+
+    def test_estep_mstep(self):
+        X = nr.randn(100, 3)
+        centers = nr.randn(5, 3)
+        dist = ((X[:, np.newaxis] - centers) ** 2).sum(2)
+        for chunk_size in [None, 7]:
+            z, J = _EStep(X, centers, chunk_size)
+            self.assert_(np.all(z == dist.argmin(1)))
+            self.assertAlmostEqual(J, dist.min(1).sum())
+        centers = _MStep(X, z, 6)
+        for q in range(5):
+            if np.sum(z == q) > 0:
+                self.assert_(np.allclose(centers[q], X[z == q].mean(0)))
+        self.assert_(np.allclose(centers[5], X.mean(0)))
+
 
 if __name__ == '__main__':
     nose.run(argv=['', __file__])
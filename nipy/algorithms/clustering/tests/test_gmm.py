@@ -6,7 +6,8 @@ from __future__ import absolute_import
 
 import numpy as np
 from nose.tools import assert_true
-from ..gmm import GMM, best_fitting_GMM
+from numpy.testing import assert_array_almost_equal, assert_almost_equal
+from ..gmm import GMM, best_fitting_GMM, logsumexp
 
 # seed the random number generator to avoid rare random failures
 seed = 1
@@ -115,7 +116,19 @@ def test_em_selection():
     lgmm = best_fitting_GMM(x, krange, prec_type='full',
                             niter=100, delta = 1.e-4, ninit=1)
     assert_true(lgmm.k < 4)
-    
+
+
+def test_em_selection_n_jobs():
+    # parallel model selection gives the same model as the serial one
+    dim = 2
+    x = np.concatenate((nr.randn(100, dim), 3 + 2 * nr.randn(100, dim)))
+    models = []
+    for n_jobs in (1, 2):
+        np.random.seed(1)
+        models.append(best_fitting_GMM(x, [1, 2, 3], ninit=2, n_jobs=n_jobs))
+    assert_true(models[0].k == models[1].k)
+    assert_array_almost_equal(models[0].means, models[1].means)
+
 
 def test_em_gmm_full():
     # Computing the BIC value for different configurations
@@ -261,6 +274,111 @@ def test_em_gmm_cv():
     assert_true(ll[4] < ll[1])
 
 
+def test_log_likelihood():
+    # Compare the vectorized log-likelihood with a direct computation
+    dim, k, n = 3, 4, 50
+    x = nr.randn(n, dim)
+    means = nr.randn(k, dim)
+    a = nr.randn(k, dim, dim)
+    precisions = np.array([np.dot(a_, a_.T) + np.eye(dim) for a_ in a])
+    weights = np.ones(k) / k
+    for prec_type in ['full', 'diag']:
+        if prec_type == 'diag':
+            precisions = np.array([np.diag(p) for p in precisions])
+        lgmm = GMM(k, dim, prec_type, means, precisions, weights)
+        ref = np.zeros((n, k))
+        for j in range(k):
+            if prec_type == 'full':
+                prec = precisions[j]
+            else:
+                prec = np.diag(precisions[j])
+            dx = x - means[j]
+            ref[:, j] = 0.5 * (np.log(np.linalg.det(prec)) -
+                               dim * np.log(2 * np.pi) -
+                               np.sum(np.dot(dx, prec) * dx, 1))
+        assert_array_almost_equal(lgmm.unweighted_log_likelihood(x), ref)
+        assert_array_almost_equal(lgmm.unweighted_likelihood(x),
+                                  np.exp(ref))
+        assert_array_almost_equal(lgmm.log_likelihood(x),
+                                  ref + np.log(weights))
+        resp, log_norm = lgmm.responsibilities(x)
+        assert_array_almost_equal(resp.sum(1), np.ones(n))
+        assert_array_almost_equal(log_norm, np.log(lgmm.likelihood(x).sum(1)))
+
+
+def test_logsumexp():
+    a = nr.randn(4, 5)
+    assert_array_almost_equal(logsumexp(a, 1), np.log(np.exp(a).sum(1)))
+    assert_array_almost_equal(logsumexp(a, 0), np.log(np.exp(a).sum(0)))
+    assert_almost_equal(logsumexp(a), np.log(np.exp(a).sum()))
+    # no overflow/underflow
+    assert_array_almost_equal(logsumexp(a - 1000, 1),
+                              np.log(np.exp(a).sum(1)) - 1000)
+    assert_true(np.all(logsumexp(- np.inf * np.ones((2, 3)), 1) == - np.inf))
+
+
+def test_em_gmm_underflow():
+    # In high dimension the likelihoods underflow, but EM still works
+    dim, n = 500, 200
+    x = nr.randn(n, dim)
+    x[:100] += 3
+    lgmm = GMM(2, dim, 'diag')
+    lgmm.initialize(x)
+    assert_true(np.all(lgmm.likelihood(x) == 0))
+    bic = lgmm.estimate(x)
+    assert_true(np.isfinite(bic))
+    assert_true(np.isfinite(lgmm.average_log_like(x)))
+    z = lgmm.map_label(x)
+    assert_true(np.all(z[:100] == z[0]) and np.all(z[100:] == 1 - z[0]))
+
+
+def test_em_gmm_streaming():
+    # streaming estimation gives the same model as in-memory estimation
+    dim, n = 3, 1000
+    x = nr.randn(n, dim)
+    x[:300] += 3
+    for prec_type in ['full', 'diag']:
+        lgmm = GMM(2, dim, prec_type)
+        lgmm.initialize(x)
+        sgmm = GMM(2, dim, prec_type)
+        sgmm.guess_regularizing(x)
+        sgmm.plugin(lgmm.means.copy(), lgmm.precisions.copy(),
+                    lgmm.weights.copy())
+        bic = lgmm.estimate(x, niter=10, delta=0)
+        sbic = sgmm.estimate_streaming(x, chunk_size=128, niter=10, delta=0,
+                                       warm_start=True)
+        assert_almost_equal(bic, sbic)
+        assert_array_almost_equal(lgmm.means, sgmm.means)
+        assert_array_almost_equal(lgmm.precisions, sgmm.precisions)
+        assert_array_almost_equal(lgmm.weights, sgmm.weights)
+
+    # the data may come from a generator function
+    def chunks():
+        for i in range(10):
+            yield x[i * 100: (i + 1) * 100]
+
+    sgmm = GMM(2, dim)
+    sgmm.estimate_streaming(chunks)
+    z = sgmm.map_label(x)
+    assert_true(np.all(z[:300] == z[0]) or np.mean(z[:300] == z[0]) > .95)
+    assert_true(np.mean(z[300:] != z[0]) > .95)
+
+
+def test_moments():
+    # merged moments are those of the concatenated data
+    from ..gmm import weighted_moments, merge_moments
+    x = nr.randn(100, 3) + 10
+    resp = nr.rand(100, 2)
+    for full in (True, False):
+        ref = weighted_moments(x, resp, full)
+        merged = None
+        for i in range(0, 100, 30):
+            merged = merge_moments(merged, weighted_moments(
+                    x[i: i + 30], resp[i: i + 30], full))
+        for a, b in zip(ref, merged):
+            assert_array_almost_equal(a, b)
+
+
 if __name__ == '__main__':
     import nose
     nose.run(argv=['', __file__])
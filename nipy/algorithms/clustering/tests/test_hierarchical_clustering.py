@@ -38,6 +38,32 @@ def alg_test_basic(n=100,k=5):
     assert_true(np.sum(w*(1-w))==0)
 
 
+def alg_test_reference(n=40):
+    # Check the tree against a dense brute-force implementation
+    np.random.seed(2)
+    x = np.random.randn(n, 2)
+    G = knn(x, 4)
+    G.weights = np.exp(- G.weights)
+    t = average_link_graph(G)
+    W = np.zeros((2 * n - 1, 2 * n - 1))
+    A = np.zeros((2 * n - 1, 2 * n - 1), np.bool_)
+    W[G.edges[:, 0], G.edges[:, 1]] = G.weights
+    A[G.edges[:, 0], G.edges[:, 1]] = True
+    pop = np.ones(2 * n - 1)
+    for k in range(n, 2 * n - 1):
+        i, j = np.unravel_index(np.where(A, W, - np.inf).argmax(), W.shape)
+        assert_true(t.parents[i] == k and t.parents[j] == k)
+        pop[k] = pop[i] + pop[j]
+        fi = pop[i] / pop[k]
+        W[k] = fi * W[i] + (1 - fi) * W[j]
+        W[:, k] = fi * W[:, i] + (1 - fi) * W[:, j]
+        A[k] = A[i] | A[j]
+        A[:, k] = A[:, i] | A[:, j]
+        A[[i, j, k], [i, j, k]] = False
+        A[[i, j]] = False
+        A[:, [i, j]] = False
+
+
 def alg_test_2():
     # Do we handle case of graph with too many connected components?
     np.random.seed(0)
@@ -168,6 +194,45 @@ def ward_test_more(n=100, k=5, verbose=0):
     assert_equal(np.sum(u1==u2), n)
 
 
+def _naive_ward(G, X):
+    # reference implementation: rescan all the pairs of adjacent clusters
+    # at each step
+    n = G.V
+    nbcc = G.cc().max() + 1
+    members = dict((i, [i]) for i in range(n))
+    adjacency = set((min(a, b), max(a, b)) for a, b in G.edges if a != b)
+    parent = np.arange(2 * n - nbcc)
+    height = np.zeros(2 * n - nbcc)
+
+    def cost(e):
+        # inertia of the union of the two clusters
+        idx = members[e[0]] + members[e[1]]
+        return np.sum(np.var(X[idx], 0)) * len(idx)
+
+    for k in range(n, 2 * n - nbcc):
+        i, j = min(adjacency, key=cost)
+        height[k] = cost((i, j))
+        parent[i] = parent[j] = k
+        members[k] = members.pop(i) + members.pop(j)
+        adjacency = set(
+            (min(a, b), max(a, b)) for a, b in
+            [(k if a in (i, j) else a, k if b in (i, j) else b)
+             for a, b in adjacency] if a != b)
+    return parent, height
+
+
+def ward_test_reference(n=50):
+    # Check the tree against a brute-force implementation
+    np.random.seed(1)
+    X = randn(n, 2)
+    X[n // 2:] += 10
+    G = knn(X, 3)
+    t = ward(G, X)
+    parent, height = _naive_ward(G, X)
+    assert_true((t.parents == parent).all())
+    assert_true(np.allclose(t.height, height))
+
+
 if __name__ == '__main__':
     import nose
     nose.run(argv=['', __file__])
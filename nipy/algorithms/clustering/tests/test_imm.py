@@ -7,12 +7,13 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import numpy as np
+from scipy.special import gammaln
 
 from ..imm import IMM, MixedIMM, co_labelling
 
 from nose.tools import assert_true
 
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_array_equal, assert_almost_equal
 
 def test_colabel():
     # test the co_labelling functionality
@@ -26,6 +27,35 @@ def test_colabel():
     assert_array_equal(c, tc)
 
 
+def test_colabel_kmax():
+    # labels outside of ]kmin, kmax[ are ignored
+    z = np.array([0, 1, 1, -1, 2, 0])
+    c = co_labelling(z, 2, -1).todense()
+    tc = (z[:, np.newaxis] == z) & (z[:, np.newaxis] > -1) & \
+        (z[:, np.newaxis] < 2)
+    assert_array_equal(c, tc)
+
+
+def test_likelihood_under_the_prior():
+    # compare with the direct evaluation of the determinants
+    n, dim = 20, 3
+    x = np.random.randn(n, dim)
+    igmm = IMM(.5, dim)
+    igmm.set_priors(x)
+    w = igmm.likelihood_under_the_prior(x)
+    a = igmm._prior_dof
+    tau = igmm._prior_shrinkage / (1 + igmm._prior_shrinkage)
+    m = igmm._prior_means
+    b = igmm._prior_scale[0]
+    ib = np.linalg.inv(b)
+    lw = dim * np.log(tau / np.pi) + 2 * gammaln((a + 1) / 2.) - \
+        2 * gammaln((a - dim) / 2.) - a * np.log(np.linalg.det(b))
+    for i in range(n):
+        d = m - x[i:i + 1]
+        lwi = lw - (a + 1) * np.log(np.linalg.det(ib + tau * np.dot(d.T, d)))
+        assert_almost_equal(np.log(w[i]), lwi / 2)
+
+
 def test_imm_loglike_1D():
     # Check that the log-likelihood of the data under the infinite gaussian
     # mixture model is close to the theoretical data likelihood
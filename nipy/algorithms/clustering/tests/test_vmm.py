@@ -72,6 +72,24 @@ def test_dimension_selection_cv():
     assert_true(len(np.unique(z))<4)
 
 
+def test_selection_n_jobs():
+    # Parallel model selection gives the same model as the serial one
+    x = np.random.randn(60, 3) * .1
+    x[:30] += [1, 0, 0]
+    x[30:] += [0, 1, 0]
+    x = (x.T / np.sqrt(np.sum(x**2, 1))).T
+    sub = np.repeat(np.arange(5), 12)
+    for select, kwargs in [(select_vmm, {}),
+                           (select_vmm_cv, {'cv_index': sub})]:
+        models = []
+        for n_jobs in (1, 2):
+            np.random.seed(0)
+            models.append(select(list(range(1, 4)), 50., null_class=False,
+                                 x=x, ninit=3, n_jobs=n_jobs, **kwargs))
+        assert_equal(models[0].k, models[1].k)
+        assert_true(np.allclose(models[0].means, models[1].means))
+
+
 if __name__ == '__main__':
     import nose
     nose.run(argv=['', __file__])
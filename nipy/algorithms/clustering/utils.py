@@ -6,9 +6,11 @@ from __future__ import print_function, absolute_import
 
 import numpy as np
 
+from nipy.utils.parallel import parallel_map, random_seeds
+
 
 def kmeans(X, nbclusters=2, Labels=None, maxiter=300, delta=0.0001, verbose=0,
-              ninit=1):
+              ninit=1, init='random', batch_size=None, n_jobs=1):
     """ kmeans clustering algorithm
 
     Parameters
@@ -24,6 +26,16 @@ def kmeans(X, nbclusters=2, Labels=None, maxiter=300, delta=0.0001, verbose=0,
            before declaring convergence.
     verbose: verbosity mode, optionall
     ninit: int, optional, number of random initalizations
+    init: {'random', 'k-means++'}, optional
+          the seeding strategy, used when Labels is None:
+          either randomly chosen items, or k-means++ seeding
+    batch_size: int, optional,
+                if not None, the centers are updated using random
+                mini-batches of batch_size items instead of the whole
+                data at each iteration (mini-batch k-means)
+    n_jobs: int, optional,
+            number of processes over which the ninit runs are distributed;
+            -1 means all the CPUs. Results do not depend on n_jobs.
 
     Returns
     -------
@@ -57,9 +69,14 @@ def kmeans(X, nbclusters=2, Labels=None, maxiter=300, delta=0.0001, verbose=0,
             print(" cannot find more clusters than items")
         nbclusters = nbitems
 
-    if (ninit < 1) & verbose:
-        print("making at least one iteration")
-        ninit = np.maximum(int(ninit), 1)
+    if ninit < 1:
+        if verbose:
+            print("making at least one iteration")
+        ninit = 1
+    ninit = int(ninit)
+
+    if batch_size is not None:
+        batch_size = max(int(batch_size), 1)
 
     if Labels is not None:
         if np.size(Labels) == nbitems:
@@ -82,10 +99,14 @@ def kmeans(X, nbclusters=2, Labels=None, maxiter=300, delta=0.0001, verbose=0,
             else:
                 if verbose:
                     print("incorrect labelling - ignored")
+                Labels = None
         else:
             if verbose:
                 print("incompatible number of labels provided - ignored")
-    Centers, labels, J = _kmeans(X, nbclusters, Labels, maxiter, delta, ninit)
+            Labels = None
+    Centers, labels, J = _kmeans(X, nbclusters, Labels, maxiter, delta, ninit,
+                                 init=init, batch_size=batch_size,
+                                 n_jobs=n_jobs)
     return Centers, labels, J
 
 
@@ -105,16 +126,20 @@ def _MStep(x, z, k):
              the resulting centers
     """
     dim = x.shape[1]
+    z = np.asarray(z).astype(np.intp)
+    valid = (z > -1) & (z < k)
+    if not valid.all():
+        x, z = x[valid], z[valid]
+    counts = np.bincount(z, minlength=k)[:k]
     centers = np.repeat(np.reshape(x.mean(0), (1, dim)), k, 0)
-    for q in range(k):
-        if np.sum(z == q) == 0:
-            pass
-        else:
-            centers[q] = np.mean(x[z == q], 0)
+    nonempty = counts > 0
+    for d in range(dim):
+        sums = np.bincount(z, weights=x[:, d], minlength=k)[:k]
+        centers[nonempty, d] = sums[nonempty] / counts[nonempty]
     return centers
 
 
-def _EStep(x, centers):
+def _EStep(x, centers, chunk_size=None):
     """ Computation of the input-to-cluster assignment
 
     Parameters
@@ -122,23 +147,75 @@ def _EStep(x, centers):
     x array of shape (n,p)
       n = number of items, p = data dimension
     centers, array of shape (k,p) the cluster centers
+    chunk_size, int, optional,
+                number of items processed at once; by default it is chosen
+                so that the (chunk_size, k) distance array stays small
 
     Returns
     -------
     z vector of shape(n), the resulting assignment
+    J, float, the inertia, i.e. the sum of squared distances
+       of the items to their center
     """
     nbitem = x.shape[0]
-    z = - np.ones(nbitem).astype(np.int)
-    mindist = np.inf * np.ones(nbitem)
     k = centers.shape[0]
-    for q in range(k):
-        dist = np.sum((x - centers[q]) ** 2, 1)
-        z[dist < mindist] = q
-        mindist = np.minimum(dist, mindist)
+    if chunk_size is None:
+        chunk_size = max(2 ** 20 // max(k, 1), 1)
+    z = np.empty(nbitem, np.intp)
+    mindist = np.empty(nbitem)
+    c2 = np.sum(centers ** 2, 1)
+    for start in range(0, nbitem, chunk_size):
+        xc = x[start: start + chunk_size]
+        # squared distances, up to the ||x||^2 term
+        dist = c2 - 2 * np.dot(xc, centers.T)
+        zc = np.argmin(dist, 1)
+        z[start: start + chunk_size] = zc
+        mindist[start: start + chunk_size] = np.maximum(
+            dist[np.arange(xc.shape[0]), zc] + np.sum(xc ** 2, 1), 0)
     J = mindist.sum()
     return z, J
 
 
+def _kmeans_plusplus(x, k, rng):
+    """ k-means++ seeding of the cluster centers
+
+    Parameters
+    ----------
+    x array of shape (n,p)
+      n = number of items, p = data dimension
+    k, int, number of desired clusters
+    rng, np.random.RandomState instance
+
+    Returns
+    -------
+    centers, array of shape (k,p), the initial centers,
+             chosen among the rows of x
+
+    Notes
+    -----
+    Each new center is drawn with a probability proportional to the
+    squared distance to the closest center already chosen (Arthur and
+    Vassilvitskii, 2007).
+    """
+    nbitem = x.shape[0]
+    seeds = np.zeros(k, np.intp)
+    seeds[0] = rng.randint(nbitem)
+    x2 = np.sum(x ** 2, 1)
+    mindist = np.maximum(x2 - 2 * np.dot(x, x[seeds[0]]) + x2[seeds[0]], 0)
+    for q in range(1, k):
+        cumdist = np.cumsum(mindist)
+        if cumdist[-1] > 0:
+            seeds[q] = np.searchsorted(cumdist, rng.rand() * cumdist[-1],
+                                       side='right')
+            seeds[q] = min(seeds[q], nbitem - 1)
+        else:
+            # all the items are already covered by a center
+            seeds[q] = rng.randint(nbitem)
+        dist = np.maximum(x2 - 2 * np.dot(x, x[seeds[q]]) + x2[seeds[q]], 0)
+        mindist = np.minimum(mindist, dist)
+    return x[seeds].copy()
+
+
 def voronoi(x, centers):
     """ Assignment of data items to nearest cluster center
 
@@ -162,8 +239,83 @@ def voronoi(x, centers):
     return _EStep(x, centers)[0]
 
 
+def _init_centers(X, nbclusters, Labels, init, rng):
+    """ Initial centers for one run of the k-means algorithm
+    """
+    if Labels is not None:
+        return _MStep(X, Labels, nbclusters)
+    if init == 'k-means++':
+        return _kmeans_plusplus(X, nbclusters, rng)
+    seeds = rng.permutation(X.shape[0])[:nbclusters]
+    return X[seeds]
+
+
+def _lloyd(X, centers, maxiter, delta, vdata, verbose=0):
+    """ Lloyd iterations of the k-means algorithm, starting from centers
+    """
+    nbclusters = centers.shape[0]
+    for i in range(maxiter):
+        z, J = _EStep(X, centers)
+        centers_old = centers
+        centers = _MStep(X, z, nbclusters)
+        if verbose:
+            print(i, J)
+        if np.sum((centers_old - centers) ** 2) < delta * vdata:
+            break
+    return centers
+
+
+def _minibatch(X, centers, maxiter, delta, vdata, batch_size, rng,
+               verbose=0):
+    """ Mini-batch iterations of the k-means algorithm, starting from centers
+
+    Each center is moved towards the running mean of all the items that
+    were assigned to it in the successive random batches (Sculley, 2010).
+    """
+    nbitem = X.shape[0]
+    nbclusters = centers.shape[0]
+    centers = centers.copy()
+    counts = np.zeros(nbclusters)
+    for i in range(maxiter):
+        batch = X[rng.randint(nbitem, size=batch_size)]
+        z, J = _EStep(batch, centers)
+        bcounts = np.bincount(z, minlength=nbclusters)
+        updated = bcounts > 0
+        counts += bcounts
+        centers_old = centers.copy()
+        for d in range(X.shape[1]):
+            sums = np.bincount(z, weights=batch[:, d], minlength=nbclusters)
+            centers[updated, d] += (sums[updated] - bcounts[updated] *
+                                    centers[updated, d]) / counts[updated]
+        if verbose:
+            print(i, J)
+        if np.sum((centers_old - centers) ** 2) < delta * vdata:
+            break
+    return centers
+
+
+def _kmeans_run(args):
+    """ One complete run of the k-means algorithm
+
+    This takes a single tuple argument so that it can be used with
+    `nipy.utils.parallel.parallel_map`.
+    """
+    X, nbclusters, Labels, maxiter, delta, init, batch_size, seed, \
+        verbose = args
+    rng = np.random.RandomState(seed)
+    vdata = np.mean(np.var(X, 0))
+    centers = _init_centers(X, nbclusters, Labels, init, rng)
+    if batch_size is None or batch_size >= X.shape[0]:
+        centers = _lloyd(X, centers, maxiter, delta, vdata, verbose)
+    else:
+        centers = _minibatch(X, centers, maxiter, delta, vdata, batch_size,
+                             rng, verbose)
+    z, J = _EStep(X, centers)
+    return centers, z, J
+
+
 def _kmeans(X, nbclusters=2, Labels=None, maxiter=300, delta=1.e-4,
-            ninit=1, verbose=0):
+            ninit=1, verbose=0, init='random', batch_size=None, n_jobs=1):
     """ kmeans clustering algorithm
 
     Parameters
@@ -177,7 +329,15 @@ def _kmeans(X, nbclusters=2, Labels=None, maxiter=300, delta=1.e-4,
              the maximum number of iterations  before convergence
     delta: float, optional
            the relative increment in the results before declaring convergence.
+    ninit: int, optional, number of random initalizations
     verbose=0: verboseity mode
+    init: {'random', 'k-means++'}, optional
+          the seeding strategy, used when Labels is None
+    batch_size: int, optional,
+                if not None, use mini-batch updates with batches
+                of that size
+    n_jobs: int, optional,
+            number of processes over which the runs are distributed
 
     Returns
     -------
@@ -186,38 +346,15 @@ def _kmeans(X, nbclusters=2, Labels=None, maxiter=300, delta=1.e-4,
     Labels: array of size n, the discrete labels of the input items
     J, float,  the final value of the inertia criterion
     """
-    # fixme: do the checks
-    nbitem = X.shape[0]
-
-    vdata = np.mean(np.var(X, 0))
-    bJ = np.inf
-    for it in range(ninit):
-        # init
-        if Labels is None:
-            seeds = np.argsort(np.random.rand(nbitem))[:nbclusters]
-            centers = X[seeds]
-        else:
-            centers = _MStep(X, Labels, nbclusters)
-        centers_old = centers.copy()
-
-        # iterations
-        for i in range(maxiter):
-            z, J = _EStep(X, centers)
-            centers = _MStep(X, z, nbclusters)
-            if verbose:
-                print(i, J)
-            if np.sum((centers_old - centers) ** 2) < delta * vdata:
-                if verbose:
-                    print(i)
-                break
-            centers_old = centers.copy()
-
-            if J < bJ:
-                bJ = J
-                centers_output = centers.copy()
-                z_output = z.copy()
-    else:
-        centers_output = centers
-        z_output = z
-
-    return centers_output, z_output, bJ
+    if init not in ('random', 'k-means++'):
+        raise ValueError("init should be 'random' or 'k-means++'")
+    if Labels is not None:
+        # all the runs would start from the same point
+        ninit = 1
+    seeds = random_seeds(ninit)
+    runs = parallel_map(
+        _kmeans_run,
+        [(X, nbclusters, Labels, maxiter, delta, init, batch_size, seed,
+          verbose) for seed in seeds],
+        n_jobs)
+    return min(runs, key=lambda run: run[2])
@@ -10,6 +10,8 @@ from __future__ import absolute_import
 import numpy as np
 from warnings import warn
 
+from nipy.utils.parallel import parallel_map, random_seeds, local_random_state
+
 warn('Module nipy.algorithms.clustering.von_mises_fisher_mixture' + 
      'deprecated, will be removed',
      FutureWarning,
@@ -266,8 +268,33 @@ class VonMisesMixture(object):
         pylab.show()
 
 
+def _fit_vmm(args):
+    """ Estimate one von Mises mixture from a random start, as a picklable
+    task
+
+    Returns the estimated model and its average log-density.
+    """
+    k, precision, null_class, x, bias, maxiter, seed = args
+    with local_random_state(seed):
+        aux = VonMisesMixture(k, precision, null_class=null_class)
+        ll = aux.estimate(x, maxiter=maxiter, bias=bias)
+    return aux, ll
+
+
+def _best_of(fits):
+    """ Return the model with the highest score among (model, score) pairs,
+    the first one winning ties
+    """
+    score = - np.inf
+    for aux, ll in fits:
+        if ll > score:
+            best_model = aux
+            score = ll
+    return best_model
+
+
 def estimate_robust_vmm(k, precision, null_class, x, ninit=10, bias=None,
-                        maxiter=100):
+                        maxiter=100, n_jobs=1):
     """ Return the best von_mises mixture after severla initialization
 
     Parameters
@@ -284,19 +311,26 @@ def estimate_robust_vmm(k, precision, null_class, x, ninit=10, bias=None,
           prior probability of being in a non-null class
     maxiter: int, optional,
              maximum number of iterations after each initialization
+    n_jobs: int, optional,
+            number of processes over which the initializations are
+            distributed; -1 means all the CPUs
     """
-    score = - np.inf
-    for i in range(ninit):
-        aux = VonMisesMixture(k, precision, null_class=null_class)
-        ll = aux.estimate(x, bias=bias)
-        if ll > score:
-            best_model = aux
-            score = ll
-    return best_model
+    fits = parallel_map(
+        _fit_vmm, [(k, precision, null_class, x, bias, maxiter, seed)
+                   for seed in random_seeds(ninit)], n_jobs)
+    return _best_of(fits)
+
+
+def _reestimate_vmm(args):
+    """ Run the estimation of a fitted model again on x, without bias
+    """
+    aux, x = args
+    ll = aux.estimate(x)
+    return aux, ll
 
 
 def select_vmm(krange, precision, null_class, x, ninit=10, bias=None,
-               maxiter=100, verbose=0):
+               maxiter=100, verbose=0, n_jobs=1):
     """Return the best von_mises mixture after severla initialization
 
     Parameters
@@ -313,12 +347,21 @@ def select_vmm(krange, precision, null_class, x, ninit=10, bias=None,
     bias: array of shape(n),
           a prior probability of not being in the null class
     verbose: Bool, optional
+    n_jobs: int, optional,
+            number of processes over which the (k, initialization) pairs
+            are distributed; -1 means all the CPUs
     """
+    krange = list(krange)
+    tasks = [(k, precision, null_class, x, bias, maxiter, seed)
+             for k in krange for seed in random_seeds(ninit)]
+    fits = parallel_map(_fit_vmm, tasks, n_jobs)
+    models = [_best_of(fits[i * ninit: (i + 1) * ninit])
+              for i in range(len(krange))]
+    refits = parallel_map(_reestimate_vmm, [(aux, x) for aux in models],
+                          n_jobs)
+
     score = - np.inf
-    for k in krange:
-        aux = estimate_robust_vmm(k, precision, null_class, x, ninit, bias,
-                                  maxiter)
-        ll = aux.estimate(x)
+    for k, (aux, ll) in zip(krange, refits):
         if null_class:
             bic = ll - np.log(x.shape[0]) * k * 3 / x.shape[0]
         else:
@@ -332,7 +375,7 @@ def select_vmm(krange, precision, null_class, x, ninit=10, bias=None,
 
 
 def select_vmm_cv(krange, precision, x, null_class, cv_index,
-                  ninit=5, maxiter=100, bias=None, verbose=0):
+                  ninit=5, maxiter=100, bias=None, verbose=0, n_jobs=1):
     """Return the best von_mises mixture after severla initialization
 
     Parameters
@@ -349,34 +392,44 @@ def select_vmm_cv(krange, precision, x, null_class, cv_index,
            number of iterations
     maxiter: int, optional,
     bias: array of shape (n), prior
+    n_jobs: int, optional,
+            number of processes over which the (k, fold, initialization)
+            triplets are distributed; -1 means all the CPUs
     """
+    krange = list(krange)
+    folds = np.unique(cv_index)
+    # one group of ninit fits per (k, training fold), plus one group of
+    # fits on the whole data per k
+    groups = []
+    for k in krange:
+        for i in folds:
+            bias_l = None
+            if bias is not None:
+                bias_l = bias[cv_index != i]
+            groups.append((k, x[cv_index != i], bias_l))
+        groups.append((k, x, bias))
+    tasks = [(k, precision, null_class, xl, bias_l, maxiter, seed)
+             for (k, xl, bias_l) in groups for seed in random_seeds(ninit)]
+    fits = parallel_map(_fit_vmm, tasks, n_jobs)
+    models = [_best_of(fits[g * ninit: (g + 1) * ninit])
+              for g in range(len(groups))]
+
     score = - np.inf
     mll = []
-    for k in krange:
-        mll.append( - np.inf)
-        for j in range(1):
-            ll = np.zeros_like(cv_index).astype(np.float)
-            for i in np.unique(cv_index):
-                xl = x[cv_index != i]
-                xt = x[cv_index == i]
-                bias_l = None
-                if bias is not None:
-                    bias_l = bias[cv_index != i]
-                aux = estimate_robust_vmm(k, precision, null_class, xl,
-                                          ninit=ninit, bias=bias_l,
-                                          maxiter=maxiter)
-                if bias is None:
-                    ll[cv_index == i] = np.log(aux.mixture_density(xt))
-                else:
-                    bias_t = bias[cv_index == i]
-                    lwd = aux.weighted_density(xt)
-                    ll[cv_index == i] = np.log(lwd[:, 0] * (1 - bias_t) +  \
-                        lwd[:, 1:].sum(1) * bias_t)
-            if ll.mean() > mll[-1]:
-                mll[-1] = ll.mean()
-
-        aux = estimate_robust_vmm(k, precision, null_class, x,
-                                  ninit, bias=bias, maxiter=maxiter)
+    for ik, k in enumerate(krange):
+        cv_models = models[ik * (len(folds) + 1): (ik + 1) * (len(folds) + 1)]
+        ll = np.zeros_like(cv_index).astype(np.float)
+        for i, aux in zip(folds, cv_models[:-1]):
+            xt = x[cv_index == i]
+            if bias is None:
+                ll[cv_index == i] = np.log(aux.mixture_density(xt))
+            else:
+                bias_t = bias[cv_index == i]
+                lwd = aux.weighted_density(xt)
+                ll[cv_index == i] = np.log(lwd[:, 0] * (1 - bias_t) +  \
+                    lwd[:, 1:].sum(1) * bias_t)
+        mll.append(ll.mean())
+        aux = cv_models[-1]
 
         if verbose:
             print(k, mll[ - 1])
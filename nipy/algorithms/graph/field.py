@@ -67,6 +67,29 @@ def field_from_graph_and_data(g, data):
     return ifield
 
 
+def _region_maxima(field, label, n_regions):
+    """ Return the first vertex of highest field value of each region
+
+    Parameters
+    ----------
+    field: array of shape (V),
+           the field values
+    label: array of shape (V),
+           the region of each vertex, -1 for unlabelled vertices
+    n_regions: int,
+               the number of regions, labelled 0..n_regions - 1
+
+    Returns
+    -------
+    idx: array of shape (n_regions),
+         idx[c] is the lowest index among the vertices of maximal field
+         value in region c, as np.ma.argmax would give
+    """
+    valid = np.nonzero(label > - 1)[0]
+    order = valid[np.lexsort((valid, - field[valid], label[valid]))]
+    return order[np.searchsorted(label[order], np.arange(n_regions))]
+
+
 class Field(WeightedGraph):
     """
     This is the basic field structure,
@@ -198,10 +221,16 @@ class Field(WeightedGraph):
         from scipy.sparse import dia_matrix
         refdim = int(refdim)
         # add self-edges to avoid singularities, when taking the maximum
-        adj = self.to_coo_matrix() + dia_matrix(
-            (np.ones(self.V), 0), (self.V, self.V))
-        rows = adj.tolil().rows
-        hneighb = np.array([row[self.field[row].argmax()] for row in rows])
+        adj = (self.to_coo_matrix() + dia_matrix(
+            (np.ones(self.V), 0), (self.V, self.V))).tocsr()
+        adj.sort_indices()
+        # the first neighbor reaching the maximum of its row
+        row = np.repeat(np.arange(self.V), np.diff(adj.indptr))
+        values = self.field[adj.indices, refdim]
+        row_max = np.maximum.reduceat(values, adj.indptr[:-1])
+        first = np.nonzero(values == row_max[row])[0]
+        first = first[np.searchsorted(row[first], np.arange(self.V))]
+        hneighb = adj.indices[first]
         return hneighb
 
     def erosion(self, nbiter=1):
@@ -321,8 +350,6 @@ class Field(WeightedGraph):
         label : array of shape (self.V)
               labelling of the vertices according to their bassin
         """
-        import numpy.ma as ma
-
         if (np.size(self.field) == 0):
             raise ValueError('No field has been defined so far')
         if self.field.shape[1] - 1 < refdim:
@@ -334,7 +361,7 @@ class Field(WeightedGraph):
         sf = self.subfield(self.field[:, refdim] >= th)
 
         # compute the basins
-        hneighb = sf.highest_neighbor()
+        hneighb = sf.highest_neighbor(refdim)
         edges = np.vstack((hneighb, np.arange(sf.V))).T
         edges = np.vstack((edges, np.vstack((np.arange(sf.V), hneighb)).T))
         aux = Graph(sf.V, edges.shape[0], edges)
@@ -343,9 +370,7 @@ class Field(WeightedGraph):
 
         # write all the depth values
         label[self.field[:, refdim] >= th] = llabel
-        idx = np.array([ma.array(
-                    self.field[:, refdim], mask=(label != c)).argmax()
-                        for c in range(n_bassins)])
+        idx = _region_maxima(self.field[:, refdim], label, n_bassins)
         return idx, label
 
     def threshold_bifurcations(self, refdim=0, th=NEGINF):
@@ -374,7 +399,6 @@ class Field(WeightedGraph):
         label: array of shape (self.V)
                a labelling of thevertices according to their bassin
         """
-        import numpy.ma as ma
         if (np.size(self.field) == 0):
             raise ValueError('No field has been defined so far')
         if self.field.shape[1] - 1 < refdim:
@@ -385,43 +409,47 @@ class Field(WeightedGraph):
         # create a subfield(thresholding)
         sf = self.subfield(self.field[:, refdim] >= th)
         initial_field = sf.field[:, refdim].copy()
-        sf.field = initial_field.copy()
 
-        # explore the subfield
+        # explore the subfield by decreasing values, maintaining the
+        # connected components of the explored vertices in a union-find
+        # structure (root) whose nodes are the regions
         order = np.argsort(- initial_field)
-        rows = sf.to_coo_matrix().tolil().rows
-        llabel = - np.ones(sf.V, np.int)
-        parent, root =  np.arange(2 * self.V), np.arange(2 * self.V)
+        adj = sf.to_coo_matrix().tocsr()
+        indptr, indices = adj.indptr.tolist(), adj.indices.tolist()
+        llabel = [- 1] * sf.V
+        parent, root = [], []
         # q will denote the region index
         q = 0
-        for i in order:
-            if (llabel[rows[i]] > - 1).any():
-                nlabel = np.unique(llabel[rows[i]])
-                if nlabel[0] == -1:
-                    nlabel = nlabel[1:]
-                nlabel = np.unique(root[nlabel])
-                if len(nlabel) == 1:
-                    # we are at a regular point
-                    llabel[i] = nlabel[0]
-                else:
-                    # we are at a saddle point
-                    llabel[i] = q
-                    parent[nlabel] = q
-                    root[nlabel] = q
-                    for j in nlabel:
-                        root[root == j] = q
-                    q += 1
-            else:
-                # this is a new component
-                llabel[i] = q
-                q += 1
-        parent = parent[:q]
+        for i in order.tolist():
+            nlabel = set()
+            for j in indices[indptr[i]: indptr[i + 1]]:
+                r = llabel[j]
+                if r > - 1:
+                    # find the current root of the region, and compress
+                    # the path towards it
+                    top = r
+                    while root[top] != top:
+                        top = root[top]
+                    while root[r] != top:
+                        root[r], r = top, root[r]
+                    nlabel.add(top)
+            if len(nlabel) == 1:
+                # we are at a regular point
+                llabel[i] = nlabel.pop()
+                continue
+            # this is a new component or a saddle point
+            llabel[i] = q
+            parent.append(q)
+            root.append(q)
+            for j in nlabel:
+                parent[j] = q
+                root[j] = q
+            q += 1
+        parent = np.array(parent, np.int)
 
         # write all the depth values
         label[self.field[:, refdim] >= th] = llabel
-        idx = np.array([ma.array(
-                    self.field[:, refdim], mask=(label != c)).argmax()
-                         for c in range(q)])
+        idx = _region_maxima(self.field[:, refdim], label, q)
         return idx, parent, label
 
     def constrained_voronoi(self, seed):
@@ -442,11 +470,47 @@ class Field(WeightedGraph):
         if np.size(self.field) == 0:
             raise ValueError('No field has been defined so far')
         seed = seed.astype(np.int)
+        label = self._field_distance_graph().voronoi_labelling(seed)
+        return label
+
+    def _field_distance_graph(self):
+        """ Return the graph of self weighted by field differences
+        """
         weights = np.sqrt(np.sum((self.field[self.edges.T[0]] -
                                   self.field[self.edges.T[1]]) ** 2, 1))
-        g = WeightedGraph(self.V, self.edges, weights)
-        label = g.voronoi_labelling(seed)
-        return label
+        return WeightedGraph(self.V, self.edges, weights)
+
+    def _closest_to_centroids(self, label, k):
+        """ Return the vertex closest to the field centroid of each region
+
+        Parameters
+        ----------
+        label: array of shape (self.V), the region of each vertex
+               (-1 for unlabelled vertices)
+        k: int, the number of regions
+
+        Returns
+        -------
+        seeds: array of shape (k), the first vertex of each region
+               that minimizes the distance to the region centroid
+        inertia: float, the sum of squared distances to the centroids
+
+        Raises
+        ------
+        ValueError: if one of the regions is empty
+        """
+        valid = np.nonzero(label > - 1)[0]
+        lv = label[valid]
+        count = np.bincount(lv, minlength=k).astype(np.float)
+        if (count == 0).any():
+            raise ValueError('empty region, cannot proceed')
+        cent = np.array([np.bincount(lv, self.field[valid, d], minlength=k)
+                         for d in range(self.field.shape[1])]).T
+        cent /= count[:, np.newaxis]
+        sqdist = np.sum((cent[lv] - self.field[valid]) ** 2, 1)
+        order = np.lexsort((valid, sqdist, lv))
+        seeds = valid[order][np.searchsorted(lv[order], np.arange(k))]
+        return seeds, sqdist.sum()
 
     def geodesic_kmeans(self, seeds=None, label=None, maxiter=100, eps=1.e-4,
                         verbose=0):
@@ -487,34 +551,29 @@ class Field(WeightedGraph):
             k = label.max() + 1
             if np.size(np.unique(label)) != k:
                 raise ValueError('missing values, cannot proceed')
-            seeds = np.zeros(k).astype(np.int)
-            for  j in range(k):
-                lj = np.nonzero(label == j)[0]
-                cent = np.mean(self.field[lj], 0)
-                tj = np.argmin(np.sum((cent - self.field[lj]) ** 2, 1))
-                seeds[j] = lj[tj]
+            seeds, _ = self._closest_to_centroids(label, k)
         else:
             k = np.size(seeds)
+            seeds = np.asarray(seeds).astype(np.int)
 
+        # the field distances do not change across iterations
+        graph = self._field_distance_graph()
         for i in range(maxiter):
             # voronoi labelling
-            label = self.constrained_voronoi(seeds)
+            label = graph.voronoi_labelling(seeds)
             # update the seeds
-            inertia = 0
-            pinteria = 0
-            for  j in range(k):
-                lj = np.nonzero(label == j)[0]
-                pinteria += np.sum(
-                    (self.field[seeds[j]] - self.field[lj]) ** 2)
-                cent = np.mean(self.field[lj], 0)
-                tj = np.argmin(np.sum((cent - self.field[lj]) ** 2, 1))
-                seeds[j] = lj[tj]
-                inertia += np.sum((cent - self.field[lj]) ** 2)
+            new_seeds, inertia = self._closest_to_centroids(label, k)
             if verbose:
                 print(i, inertia)
             if np.absolute(inertia_old - inertia) < eps:
+                seeds = new_seeds
                 break
             inertia_old = inertia
+            # unmoved seeds give the same labelling, hence the same seeds
+            # and inertia: the next iteration would declare convergence
+            if (new_seeds == seeds).all():
+                break
+            seeds = new_seeds
         return seeds, label, inertia
 
     def ward(self, nbcluster):
@@ -152,7 +152,7 @@ class Forest(WeightedGraph):
         if self.children == []:
             self.compute_children()
         if len(self.children[v]) == 0:
-            return [v]
+            return [] if exclude_self else [v]
         else:
             desc = [v]
             for w in self.children[v]:
@@ -173,25 +173,17 @@ class Forest(WeightedGraph):
 
         Notes
         -----
-        Slow implementation, might be rewritten in C or cython
+        The ancestors are followed by pointer doubling: after log2(V) steps
+        each vertex has reached its root, unless it lies on a loop
         """
         b = 1
         if self.V == 1:
             return b
-        for v in range(self.V):
-            w = v
-            q = 0
-            while(self.parents[w] != w):
-                w = self.parents[w]
-                if w == v:
-                    b = 0
-                    break
-                q += 1
-                if q > self.V:
-                    b = 0
-                    break
-            if b == 0:
-                break
+        w = np.asarray(self.parents)
+        for _ in range(int(np.ceil(np.log2(self.V))) + 1):
+            w = w[w]
+        if (self.parents[w] != w).any():
+            b = 0
         return b
 
     def isleaf(self):
@@ -22,9 +22,11 @@ Author: Bertrand Thirion, 2006--2011
 """
 from __future__ import absolute_import
 
+from collections import deque
+
 import numpy as np
 
-from scipy.sparse import coo_matrix
+from scipy.sparse import coo_matrix, csr_matrix
 
 class Graph(object):
     """ Basic topological (non-weighted) directed Graph class
@@ -155,12 +157,11 @@ class Graph(object):
         label: array of shape(self.V), labelling of the vertices
         """
         try:
-            from scipy.sparse import cs_graph_components
-            _, label = cs_graph_components(self.adjacency())
-        except:
-            pass
-        lil = self.to_coo_matrix().tolil().rows.tolist()
-        label = lil_cc(lil)
+            from scipy.sparse.csgraph import connected_components
+        except ImportError:
+            lil = self.to_coo_matrix().tolil().rows.tolist()
+            return lil_cc(lil)
+        _, label = connected_components(self.to_coo_matrix(), directed=False)
         return label
 
     def degrees(self):
@@ -432,13 +433,13 @@ def lil_cc(lil):
     label = - np.ones(n).astype(np.int)
     k = 0
     while (visited == 0).any():
-        front = [np.argmin(visited)]
+        front = deque([np.argmin(visited)])
         while len(front) > 0:
-            pivot = front.pop(0)
+            pivot = front.popleft()
             if visited[pivot] == 0:
                 visited[pivot] = 1
                 label[pivot] = k
-                front += lil[pivot]
+                front.extend(lil[pivot])
         k += 1
     return label
 
@@ -896,6 +897,9 @@ x
                 raise ValueError('some weights are non-positive')
         except:
             raise ValueError('undefined weights')
+        label = self._csgraph_voronoi_labelling(seed)
+        if label is not None:
+            return label
         dist, active = np.inf * np.ones(self.V), np.ones(self.V)
         label = - np.ones(self.V, np.int)
         idx, neighb, weight = self.compact_neighb()
@@ -925,6 +929,45 @@ x
                     label[l] = label[win]
         return label
 
+    def _csgraph_voronoi_labelling(self, seed):
+        """ Voronoi labelling with the compiled multi-source Dijkstra of
+        scipy.sparse.csgraph
+
+        Returns None when this scipy does not provide it (scipy < 1.3),
+        in which case voronoi_labelling falls back to its own loop.
+        Vertices at equal distance from several seeds may be attributed
+        differently than by that loop.
+        """
+        try:
+            from scipy.sparse.csgraph import dijkstra
+        except ImportError:
+            return None
+        seed = np.asarray(seed, np.int)
+        label = - np.ones(self.V, np.int)
+        if self.E == 0:
+            label[seed] = np.arange(len(seed))
+            return label
+        # zero weights remain edges as explicit entries of the csr matrix
+        i, j = self.edges.T
+        adj = csr_matrix((self.weights, (i, j)), shape=(self.V, self.V))
+        if adj.nnz < self.E:
+            # duplicated edges have been summed: keep the lightest instead
+            order = np.lexsort((self.weights, j, i))
+            i, j, weights = i[order], j[order], self.weights[order]
+            first = np.hstack((True, (i[1:] != i[:-1]) | (j[1:] != j[:-1])))
+            adj = csr_matrix((weights[first], (i[first], j[first])),
+                             shape=(self.V, self.V))
+        try:
+            _, _, sources = dijkstra(adj, indices=seed, min_only=True,
+                                     return_predecessors=True)
+        except TypeError:
+            return None
+        position = np.zeros(self.V, np.int)
+        position[seed] = np.arange(len(seed))
+        reached = sources > - 1
+        label[reached] = position[sources[reached]]
+        return label
+
     def cliques(self):
         """ Extraction of the graphe cliques
         these are defined using replicator dynamics equations
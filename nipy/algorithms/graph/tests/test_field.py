@@ -5,9 +5,9 @@ import numpy.random as nr
 
 from ..field import (field_from_coo_matrix_and_data,
                      field_from_graph_and_data)
-from ..graph import wgraph_from_3d_grid
+from ..graph import wgraph_from_3d_grid, WeightedGraph
 
-from nose.tools import assert_true, assert_equal
+from nose.tools import assert_true, assert_equal, assert_raises
 
 from numpy.testing import assert_array_equal
 
@@ -228,6 +228,35 @@ def test_bifurcations_2():
     assert_true(np.size(idx) == 15)
 
 
+def test_bifurcations_chain():
+    # two peaks on a chain, merged at the saddle point of value 1
+    data = np.array([0., 3., 1., 1.5, 2., 4.])
+    edges = np.array([[0, 1], [1, 2], [2, 3], [3, 4], [4, 5]])
+    edges = np.vstack((edges, edges[:, ::-1]))
+    myfield = field_from_graph_and_data(
+        WeightedGraph(6, edges, np.ones(10)), data)
+    idx, parent, label = myfield.threshold_bifurcations()
+    assert_array_equal(idx, [5, 1, 2])
+    assert_array_equal(parent, [2, 2, 2])
+    assert_array_equal(label, [2, 1, 2, 0, 0, 0])
+    idx, parent, label = myfield.threshold_bifurcations(th=1.2)
+    assert_array_equal(idx, [5, 1])
+    assert_array_equal(parent, [0, 1])
+    assert_array_equal(label, [-1, 1, -1, 0, 0, 0])
+
+
+def test_highest_neighbor_ties():
+    data = np.array([1., 2., 2., 0.])
+    edges = np.array([[0, 1], [0, 2], [1, 3], [2, 3]])
+    edges = np.vstack((edges, edges[:, ::-1]))
+    myfield = field_from_graph_and_data(
+        WeightedGraph(4, edges, np.ones(8)), data)
+    assert_array_equal(myfield.highest_neighbor(), [1, 1, 2, 1])
+    idx, label = myfield.custom_watershed()
+    assert_array_equal(idx, [1, 2])
+    assert_array_equal(label, [0, 0, 1, 0])
+
+
 
 def test_geodesic_kmeans(nbseeds=3):
     # Test the geodisc k-means algorithm
@@ -239,6 +268,26 @@ def test_geodesic_kmeans(nbseeds=3):
                           for i in np.arange(nbseeds)]).all())
 
 
+def test_geodesic_kmeans_seeds():
+    # the seeds are the vertices closest to the centroids of their cluster
+    myfield = basic_field_random(5, 5, 1)
+    label = (np.arange(myfield.V) >= 12).astype(np.int)
+    seeds, label, inertia = myfield.geodesic_kmeans(label=label)
+    ref_inertia = 0
+    for j, seed in enumerate(seeds):
+        field_j = myfield.field[label == j]
+        dist = np.sum((field_j - field_j.mean(0)) ** 2, 1)
+        assert_equal(seed, np.nonzero(label == j)[0][np.argmin(dist)])
+        ref_inertia += dist.sum()
+    assert_true(np.absolute(inertia - ref_inertia) < 1.e-10)
+
+
+def test_geodesic_kmeans_duplicate_seeds():
+    # a duplicated seed leaves a region empty
+    myfield = basic_field_random(6, 6, 1)
+    assert_raises(ValueError, myfield.geodesic_kmeans, [0, 0, 20])
+
+
 def test_constrained_voronoi(nbseeds=3):
     # Test the geodisc k-means algorithm
     myfield = basic_field_random()
@@ -18,6 +18,17 @@ def test_forest():
     assert F.E == 8
     assert F.cc().max() == 0
 
+def test_forest_loop():
+    """ test that loops are detected
+    """
+    assert Forest(5, np.array([2, 2, 4, 4, 4])).check() == 1
+    F = simple_forest()
+    F.parents = np.array([2, 2, 3, 2, 4])
+    assert F.check() == 0
+    F.parents = np.array([1, 2, 3, 4, 0])
+    assert F.check() == 0
+
+
 def test_forest_trivial():
     """ test creation of forest object
     """
@@ -45,6 +56,8 @@ def test_descendants():
     assert sf.get_descendants(1) == [1]
     assert sf.get_descendants(2) == [0, 1, 2]
     assert sf.get_descendants(4) == [0, 1, 2, 3, 4]
+    assert sf.get_descendants(0, exclude_self=True) == []
+    assert sf.get_descendants(2, exclude_self=True) == [0, 1]
     
 def test_root():
     """ test the isroot() method
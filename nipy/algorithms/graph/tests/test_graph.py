@@ -378,6 +378,17 @@ def test_voronoi3():
     label = G.voronoi_labelling(seed)
     assert_equal(label[4], - 1)
 
+
+def test_voronoi4():
+    """ test voronoi labelling with duplicated and zero-weight edges
+    """
+    edges = np.array([[0, 1], [0, 1], [1, 2], [2, 3]])
+    edges = np.vstack((edges, edges[:, ::-1]))
+    weights = np.array([3., 1., 0., 2.5, 3., 1., 0., 2.5])
+    G = WeightedGraph(4, edges, weights)
+    label = G.voronoi_labelling(np.array([0, 3]))
+    assert_array_equal(label, [0, 0, 0, 1])
+
 def test_concatenate1(n=10):
     x1 = nr.randn(n, 2) 
     x2 = nr.randn(n, 2) 
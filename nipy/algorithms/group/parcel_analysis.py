@@ -24,7 +24,8 @@ import warnings
 import numpy as np
 import scipy.ndimage as nd
 import scipy.stats as ss
-from ..statistics.bayesian_mixed_effects import two_level_glm
+from ..statistics.bayesian_mixed_effects import (two_level_glm,
+                                                 ragged_two_level_glm)
 from ..statistics.histogram import histogram
 from ..registration import resample
 from ..kernel_smooth import fwhm2sigma
@@ -335,29 +336,38 @@ class ParcelAnalysis(object):
         variational Bayes algorithm.
         """
         parcel_masked = self.parcel[self.msk]
-        values = np.where(histogram(parcel_masked) > 0)[0][1:]
+        counts = histogram(parcel_masked).astype(int)
+        values = np.where(counts > 0)[0]
+        values = values[values > 0]
+        sizes = counts[values]
 
+        # Sort the voxels by parcel once, leaving out the background
+        order = np.argsort(parcel_masked, kind='mergesort')[counts[0]:]
+
+        # Parcel-level parameters of all parcels at once, using a mfx
+        # model. Single-voxel parcels cannot be fitted.
         prob = np.zeros(len(values))
         mu = np.zeros(len(values))
         s2 = np.zeros(len(values))
         dof = np.zeros(len(values))
-        labels = []
-
-        # For each parcel, estimate parcel-level parameters using a
-        # mxf model
-        for i in range(len(values)):
-            mask = parcel_masked == values[i]
-            y = self.beta[mask]
-            vy = self.vbeta[mask]
-            npts = y.size
-            try:
-                mu[i], s2[i], dof[i] = two_level_glm(y, vy, np.ones(npts))
-                prob[i] = ss.t.cdf(float(mu[i] / np.sqrt(s2[i] / npts)),
-                                   dof[i])
-            except:
-                prob[i] = 0
-            idx = int(np.where(self._parcel_values == values[i])[0])
-            labels += [self._parcel_labels[idx]]
+        fit = sizes > 1
+        if fit.any():
+            fit_vox = np.repeat(fit, sizes)
+            mu[fit], s2[fit], dof[fit] = ragged_two_level_glm(
+                self.beta[order][fit_vox], self.vbeta[order][fit_vox],
+                sizes[fit])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                prob[fit] = ss.t.cdf(
+                    mu[fit] / np.sqrt(s2[fit] / sizes[fit]), dof[fit])
+
+        # Labels of the parcels
+        sort_values = np.argsort(self._parcel_values, kind='mergesort')
+        idx = sort_values[np.minimum(
+                np.searchsorted(self._parcel_values[sort_values], values),
+                len(sort_values) - 1)]
+        if not (self._parcel_values[idx] == values).all():
+            raise ValueError('Parcel values missing from `parcel_info`')
+        labels = self._parcel_labels[idx]
 
         # Sort labels by ascending order of mean values
         I = np.argsort(-mu)
@@ -439,13 +449,14 @@ class ParcelAnalysis(object):
         else:
             parcel = self.parcel
             affine = self.affine
-        pmap_prob = np.zeros(parcel.shape)
-        pmap_mu = np.zeros(parcel.shape)
-        for label, prob, mu in zip(self.parcel_values,
-                                    self.parcel_prob,
-                                    self.parcel_mu):
-            pmap_prob[parcel == label] = prob
-            pmap_mu[parcel == label] = mu
+        # look-up tables from parcel values to parcel results
+        size = int(np.hstack((parcel.max(), self.parcel_values)).max()) + 1
+        lut_prob = np.zeros(size)
+        lut_mu = np.zeros(size)
+        lut_prob[self.parcel_values] = self.parcel_prob
+        lut_mu[self.parcel_values] = self.parcel_mu
+        pmap_prob = lut_prob[parcel]
+        pmap_mu = lut_mu[parcel]
 
         pmap_prob_img = make_xyz_image(pmap_prob, affine, self.reference)
         pmap_mu_img = make_xyz_image(pmap_mu, affine, self.reference)
@@ -101,6 +101,23 @@ def test_parcel_analysis_nosmooth():
     assert v_error < .1
 
 
+def test_parcel_analysis_values():
+    # all nonzero parcels are analyzed, including single-voxel ones
+    con_imgs, parcel_img = make_fake_data()
+    parcel = parcel_img.get_data().copy()
+    parcel[0, 0, 0] = NLABELS
+    parcel_img = make_xyz_image(parcel, AFFINE, 'talairach')
+    g = ParcelAnalysis(con_imgs, parcel_img, fwhm=0)
+    assert_array_equal(np.sort(g.parcel_values), np.arange(1, NLABELS + 1))
+    assert_equal(g.parcel_prob[g.parcel_values == NLABELS], 0)
+    assert_array_equal(g.parcel_labels.astype(int), g.parcel_values)
+    # results sorted by decreasing mean values
+    assert (np.diff(g.parcel_mu) <= 0).all()
+    mu_img, prob_img = g.parcel_maps()
+    for value, mu in zip(g.parcel_values, g.parcel_mu):
+        assert_array_equal(mu_img.get_data()[parcel == value], mu)
+
+
 def _test_parcel_analysis_error(**kw):
     con_imgs, parcel_img = make_fake_data()
     return ParcelAnalysis(con_imgs, parcel_img, **kw)
@@ -6,23 +6,25 @@ Markov random field utils.
 Author: Alexis Roche, 2010.
 """
 
-__version__ = '0.2'
+__version__ = '0.3'
 
 # Set symbol for array_import; must come before cimport numpy
 cdef extern from "_segmentation.h":
     int PY_ARRAY_UNIQUE_SYMBOL
 
 # Includes
-from numpy cimport import_array, ndarray
+from numpy cimport import_array, ndarray, npy_intp, PyArrayObject
 
 # Externals
 cdef extern from "mrf.h":
-    void ve_step(ndarray ppm, 
-                 ndarray ref,
-                 ndarray XYZ, 
-                 ndarray U,
+    void ve_step(PyArrayObject* ppm, 
+                 PyArrayObject* ref,
+                 PyArrayObject* XYZ, 
+                 PyArrayObject* U,
                  int ngb_size, 
-                 double beta)
+                 double beta,
+                 npy_intp* points,
+                 npy_intp npoints) nogil
     ndarray make_edges(ndarray mask,
                        int ngb_size)
     double interaction_energy(ndarray ppm, 
@@ -38,10 +40,22 @@ import numpy as np
 
 
 
-def _ve_step(ppm, ref, XYZ, U, int ngb_size, double beta):
+def _ve_step(ppm, ref, XYZ, U, int ngb_size, double beta, points=None):
+    """ Update the ppm at the voxels XYZ, or at XYZ[points] in that order
 
-    if not ppm.flags['C_CONTIGUOUS'] or not ppm.dtype=='double':
-        raise ValueError('ppm array should be double C-contiguous')
+    The GIL is released during the update, so that sets of voxels that
+    are not neighbors of one another can be updated from several
+    threads.
+    """
+    cdef PyArrayObject *ppm_p, *ref_p, *XYZ_p, *U_p
+    cdef npy_intp* points_p = NULL
+    cdef npy_intp npoints = 0
+    cdef ndarray points_arr
+
+    if not ppm.flags['C_CONTIGUOUS'] or \
+            not ppm.dtype in ('double', 'float32'):
+        raise ValueError('ppm array should be double or float32 '
+                         'C-contiguous')
     if not ref.flags['C_CONTIGUOUS'] or not ref.dtype=='double':
         raise ValueError('ref array should be double C-contiguous')
     if not XYZ.flags['C_CONTIGUOUS'] or not XYZ.dtype=='intp':
@@ -52,9 +66,19 @@ def _ve_step(ppm, ref, XYZ, U, int ngb_size, double beta):
         raise ValueError('U array should be double C-contiguous')
     if not ppm.shape[-1] == ref.shape[-1]:
         raise ValueError('Inconsistent shapes for ppm and ref arrays')
-
-    ve_step(<ndarray>ppm, <ndarray>ref, <ndarray>XYZ, <ndarray>U, 
-             ngb_size, beta)
+    if points is not None:
+        if not points.flags['C_CONTIGUOUS'] or not points.dtype=='intp':
+            raise ValueError('points array should be intp C-contiguous')
+        points_arr = points
+        points_p = <npy_intp*>points_arr.data
+        npoints = points_arr.shape[0]
+
+    ppm_p = <PyArrayObject*>ppm
+    ref_p = <PyArrayObject*>ref
+    XYZ_p = <PyArrayObject*>XYZ
+    U_p = <PyArrayObject*>U
+    with nogil:
+        ve_step(ppm_p, ref_p, XYZ_p, U_p, ngb_size, beta, points_p, npoints)
     return ppm 
 
 
@@ -68,8 +92,10 @@ def _make_edges(mask, int ngb_size):
 
 def _interaction_energy(ppm, XYZ, U, int ngb_size):
 
-    if not ppm.flags['C_CONTIGUOUS'] or not ppm.dtype=='double':
-        raise ValueError('ppm array should be double C-contiguous')
+    if not ppm.flags['C_CONTIGUOUS'] or \
+            not ppm.dtype in ('double', 'float32'):
+        raise ValueError('ppm array should be double or float32 '
+                         'C-contiguous')
     if not XYZ.flags['C_CONTIGUOUS'] or not XYZ.dtype=='intp':
         raise ValueError('XYZ array should be intp C-contiguous')
     if not XYZ.shape[1] == 3: 
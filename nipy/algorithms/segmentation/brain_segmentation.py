@@ -24,7 +24,7 @@ class BrainT1Segmentation(object):
     def __init__(self, data, mask=None, model='3k',
                  niters=25, ngb_size=6, beta=0.5,
                  ref_params=None, init_params=None,
-                 convert=True):
+                 convert=True, ppm_dtype='double', n_jobs=1):
 
         self.labels = ('CSF', 'GM', 'WM')
         self.data = data
@@ -57,6 +57,8 @@ class BrainT1Segmentation(object):
         self.niters = int(niters)
         self.beta = float(beta)
         self.ngb_size = int(ngb_size)
+        self.ppm_dtype = ppm_dtype
+        self.n_jobs = n_jobs
 
         # Class parameter initialization
         if init_params is None:
@@ -103,7 +105,8 @@ class BrainT1Segmentation(object):
     def _run(self):
         S = Segmentation(self.data, mask=self.mask,
                          mu=self.init_mu, sigma=self.init_sigma,
-                         ngb_size=self.ngb_size, beta=self.beta)
+                         ngb_size=self.ngb_size, beta=self.beta,
+                         ppm_dtype=self.ppm_dtype, n_jobs=self.n_jobs)
         S.run(niters=self.niters)
         self.mu = S.mu
         self.sigma = S.sigma
@@ -65,7 +65,7 @@ static int* _select_neighborhood_system(int ngb_size) {
   Compute exp[-2 * beta * SUM_j (U * qj)] for a given voxel, where the
   sum is on the neighbors.
 
-  ppm assumed C-contiguous double (X, Y, Z, K) 
+  ppm assumed C-contiguous double or float (X, Y, Z, K) 
   ref assumed C-contiguous double (NPTS, K)
   XYZ assumed C-contiguous npy_intp (NPTS, 3)
 */
@@ -73,8 +73,12 @@ static int* _select_neighborhood_system(int ngb_size) {
 #define TINY 1e-300
 
 /* Compute neighborhood 'agreement' term required by the VE-step at a
-particular voxel */
+particular voxel. Since the agreement is linear in the neighbors'
+posteriors, these are summed first and multiplied by U once. `buf` is
+a work array of size K. Neighbors outside the grid boundaries are
+ignored. */
 static void _ngb_integrate(double* res,
+			   double* buf,
 			   const PyArrayObject* ppm,
 			   npy_intp x,
 			   npy_intp y, 
@@ -85,107 +89,125 @@ static void _ngb_integrate(double* res,
 {
   npy_intp xn, yn, zn, pos, ngb_idx, k, kk;
   const int* buf_ngb;
-  const double* ppm_data = (double*)ppm->data; 
-  double *buf, *buf_ppm, *q, *buf_U;
+  const double* buf_U;
+  const double *q; 
+  const float *qf; 
+  int is_float = (PyArray_TYPE(ppm) == NPY_FLOAT); 
   npy_intp K = ppm->dimensions[3]; 
   npy_intp u2 = ppm->dimensions[2]*K; 
   npy_intp u1 = ppm->dimensions[1]*u2;
-  npy_intp posmax = ppm->dimensions[0]*u1 - K;
 
-  /*  Re-initialize output array */
-  memset((void*)res, 0, K*sizeof(double));
+  /*  Re-initialize work array */
+  memset((void*)buf, 0, K*sizeof(double));
 
-  /* Loop over neighbors */
+  /* Sum the posteriors of the neighbors */
   buf_ngb = ngb; 
-  for (ngb_idx=0; ngb_idx<ngb_size; ngb_idx++) {
-    xn = x + *buf_ngb; buf_ngb++; 
-    yn = y + *buf_ngb; buf_ngb++;
-    zn = z + *buf_ngb; buf_ngb++;
-    pos = xn*u1 + yn*u2 + zn*K;
-
-    /* Ignore neighbor if outside the grid boundaries */
-    if ((pos < 0) || (pos > posmax))
+  for (ngb_idx=0; ngb_idx<ngb_size; ngb_idx++, buf_ngb+=3) {
+    xn = x + buf_ngb[0]; 
+    yn = y + buf_ngb[1];
+    zn = z + buf_ngb[2];
+    if ((xn < 0) || (xn >= ppm->dimensions[0]) ||
+	(yn < 0) || (yn >= ppm->dimensions[1]) ||
+	(zn < 0) || (zn >= ppm->dimensions[2]))
       continue; 
+    pos = xn*u1 + yn*u2 + zn*K;
+    if (is_float) 
+      for (k=0, qf=(float*)ppm->data + pos; k<K; k++)
+	buf[k] += qf[k];
+    else 
+      for (k=0, q=(double*)ppm->data + pos; k<K; k++)
+	buf[k] += q[k];
+  }
 
-    /* Compute U*q */
-    buf_ppm = (double*)ppm_data + pos;
-    for (k=0, buf=res, buf_U=(double*)U; k<K; k++, buf++)
-      for (kk=0, q=buf_ppm; kk<K; kk++, q++, buf_U++)
-	*buf += *buf_U * *q;
+  /* Compute U*q */
+  for (k=0, buf_U=U; k<K; k++) {
+    res[k] = 0.0; 
+    for (kk=0; kk<K; kk++, buf_U++)
+      res[k] += *buf_U * buf[kk];
   }
 
   return; 
 }
 
 
+/* 
+   Update the voxels of index `points[0]`, ..., `points[npoints-1]`
+   in XYZ, in that order, or all voxels of XYZ in turn if `points` is
+   NULL. As no Python API function is called, the GIL may be released
+   while this runs, and disjoint sets of voxels that are not
+   neighbors of one another may be updated concurrently.
+*/
 void ve_step(PyArrayObject* ppm, 
 	     const PyArrayObject* ref,
 	     const PyArrayObject* XYZ, 
 	     const PyArrayObject* U,
 	     int ngb_size,
-	     double beta)
+	     double beta,
+	     const npy_intp* points,
+	     npy_intp npoints)
 
 {
-  npy_intp k, x, y, z, pos;
-  double *p, *buf, *ppm_data;
+  npy_intp i, idx, k, x, y, z, pos;
+  double *p, *buf, *work;
   double psum, tmp;  
-  PyArrayIterObject* iter;
-  int axis = 1; 
+  int is_float = (PyArray_TYPE(ppm) == NPY_FLOAT); 
   npy_intp K = ppm->dimensions[3]; 
   npy_intp u2 = ppm->dimensions[2]*K; 
   npy_intp u1 = ppm->dimensions[1]*u2;
   const double* ref_data = (double*)ref->data;
   const double* U_data = (double*)U->data;
-  npy_intp* xyz;
+  const npy_intp* xyz;
   int* ngb;
 
   /* Neighborhood system */
   ngb = _select_neighborhood_system(ngb_size);
 
-  /* Pointer to the data array */
-  ppm_data = (double*)ppm->data;
-  
   /* Allocate auxiliary vectors */
   p = (double*)calloc(K, sizeof(double)); 
+  work = (double*)calloc(K, sizeof(double)); 
 
   /* Loop over points */ 
-  iter = (PyArrayIterObject*)PyArray_IterAllButAxis((PyObject*)XYZ, &axis);
+  if (points == NULL)
+    npoints = XYZ->dimensions[0]; 
 
-  while(iter->index < iter->size) {
+  for (i=0; i<npoints; i++) {
 
     /* Integrate the energy over the neighborhood */
-    xyz = PyArray_ITER_DATA(iter);
+    idx = (points == NULL) ? i : points[i]; 
+    xyz = (npy_intp*)XYZ->data + 3*idx;
     x = xyz[0];
     y = xyz[1];
     z = xyz[2];
-    _ngb_integrate(p, ppm, x, y, z, U_data, (const int*)ngb, ngb_size);
+    _ngb_integrate(p, work, ppm, x, y, z, U_data, (const int*)ngb, ngb_size);
 
     /* Apply exponential transform, multiply with reference and
        compute normalization constant */
     psum = 0.0;
-    for (k=0, pos=(iter->index)*K, buf=p; k<K; k++, pos++, buf++) {
+    for (k=0, pos=idx*K, buf=p; k<K; k++, pos++, buf++) {
       tmp = exp(-2 * beta * (*buf)) * ref_data[pos];
       psum += tmp;
       *buf = tmp;
     }
     
     /* Normalize to unitary sum */
-    pos = x*u1 + y*u2 + z*K; 
     if (psum > TINY) 
+      for (k=0, buf=p; k<K; k++, buf++)
+	*buf /= psum; 
+    else
+      for (k=0, buf=p; k<K; k++, buf++)
+	*buf = (*buf+TINY/(double)K)/(psum+TINY); 
+    pos = x*u1 + y*u2 + z*K; 
+    if (is_float)
       for (k=0, buf=p; k<K; k++, pos++, buf++)
-	ppm_data[pos] = *buf/psum; 
+	((float*)ppm->data)[pos] = (float)*buf; 
     else
       for (k=0, buf=p; k<K; k++, pos++, buf++)
-	ppm_data[pos] = (*buf+TINY/(double)K)/(psum+TINY); 
-
-    /* Update iterator */ 
-    PyArray_ITER_NEXT(iter); 
-  
+	((double*)ppm->data)[pos] = *buf; 
   }
 
   /* Free memory */ 
   free(p);
-  Py_XDECREF(iter);
+  free(work);
 
   return; 
 }
@@ -305,56 +327,52 @@ double interaction_energy(PyArrayObject* ppm,
 			  int ngb_size)
 
 {
-  npy_intp k, x, y, z, pos;
-  double *p, *buf;
+  npy_intp i, k, x, y, z, pos;
+  double *p, *buf, *work;
   double res = 0.0, tmp;  
-  PyArrayIterObject* iter;
-  int axis = 1; 
-  double* ppm_data;
+  int is_float = (PyArray_TYPE(ppm) == NPY_FLOAT); 
   npy_intp K = ppm->dimensions[3]; 
   npy_intp u2 = ppm->dimensions[2]*K; 
   npy_intp u1 = ppm->dimensions[1]*u2;
-  npy_intp* xyz; 
+  const npy_intp* xyz; 
   const double* U_data = (double*)U->data;
   int* ngb;
 
   /* Neighborhood system */
   ngb = _select_neighborhood_system(ngb_size);
 
-  /* Pointer to ppm array */
-  ppm_data = (double*)ppm->data;
-
-  /* Allocate auxiliary vector */
+  /* Allocate auxiliary vectors */
   p = (double*)calloc(K, sizeof(double)); 
+  work = (double*)calloc(K, sizeof(double)); 
   
   /* Loop over points */ 
-  iter = (PyArrayIterObject*)PyArray_IterAllButAxis((PyObject*)XYZ, &axis);
-  while(iter->index < iter->size) {
+  for (i=0; i<XYZ->dimensions[0]; i++) {
     
     /* Compute the average ppm in the neighborhood */ 
-    xyz = PyArray_ITER_DATA(iter); 
+    xyz = (npy_intp*)XYZ->data + 3*i; 
     x = xyz[0];
     y = xyz[1];
     z = xyz[2];
-    _ngb_integrate(p, ppm, x, y, z, U_data, (const int*)ngb, ngb_size);
+    _ngb_integrate(p, work, ppm, x, y, z, U_data, (const int*)ngb, ngb_size);
     
     /* Calculate the dot product qi^T p where qi is the local
        posterior */
     tmp = 0.0; 
     pos = x*u1 + y*u2 + z*K; 
-    for (k=0, buf=p; k<K; k++, pos++, buf++)
-      tmp += ppm_data[pos]*(*buf);
+    if (is_float)
+      for (k=0, buf=p; k<K; k++, pos++, buf++)
+	tmp += ((float*)ppm->data)[pos]*(*buf);
+    else
+      for (k=0, buf=p; k<K; k++, pos++, buf++)
+	tmp += ((double*)ppm->data)[pos]*(*buf);
 
     /* Update overall energy */ 
     res += tmp; 
-
-    /* Update iterator */ 
-    PyArray_ITER_NEXT(iter); 
   }
 
   /* Free memory */ 
   free(p);
-  Py_XDECREF(iter);
+  free(work);
 
   return res; 
 }
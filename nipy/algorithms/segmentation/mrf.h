@@ -21,7 +21,9 @@ extern "C" {
 		      const PyArrayObject* XYZ, 
 		      const PyArrayObject* U, 
 		      int ngb_size,
-		      double beta);
+		      double beta,
+		      const npy_intp* points,
+		      npy_intp npoints);
 
   extern PyArrayObject* make_edges(const PyArrayObject* mask,
 				   int ngb_size);
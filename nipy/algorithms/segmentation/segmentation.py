@@ -2,6 +2,8 @@ from __future__ import absolute_import
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 import numpy as np
+
+from ...utils.parallel import effective_n_jobs, parallel_map
 from ._segmentation import _ve_step, _interaction_energy
 
 NITERS = 10
@@ -10,13 +12,15 @@ BETA = 0.1
 
 nonzero = lambda x: np.maximum(x, 1e-50)
 log = lambda x: np.log(nonzero(x))
+PPM_DTYPES = ('double', 'float32')
 
 
 class Segmentation(object):
 
     def __init__(self, data, mask=None, mu=None, sigma=None,
                  ppm=None, prior=None, U=None,
-                 ngb_size=NGB_SIZE, beta=BETA):
+                 ngb_size=NGB_SIZE, beta=BETA, ppm_dtype='double',
+                 n_jobs=1):
         """
         Class for multichannel Markov random field image segmentation
         using the variational EM algorithm. For details regarding the
@@ -42,6 +46,17 @@ class Segmentation(object):
 
         sigma : array-like
           Initial class-specific variances
+
+        ppm_dtype : str
+          Data type of the posterior probability map, either 'double'
+          or 'float32'. The latter halves the memory footprint of the
+          segmentation of large images.
+
+        n_jobs : int
+          Number of threads sharing the VE-step, see
+          nipy.utils.parallel. Voxels are updated by sets of voxels
+          that are not neighbors of one another (checkerboard
+          scheme), so that the result does not depend on n_jobs.
         """
         data = data.squeeze()
         if not len(data.shape) in (3, 4):
@@ -74,9 +89,11 @@ class Segmentation(object):
 
         # By default, the ppm is initialized as a collection of
         # uniform distributions
+        if not np.dtype(ppm_dtype) in [np.dtype(d) for d in PPM_DTYPES]:
+            raise ValueError('ppm_dtype should be one of %s' % (PPM_DTYPES,))
         if ppm is None:
             nclasses = len(mu)
-            self.ppm = np.zeros(list(space_shape) + [nclasses])
+            self.ppm = np.zeros(list(space_shape) + [nclasses], ppm_dtype)
             self.ppm[mask] = 1. / nclasses
             self.is_ppm = False
             self.mu = np.array(mu, dtype='double').reshape(\
@@ -85,7 +102,7 @@ class Segmentation(object):
                 (nclasses, nchannels, nchannels))
         elif mu is None:
             nclasses = ppm.shape[-1]
-            self.ppm = np.asarray(ppm)
+            self.ppm = np.ascontiguousarray(ppm, ppm_dtype)
             self.is_ppm = True
             self.mu = np.zeros((nclasses, nchannels))
             self.sigma = np.zeros((nclasses, nchannels, nchannels))
@@ -101,6 +118,25 @@ class Segmentation(object):
 
         self.ngb_size = int(ngb_size)
         self.set_markov_prior(beta, U=U)
+        self.n_jobs = n_jobs
+        self._set_checkerboard()
+
+    def _set_checkerboard(self):
+        """ Partition the voxels into sets of voxels that are not
+        neighbors of one another, according to the parity of their
+        coordinates. Two sets suffice for the 6-neighborhood system,
+        eight are needed for the 26-neighborhood system.
+        """
+        parity = self.XYZ % 2
+        if self.ngb_size == 6:
+            ncolors = 2
+            color = parity.sum(1) % 2
+        else:
+            ncolors = 8
+            color = np.dot(parity, [1, 2, 4])
+        self._points = np.argsort(color, kind='mergesort').astype('intp')
+        self._color_bounds = np.searchsorted(color[self._points],
+                                             np.arange(ncolors + 1))
 
     def set_markov_prior(self, beta, U=None):
         if U is not None:  # make sure it's C-contiguous
@@ -117,7 +153,7 @@ class Segmentation(object):
             classes.remove(i)
 
         for i in classes:
-            P = self.ppm[..., i][self.mask].ravel()
+            P = np.asarray(self.ppm[..., i][self.mask].ravel(), 'double')
             Z = nonzero(P.sum())
             tmp = self.data.T * P.T
             mu = tmp.sum(1) / Z
@@ -132,42 +168,67 @@ class Segmentation(object):
         external field is defined as the likelihood times the
         first-order component of the prior.
         """
-        lef = np.zeros([self.data.shape[0], self.nclasses])
+        return self._log_external_field().T
+
+    def _log_external_field(self):
+        """ Log external field as a C-contiguous (nclasses, nvoxels)
+        array, so that the class-wise operations run on contiguous rows
+        """
+        lef = np.zeros([self.nclasses, self.data.shape[0]])
 
         for i in range(self.nclasses):
-            centered_data = self.data - self.mu[i]
             if self.nchannels == 1:
-                inv_sigma = 1. / nonzero(self.sigma[i])
-                norm_factor = np.sqrt(inv_sigma.squeeze())
+                inv_sigma = 1. / nonzero(float(self.sigma[i]))
+                norm_factor = np.sqrt(inv_sigma)
+                np.subtract(self.data[:, 0], self.mu[i], lef[i])
+                lef[i] *= lef[i]
+                lef[i] *= -.5 * inv_sigma
             else:
+                centered_data = self.data - self.mu[i]
                 inv_sigma = np.linalg.inv(self.sigma[i])
                 norm_factor = 1. / np.sqrt(\
                     nonzero(np.linalg.det(self.sigma[i])))
-            maha_dist = np.sum(centered_data * np.dot(inv_sigma,
-                                                      centered_data.T).T, 1)
-            lef[:, i] = -.5 * maha_dist
-            lef[:, i] += log(norm_factor)
+                maha_dist = np.sum(centered_data * np.dot(inv_sigma,
+                                                          centered_data.T).T, 1)
+                lef[i] = -.5 * maha_dist
+            lef[i] += log(norm_factor)
 
         if self.prior is not None:
-            lef += log(self.prior)
+            lef += log(self.prior).T
 
         return lef
 
     def normalized_external_field(self):
-        f = self.log_external_field().T
-        f -= np.max(f, 0)
+        f = self._log_external_field()
+        # fused in-place normalization, one class row at a time
+        fmax = f[0].copy()
+        for i in range(1, self.nclasses):
+            np.maximum(fmax, f[i], fmax)
+        f -= fmax
         np.exp(f, f)
-        f /= f.sum(0)
-        return f.T
+        fsum = f[0].copy()
+        for i in range(1, self.nclasses):
+            fsum += f[i]
+        f /= fsum
+        return np.ascontiguousarray(f.T)
 
     def ve_step(self):
         nef = self.normalized_external_field()
         if self.beta == 0:
             self.ppm[self.mask] = np.reshape(\
                 nef, self.ppm[self.mask].shape)
-        else:
-            self.ppm = _ve_step(self.ppm, nef, self.XYZ,
-                                self.U, self.ngb_size, self.beta)
+            return
+        n_jobs = effective_n_jobs(self.n_jobs)
+        bounds = self._color_bounds
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            if start == stop:
+                continue
+            # voxels of the same color are updated concurrently
+            chunks = np.array_split(self._points[start:stop], n_jobs)
+            parallel_map(_ve_step_chunk,
+                         [(self.ppm, nef, self.XYZ, self.U, self.ngb_size,
+                           self.beta, chunk) for chunk in chunks],
+                         n_jobs, threads=True)
 
     def run(self, niters=NITERS, freeze=()):
         if self.is_ppm:
@@ -207,6 +268,13 @@ class Segmentation(object):
         return f1 + f2
 
 
+def _ve_step_chunk(args):
+    """ Update the ppm at a chunk of voxels, see Segmentation.ve_step
+    """
+    ppm, ref, XYZ, U, ngb_size, beta, points = args
+    _ve_step(ppm, ref, XYZ, U, ngb_size, beta, points)
+
+
 def _diag_indices(n, ndim=2):
     # diag_indices function present in numpy 1.4 and later.  This for
     # compatibility with numpy < 1.4
@@ -4,8 +4,8 @@ from __future__ import absolute_import
 
 import numpy as np
 
-from nose.tools import assert_equal, assert_almost_equal
-from numpy.testing import assert_array_almost_equal
+from nose.tools import assert_equal, assert_almost_equal, assert_raises
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
 from ..segmentation import Segmentation
 from ..brain_segmentation import BrainT1Segmentation
@@ -130,3 +130,30 @@ def test_segmentation_3d_multichannel():
                                     sigma=[np.eye(2), np.eye(2)],
                                     mask=mask),
                        nchannels=2)
+
+
+def test_segmentation_n_jobs():
+    data = np.random.random(DIMS)
+    mask = data > .1
+    for ngb_size in (6, 26):
+        ppm = []
+        for n_jobs in (1, 2):
+            S = Segmentation(data, mu=[0.25, 0.75], sigma=[1, 1], beta=.5,
+                             mask=mask, ngb_size=ngb_size, n_jobs=n_jobs)
+            S.run(niters=3)
+            ppm.append(S.ppm)
+        assert_array_equal(ppm[0], ppm[1])
+
+
+def test_segmentation_float32():
+    data = np.random.RandomState(0).random_sample(DIMS)
+    S = Segmentation(data, mu=[0.25, 0.75], sigma=[1, 1], beta=.2)
+    S32 = Segmentation(data, mu=[0.25, 0.75], sigma=[1, 1], beta=.2,
+                       ppm_dtype='float32')
+    _test_segmentation(S32)
+    S.run(niters=5)
+    assert_equal(S32.ppm.dtype, np.float32)
+    assert_array_almost_equal(S32.ppm, S.ppm, 3)
+    assert_almost_equal(S32.free_energy(), S.free_energy(), 2)
+    assert_raises(ValueError, Segmentation, data, mu=[0.25, 0.75],
+                  sigma=[1, 1], ppm_dtype='int')
@@ -91,3 +91,145 @@ def two_level_glm(y, vy, X, niter=10):
     S2 = np.reshape(s2, list(y.shape[1:]))
 
     return B, S2, dof
+
+
+def ragged_two_level_glm(y, vy, sizes, X=None, niter=10, tol=0.):
+    """
+    Inference of many independent mixed-effect linear models, with
+    different numbers of observations and different design matrices,
+    using the variational Bayes algorithm of `two_level_glm`.
+
+    The problems are fitted together: the observations of all
+    problems are concatenated, the per-problem sums are computed as
+    segmented reductions and the small normal equations are
+    pseudo-inverted all at once. The variational updates of all
+    problems are iterated in lockstep; problems that have converged are
+    left out of the following iterations.
+
+    Parameters
+    ----------
+    y : array-like
+      Array of shape (n,) of the concatenated observations of the
+      successive problems.
+
+    vy : array-like
+      First-level variances associated with the observations, with
+      the same shape as y.
+
+    sizes : array-like
+      Array of shape (nproblems,), the number of observations of each
+      problem, summing to n.
+
+    X : array-like, optional
+      Concatenated second-level design matrices, of shape (n,) or (n,
+      p) where p is the number of regressors of each problem. Defaults
+      to a column of ones, i.e. one-sample models.
+
+    niter : int, optional
+      Maximum number of iterations.
+
+    tol : float, optional
+      Convergence tolerance. A problem stops being updated when the
+      relative changes of its variance and effect estimates are below
+      `tol`. The default, 0, runs `niter` iterations for all problems.
+
+    Returns
+    -------
+    beta : array-like
+      Effect estimates (posterior means), of shape (nproblems,) if X
+      is one-dimensional or None, and (nproblems, p) otherwise
+
+    s2 : array-like
+      Array of shape (nproblems,), the variance estimates. The
+      posterior variance matrix of beta[k] may be computed by s2[k] *
+      inv(X_k.T * X_k), where X_k is the design matrix of problem k.
+
+    dof : array-like
+      Array of shape (nproblems,), the degrees of freedom of each
+      problem (the number of observations minus the number of
+      regressors)
+    """
+    sizes = np.asarray(sizes, dtype=np.int)
+    y = np.ravel(y)
+    vy = nonzero(np.ravel(vy))
+    if X is None:
+        X = np.ones(y.size)
+    X = np.asarray(X, dtype=np.double)
+    squeeze = X.ndim == 1
+    X = X.reshape((X.shape[0], -1))
+    nreg = X.shape[1]
+    if (sizes <= nreg).any():
+        raise ValueError('Too many regressors compared to data size')
+    if not sizes.sum() == y.size == X.shape[0]:
+        raise ValueError('Sizes do not match the number of observations')
+
+    # Problem index of each observation and first observation of each
+    # problem
+    nprob = sizes.size
+    seg = np.repeat(np.arange(nprob), sizes)
+    starts = np.cumsum(sizes) - sizes
+
+    # Degrees of freedom
+    dof = (sizes - nreg).astype(float)
+
+    # Pseudo-inverses of the normal matrices X_k.T * X_k, so that
+    # rank-deficient designs are handled like the pinv(X) of
+    # two_level_glm
+    if nreg == 1:
+        XtX = np.add.reduceat(X[:, 0] ** 2, starts)
+        iXtX = 1. / np.where(XtX > 0, XtX, np.inf)
+        iXtX = iXtX.reshape((nprob, 1, 1))
+    else:
+        XtX = np.add.reduceat(X[:, :, None] * X[:, None, :], starts)
+        iXtX = np.array([np.linalg.pinv(a) for a in XtX])
+
+    # Initialize outputs
+    b = np.zeros((nprob, nreg))
+    s2 = np.inf * np.ones(nprob)
+
+    # Data of the problems that are still being updated
+    active = np.arange(nprob)
+    ya, Xa, sizesa, dofa, iXtXa = y, X, sizes, dof, iXtX
+    sega, startsa = seg, starts
+    zfit = np.zeros(y.size)
+    w1 = 1 / vy
+
+    # VB loop
+    for it in range(niter):
+
+        # Update distribution of "true" effects
+        w2 = (1 / nonzero(s2[active]))[sega]
+        vz = 1 / (w1 + w2)
+        z = vz * (w1 * ya + w2 * zfit)
+
+        # Update distribution of population parameters
+        Xz = np.add.reduceat(Xa * z[:, None], startsa)
+        ba = np.sum(iXtXa * Xz[:, None, :], 2)
+        zfit = np.sum(Xa * ba[sega], 1)
+        s2a = np.add.reduceat((z - zfit) ** 2 + vz, startsa) / dofa
+
+        # Check convergence
+        with np.errstate(invalid='ignore'):
+            dbeta = np.max(np.abs(ba - b[active]), 1)
+            conv = np.abs(s2a - s2[active]) <= tol * s2a
+            conv &= dbeta <= tol * np.sqrt(
+                s2a + np.max(ba ** 2, 1))
+        b[active] = ba
+        s2[active] = s2a
+        if not conv.any():
+            continue
+        if conv.all():
+            break
+        keep = ~conv
+        keep_obs = keep[sega]
+        active = active[keep]
+        sizesa = sizesa[keep]
+        sega = np.repeat(np.arange(active.size), sizesa)
+        startsa = np.cumsum(sizesa) - sizesa
+        ya, Xa = ya[keep_obs], Xa[keep_obs]
+        zfit, w1 = zfit[keep_obs], w1[keep_obs]
+        dofa, iXtXa = dofa[keep], iXtXa[keep]
+
+    if squeeze:
+        b = b[:, 0]
+    return b, s2, dof
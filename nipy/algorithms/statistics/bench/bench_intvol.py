@@ -37,6 +37,31 @@ def bench_lips3d():
     sys.stdout.flush()
 
 
+def bench_lips3d_threads():
+    # Scaling of the 3D estimators with the number of threads
+    np.random.seed(20111001)
+    phi = intvol.Lips3d
+    EC3d = intvol.EC3d
+    repeat = 2
+    sys.stdout.flush()
+    print("\nIntrinsic volumes 3D, threads")
+    print("-----------------------------")
+    print('%6s %6s %10s %10s %10s' % ('size', 'n_jobs', 'Lips3d', 'float32',
+                                      'EC3d'))
+    for bx_sz in (40, 60, 80):
+        box1, box2, edge1, edge2 = nonintersecting_boxes((bx_sz,)*3)
+        mask = box1 + box2
+        d = np.random.standard_normal((10,) + (bx_sz,) * 3)
+        d32 = d.astype(np.float32)
+        for n_jobs in (1, 2, 4, 8):
+            print('%6d %6d %10.2f %10.2f %10.2f' % (
+                bx_sz, n_jobs,
+                npt.measure('phi(d, mask, n_jobs)', repeat),
+                npt.measure('phi(d32, mask, n_jobs)', repeat),
+                npt.measure('EC3d(mask, n_jobs)', repeat)))
+    sys.stdout.flush()
+
+
 def bench_lips2d():
     np.random.seed(20111001)
     phi = intvol.Lips2d
@@ -28,6 +28,11 @@ import numpy as np
 from numpy.linalg import pinv
 import scipy.stats as st
 
+from nipy.utils.parallel import parallel_map
+
+# largest number of bins of the histograms of NormalEmpiricalNull
+MAX_HISTOGRAM_BINS = 10 ** 7
+
 
 def check_p_values(p_values):
     """Basic checks on the p_values array: values should be within [0,1]
@@ -131,19 +136,9 @@ def fdr(p_values=None, verbose=0):
         The corresponding fdr values
     """
     p_values = check_p_values(p_values)
-    n_samples = p_values.size
     order = p_values.argsort()
-    sp_values = p_values[order]
-
-    # compute q while in ascending order
-    q = np.minimum(1, n_samples * sp_values / np.arange(1, n_samples + 1))
-    for i in range(n_samples - 1, 0, - 1):
-        q[i - 1] = min(q[i], q[i - 1])
-
-    # reorder the results
-    inverse_order = np.arange(n_samples)
-    inverse_order[order] = np.arange(n_samples)
-    q = q[inverse_order]
+    q = np.empty(p_values.size)
+    q[order] = np.minimum(1, _sorted_fdr(p_values[order]))
 
     if verbose:
         import matplotlib.pylab as mp
@@ -154,26 +149,172 @@ def fdr(p_values=None, verbose=0):
     return q
 
 
+def _sorted_fdr(sp_values):
+    """ FDR of sorted p-values, not bounded by 1
+
+    This is the smallest ``n * p / rank`` over the p-values greater than
+    or equal to each p-value, a non-decreasing function of the rank.
+    """
+    n_samples = sp_values.size
+    q = n_samples * sp_values / np.arange(1, n_samples + 1)
+    return np.minimum.accumulate(q[::-1])[::-1]
+
+
+def _multiple_fdr_map(args):
+    """ q-values and critical p-values of one map of p-values
+    """
+    p_values, alphas = args
+    n_samples = p_values.size
+    order = p_values.argsort()
+    sp_values = p_values[order]
+    sq = _sorted_fdr(sp_values)
+    q = np.empty(n_samples)
+    q[order] = np.minimum(1, sq)
+    # sq is non-decreasing: the critical p-value for alpha is the largest
+    # p-value whose fdr is below alpha
+    n_critical = np.searchsorted(sq, alphas, 'left')
+    critical_p_values = np.where(
+        n_critical > 0, sp_values[np.maximum(n_critical - 1, 0)],
+        alphas / n_samples)
+    return critical_p_values, q
+
+
+def multiple_fdr(p_values, alphas=0.05, n_jobs=1):
+    """ FDR thresholds and q-values of several maps of p-values
+
+    Each map is sorted once, and the thresholds for all alpha levels are
+    read from its FDR curve, which gives the same results as calling
+    `fdr_threshold` and `fdr` for each map and alpha.
+
+    Parameters
+    ----------
+    p_values : array of shape (n_maps, n) or (n,)
+        The p-values of each map
+    alphas : float or array of shape (n_alphas,), optional
+        The desired FDR significance levels
+    n_jobs : int, optional
+        number of threads across which the maps are processed
+
+    Returns
+    -------
+    critical_p_values : array of shape (n_maps,) + alphas.shape
+        The p-values corresponding to each FDR level alpha, for each map.
+        The first dimension is dropped if p_values is one-dimensional.
+    q : array with the shape of p_values
+        The corresponding fdr values
+    """
+    check_p_values(p_values)
+    p_values = np.atleast_1d(np.asarray(p_values, dtype=np.double))
+    alphas = np.asarray(alphas, dtype=np.double)
+    maps = np.reshape(p_values, (-1, p_values.shape[-1]))
+    results = parallel_map(_multiple_fdr_map,
+                           [(p_map, np.ravel(alphas)) for p_map in maps],
+                           n_jobs, threads=True)
+    critical_p_values = np.array([r[0] for r in results])
+    q = np.array([r[1] for r in results])
+    return (np.reshape(critical_p_values, p_values.shape[:-1] + alphas.shape),
+            np.reshape(q, p_values.shape))
+
+
+def _accumulate_histogram(chunks, bin_width):
+    """ Histogram of the values read from `chunks` in one pass
+
+    The bins have width `bin_width` and are aligned on its multiples, so
+    that the histogram can be extended as new values come in.
+
+    Parameters
+    ----------
+    chunks : iterable of arrays
+        the data, read once
+    bin_width : float
+        width of the bins
+
+    Returns
+    -------
+    counts : array of shape (nbins,)
+        number of values in each bin, the first and last bins being
+        non-empty
+    edges : array of shape (nbins + 1,)
+        the bin edges
+    """
+    bin_width = float(bin_width)
+    if not bin_width > 0:
+        raise ValueError('bin_width should be positive')
+    counts = np.zeros(0, dtype=np.int64)
+    origin = 0
+    for chunk in chunks:
+        chunk = np.ravel(chunk)
+        if chunk.size == 0:
+            continue
+        if not np.isfinite(chunk).all():
+            raise ValueError('Non-finite values in the data')
+        idx = np.floor(chunk / bin_width).astype(np.int64)
+        imin, imax = idx.min(), idx.max()
+        if counts.size == 0:
+            origin = imin
+        lo, hi = min(origin, imin), max(origin + counts.size - 1, imax)
+        if hi - lo + 1 > MAX_HISTOGRAM_BINS:
+            raise ValueError('The data range requires more than %d bins, '
+                             'use a larger bin_width' % MAX_HISTOGRAM_BINS)
+        if lo < origin or hi >= origin + counts.size:
+            extended = np.zeros(hi - lo + 1, dtype=np.int64)
+            extended[origin - lo: origin - lo + counts.size] = counts
+            counts, origin = extended, lo
+        counts += np.bincount(idx - origin, minlength=counts.size)
+    if counts.sum() == 0:
+        raise ValueError('No data to build the histogram from')
+    edges = (origin + np.arange(counts.size + 1)) * bin_width
+    return counts, edges
+
+
 class NormalEmpiricalNull(object):
     """Class to compute the empirical null normal fit to the data.
 
     The data which is used to estimate the FDR, assuming a Gaussian null
     from Schwartzmann et al., NeuroImage 44 (2009) 71--82
+
+    The null can be estimated from the sorted data (the default), or from
+    a fine-grained histogram of the data, when `bin_width` is given. The
+    histogram is built in one pass, possibly over chunks of data, and all
+    the subsequent computations are O(number of bins). The quantiles,
+    thresholds and FDR values are then exact up to about `bin_width`; the
+    FDR values are evaluated at the lower edges of the bins, which makes
+    them slightly conservative.
     """
 
-    def __init__(self, x):
+    def __init__(self, x, bin_width=None):
         """Initialize an empirical null normal object.
 
         Parameters
         -----------
-        x : 1D ndarray
-            The data used to estimate the empirical null.
+        x : 1D ndarray or iterable of 1D ndarrays
+            The data used to estimate the empirical null. When `bin_width`
+            is given, x can also be an iterable over chunks of data (e.g.
+            a generator reading a large file), which is read once.
+        bin_width : float, optional
+            If not None, only a histogram of the data with bins of this
+            width is kept, instead of the sorted data.
         """
-        x = np.reshape(x, (- 1))
-        self.x = np.sort(x)
-        self.n = np.size(x)
+        self.bin_width = bin_width
+        if bin_width is None:
+            x = np.reshape(x, (- 1))
+            self.x = np.sort(x)
+            self.n = np.size(x)
+        else:
+            if isinstance(x, np.ndarray):
+                x = [x]
+            self.counts, self.edges = _accumulate_histogram(x, bin_width)
+            self._cumcounts = np.hstack((0, np.cumsum(self.counts)))
+            self.x = None
+            self.n = int(self._cumcounts[-1])
         self.learned = 0
 
+    def _binned(self, edges):
+        """ Counts of the histogram data within the given bins, assuming
+        a uniform density within the bins of the fine histogram
+        """
+        return np.diff(np.interp(edges, self.edges, self._cumcounts))
+
     def learn(self, left=0.2, right=0.8):
         """
         Estimate the proportion, mean and variance of a Gaussian distribution
@@ -197,13 +338,26 @@ class NormalEmpiricalNull(object):
         * sigma: np.sqrt(sqsigma) : standard deviation of the estimated
           normal distribution
         """
-        # take a central subsample of x
-        x = self.x[int(self.n * left): int(self.n * right)]
-
-        # generate the histogram
-        step = 3.5 * np.std(self.x) / np.exp(np.log(self.n) / 3)
-        bins = max(10, int((self.x.max() - self.x.min()) // step))
-        hist, ledge = np.histogram(x, bins=bins)
+        if self.x is not None:
+            # take a central subsample of x
+            x = self.x[int(self.n * left): int(self.n * right)]
+
+            # generate the histogram
+            step = 3.5 * np.std(self.x) / np.exp(np.log(self.n) / 3)
+            bins = max(10, int((self.x.max() - self.x.min()) // step))
+            hist, ledge = np.histogram(x, bins=bins)
+        else:
+            # same, with the quantiles and moments of the histogram
+            centers = self.edges[:-1] + 0.5 * self.bin_width
+            mean = np.dot(self.counts, centers) / self.n
+            std = np.sqrt(np.dot(self.counts, (centers - mean) ** 2) / self.n)
+            step = 3.5 * std / np.exp(np.log(self.n) / 3)
+            bins = max(10, int((self.edges[-1] - self.edges[0]) // step))
+            lo, hi = np.interp(
+                [int(self.n * left), int(self.n * right)], self._cumcounts,
+                self.edges)
+            ledge = np.linspace(lo, hi, bins + 1)
+            hist = self._binned(ledge)
         step = ledge[1] - ledge[0]
         medge = ledge + 0.5 * step
 
@@ -225,22 +379,37 @@ class NormalEmpiricalNull(object):
         self.p0 = min(1, np.exp(lp0))
         self.sigma = np.sqrt(sqsigma)
         self.sqsigma = sqsigma
+        self.learned = 1
+
+    def _n_above(self, theta):
+        """ Number of values greater than or equal to theta
+        """
+        if self.x is not None:
+            return self.n - np.searchsorted(self.x, theta, 'left')
+        return self.n - np.interp(theta, self.edges, self._cumcounts)
 
     def fdrcurve(self):
         """
         Returns the FDR associated with any point of self.x
+
+        With a histogram, the FDR is returned for the lower edge of each
+        non-empty bin, given in self.sorted_x.
         """
-        import scipy.stats as st
         if self.learned == 0:
             self.learn()
-        efp = (self.p0 * st.norm.sf(self.x, self.mu, self.sigma)
-               * self.n / np.arange(self.n, 0, - 1))
+        if self.x is not None:
+            self.sorted_x = self.x
+            n_above = np.arange(self.n, 0, - 1)
+        else:
+            nonempty = self.counts > 0
+            self.sorted_x = self.edges[:-1][nonempty]
+            n_above = self.n - self._cumcounts[:-1][nonempty]
+        efp = (self.p0 * st.norm.sf(self.sorted_x, self.mu, self.sigma)
+               * self.n / n_above)
         efp = np.minimum(efp, 1)
-        ix = np.argsort(self.x)
-        for i in range(np.size(efp) - 1, 0, - 1):
-            efp[ix[i - 1]] = np.maximum(efp[ix[i]], efp[ix[i - 1]])
-        self.sorted_x = self.x[ix]
-        self.sorted_fdr = efp[ix]
+        # make the FDR a non-increasing function of the values
+        efp = np.maximum.accumulate(efp[::-1])[::-1]
+        self.sorted_fdr = efp
         return efp
 
     def threshold(self, alpha=0.05, verbose=0):
@@ -264,12 +433,16 @@ class NormalEmpiricalNull(object):
         if verbose:
             self.plot(efp, alpha)
 
+        if self.x is not None:
+            x, upper = self.x, self.x
+        else:
+            x, upper = self.sorted_x, self.sorted_x + self.bin_width
         if efp[-1] > alpha:
             print("the maximal value is %f , the corresponding FDR is %f "
-                  % (self.x[ - 1], efp[ - 1]))
+                  % (upper[ - 1], efp[ - 1]))
             return np.inf
         j = np.argmin(efp[:: - 1] < alpha) + 1
-        return 0.5 * (self.x[ - j] + self.x[ - j + 1])
+        return 0.5 * (upper[ - j] + x[ - j + 1])
 
     def uncorrected_threshold(self, alpha=0.001, verbose=0):
         """Compute the threshold corresponding to a specificity alpha for x
@@ -307,27 +480,25 @@ class NormalEmpiricalNull(object):
         -------
         afp : value of array of shape(n)
         """
-        from scipy.stats import norm
         self.fdrcurve()
-        if np.isscalar(theta):
-            if theta > self.sorted_x[ - 1]:
-                return 0
-            maj = np.where(self.sorted_x >= theta)[0][0]
-            efp = (self.p0 * norm.sf(theta, self.mu, self.sigma) * self.n\
-                  / np.sum(self.x >= theta))
-            efp = np.maximum(self.sorted_fdr[maj], efp)
+        scalar = np.isscalar(theta)
+        theta = np.atleast_1d(np.asarray(theta, dtype=np.double))
+        if self.x is not None:
+            above = theta > self.sorted_x[ - 1]
+            maj = np.searchsorted(self.sorted_x, theta, 'left')
         else:
-            efp = []
-            for th in theta:
-                if th > self.sorted_x[ - 1]:
-                    efp.append(0)
-                    continue
-                maj = self.sorted_fdr[np.where(self.sorted_x >= th)[0][0]]
-                efp.append(np.maximum(maj, self.p0 * st.norm.sf(th, self.mu,
-                           self.sigma) * self.n / np.sum(self.x >= th)))
-            efp = np.array(efp)
-            #
+            # the bin containing theta
+            above = theta > self.edges[ - 1]
+            maj = np.maximum(
+                np.searchsorted(self.sorted_x, theta, 'right') - 1, 0)
+        maj = np.minimum(maj, self.sorted_x.size - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            efp = np.maximum(self.sorted_fdr[maj], self.p0 * st.norm.sf(
+                    theta, self.mu, self.sigma) * self.n / self._n_above(theta))
+        efp[above] = 0
         efp = np.minimum(efp, 1)
+        if scalar:
+            return efp[0]
         return efp
 
     def plot(self, efp=None, alpha=0.05, bar=1, mpaxes=None):
@@ -347,13 +518,16 @@ class NormalEmpiricalNull(object):
         """
         if not self.learned:
             self.learn()
-        n = np.size(self.x)
+        n = self.n
         bins = max(10, int(2 * np.exp(np.log(n) / 3.)))
-        hist, ledge = np.histogram(self.x, bins=bins)
+        if self.x is not None:
+            hist, ledge = np.histogram(self.x, bins=bins)
+        else:
+            ledge = np.linspace(self.edges[0], self.edges[-1], bins + 1)
+            hist = self._binned(ledge)
         hist = hist.astype('f') / hist.sum()
         step = ledge[1] - ledge[0]
         medge = ledge + 0.5 * step
-        import scipy.stats as st
         g = self.p0 * st.norm.pdf(medge, self.mu, self.sigma)
         hist /= step
 
@@ -378,7 +552,10 @@ class NormalEmpiricalNull(object):
         ax.set_yticklabels(ax.get_yticks(), fontsize=12)
 
         if efp is not None:
-            ax.plot(self.x, np.minimum(alpha, efp), 'k')
+            if self.x is not None:
+                ax.plot(self.x, np.minimum(alpha, efp), 'k')
+            else:
+                ax.plot(self.sorted_x, np.minimum(alpha, efp), 'k')
 
 
 def three_classes_GMM_fit(x, test=None, alpha=0.01, prior_strength=100,
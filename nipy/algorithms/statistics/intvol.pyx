@@ -16,6 +16,7 @@ from scipy.sparse import dok_matrix
 
 # Array helper
 from nipy.utils.arrays import strides_from
+from nipy.utils.parallel import parallel_map
 
 # local imports
 from utils import cube_with_strides_center, join_complexes
@@ -23,6 +24,14 @@ from utils import cube_with_strides_center, join_complexes
 
 cdef double PI = np.pi
 
+# Number of planes (along the first axis) in each of the slabs that
+# EC3d and Lips3d process independently
+SLAB_PLANES = 4
+
+ctypedef fused coord_t:
+    float
+    double
+
 
 cdef extern from "math.h" nogil:
     double floor(double x)
@@ -337,7 +346,83 @@ cpdef double mu1_edge(double D00, double D01, double D11) nogil:
   return sqrt(D00 - 2*D01 + D11)
 
 
-def EC3d(mask):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.npy_intp _ec3d_kernel(np.intp_t[::1] fpmask,
+                              np.intp_t[:, ::1] d4,
+                              np.intp_t[:, ::1] d3,
+                              np.intp_t[:, ::1] d2,
+                              np.npy_intp i0, np.npy_intp i1,
+                              np.npy_intp s1, np.npy_intp s2,
+                              np.npy_intp ss0, np.npy_intp ss1,
+                              np.npy_intp ss2) nogil:
+    """ Contribution of the cubes of planes i0 to i1 - 1 to EC3d
+    """
+    cdef:
+        np.npy_intp i, j, k, l, index, m, v0, v1, v2, v3
+        np.npy_intp l0 = 0
+    for i in range(i0, i1):
+        for j in range(s1-1):
+            for k in range(s2-1):
+                index = i*ss0+j*ss1+k*ss2
+                if not _any_in_cube(fpmask, index, ss0, ss1, ss2):
+                    continue
+                for l in range(d4.shape[0]):
+                    v0 = index + d4[l,0]
+                    m = fpmask[v0]
+                    if m:
+                        v1 = index + d4[l,1]
+                        v2 = index + d4[l,2]
+                        v3 = index + d4[l,3]
+                        m = m * fpmask[v1] * fpmask[v2] * fpmask[v3]
+                        l0 = l0 - m
+
+                for l in range(d3.shape[0]):
+                    v0 = index + d3[l,0]
+                    m = fpmask[v0]
+                    if m:
+                        v1 = index + d3[l,1]
+                        v2 = index + d3[l,2]
+                        m = m * fpmask[v1] * fpmask[v2]
+                        l0 = l0 + m
+
+                for l in range(d2.shape[0]):
+                    v0 = index + d2[l,0]
+                    m = fpmask[v0]
+                    if m:
+                        v1 = index + d2[l,1]
+                        m = m * fpmask[v1]
+                        l0 = l0 - m
+    return l0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline bint _any_in_cube(np.intp_t[::1] fpmask, np.npy_intp index,
+                              np.npy_intp ss0, np.npy_intp ss1,
+                              np.npy_intp ss2) nogil:
+    """ Whether any corner of the cube at `index` of the padded mask is set
+    """
+    return (fpmask[index] or fpmask[index + ss2] or
+            fpmask[index + ss1] or fpmask[index + ss1 + ss2] or
+            fpmask[index + ss0] or fpmask[index + ss0 + ss2] or
+            fpmask[index + ss0 + ss1] or fpmask[index + ss0 + ss1 + ss2])
+
+
+def _ec3d_slab(args):
+    """ Contribution of a slab of planes to EC3d, computed without the GIL
+    """
+    cdef:
+        np.intp_t[::1] fpmask
+        np.intp_t[:, ::1] d4, d3, d2
+        np.npy_intp i0, i1, s1, s2, ss0, ss1, ss2, l0
+    fpmask, d4, d3, d2, i0, i1, s1, s2, ss0, ss1, ss2 = args
+    with nogil:
+        l0 = _ec3d_kernel(fpmask, d4, d3, d2, i0, i1, s1, s2, ss0, ss1, ss2)
+    return l0
+
+
+def EC3d(mask, n_jobs=1):
     """ Compute Euler characteristic of region within `mask`
 
     Given a 3d `mask`, compute the 0th intrinsic volume (Euler characteristic)
@@ -349,6 +434,9 @@ def EC3d(mask):
     ----------
     mask : ndarray((i,j,k), np.int)
          Binary mask determining whether or not a voxel is in the mask.
+    n_jobs : int, optional
+         Number of threads. The volume is cut into slabs of planes along
+         the first axis, that are processed in parallel.
 
     Returns
     -------
@@ -383,9 +471,8 @@ def EC3d(mask):
         np.ndarray[np.intp_t, ndim=2] d3
         np.ndarray[np.intp_t, ndim=2] d4
         # scalars
-        np.npy_intp i, j, k, l, s0, s1, s2, ds2, ds3, ds4, index, m, nvox
+        np.npy_intp s0, s1, s2
         np.npy_intp ss0, ss1, ss2 # strides
-        np.npy_intp v0, v1, v2, v3 # vertices
         np.npy_intp l0 = 0
 
     mask_c = mask
@@ -417,51 +504,167 @@ def EC3d(mask):
     d3 = np.array(list(c[3].difference(union[3])))
     d2 = np.array(list(c[2].difference(union[2])))
 
-    ds2 = d2.shape[0]
-    ds3 = d3.shape[0]
-    ds4 = d4.shape[0]
-
     ss0 = strides[0]
     ss1 = strides[1]
     ss2 = strides[2]
 
-    nvox = mask.size
+    slabs = [(fpmask, d4, d3, d2, start, min(start + SLAB_PLANES, s0 - 1),
+              s1, s2, ss0, ss1, ss2)
+             for start in range(0, s0 - 1, SLAB_PLANES)]
+    l0 = sum(parallel_map(_ec3d_slab, slabs, n_jobs, threads=True))
+    l0 += mask.sum()
+    return l0
 
-    for i in range(s0-1):
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _lips3d_kernel(coord_t[:, ::1] fcoords,
+                         np.intp_t[::1] fmask,
+                         np.intp_t[::1] fpmask,
+                         np.intp_t[:, ::1] d4,
+                         np.intp_t[:, ::1] d3,
+                         np.intp_t[:, ::1] d2,
+                         np.intp_t[::1] cvertices,
+                         np.npy_intp i0, np.npy_intp i1,
+                         np.npy_intp s1, np.npy_intp s2,
+                         np.npy_intp ss0, np.npy_intp ss1, np.npy_intp ss2,
+                         np.npy_intp ss0d, np.npy_intp ss1d,
+                         np.npy_intp ss2d, double* out) nogil:
+    """ Contribution of the cubes of planes i0 to i1 - 1 to Lips3d
+
+    The contributions to the intrinsic volumes 0 to 3 are added to
+    out[0] to out[3].
+    """
+    cdef:
+        double D[8][8]
+        np.npy_intp i, j, k, l, r, s, rr, ss, mr, ms, m
+        np.npy_intp index, pindex, nvox = fmask.shape[0]
+        np.npy_intp v0, v1, v2, v3 # vertices for mask
+        np.npy_intp w0, w1, w2, w3 # vertices for data
+        double l0 = 0, l1 = 0, l2 = 0, l3 = 0
+        double res
+
+    for i in range(i0, i1):
         for j in range(s1-1):
             for k in range(s2-1):
-                index = i*ss0+j*ss1+k*ss2
-                for l in range(ds4):
-                    v0 = index + d4[l,0]
+
+                pindex = i*ss0+j*ss1+k*ss2
+                if not _any_in_cube(fpmask, pindex, ss0, ss1, ss2):
+                    continue
+                index = i*ss0d+j*ss1d+k*ss2d
+                for r in range(8):
+                    rr = (index+cvertices[r]) % nvox
+                    mr = fmask[rr]
+                    for s in range(r+1):
+                        res = 0
+                        ss = (index+cvertices[s]) % nvox
+                        ms = fmask[ss]
+                        if mr * ms:
+                            for l in range(fcoords.shape[1]):
+                                res += fcoords[ss,l] * fcoords[rr,l]
+                            D[r][s] = res
+                            D[s][r] = res
+                        else:
+                            D[r][s] = 0
+                            D[s][r] = 0
+
+                for l in range(d4.shape[0]):
+                    v0 = pindex + d4[l,0]
+                    w0 = d4[l,4]
                     m = fpmask[v0]
                     if m:
-                        v1 = index + d4[l,1]
-                        v2 = index + d4[l,2]
-                        v3 = index + d4[l,3]
+                        v1 = pindex + d4[l,1]
+                        v2 = pindex + d4[l,2]
+                        v3 = pindex + d4[l,3]
+                        w1 = d4[l,5]
+                        w2 = d4[l,6]
+                        w3 = d4[l,7]
+
                         m = m * fpmask[v1] * fpmask[v2] * fpmask[v3]
+
+                        l3 = l3 + m * mu3_tet(D[w0][w0], D[w0][w1], D[w0][w2],
+                                              D[w0][w3], D[w1][w1], D[w1][w2],
+                                              D[w1][w3], D[w2][w2], D[w2][w3],
+                                              D[w3][w3])
+
+                        l2 = l2 - m * mu2_tet(D[w0][w0], D[w0][w1], D[w0][w2],
+                                              D[w0][w3], D[w1][w1], D[w1][w2],
+                                              D[w1][w3], D[w2][w2], D[w2][w3],
+                                              D[w3][w3])
+
+                        l1 = l1 + m * mu1_tet(D[w0][w0], D[w0][w1], D[w0][w2],
+                                              D[w0][w3], D[w1][w1], D[w1][w2],
+                                              D[w1][w3], D[w2][w2], D[w2][w3],
+                                              D[w3][w3])
+
                         l0 = l0 - m
 
-                for l in range(ds3):
-                    v0 = index + d3[l,0]
+                for l in range(d3.shape[0]):
+                    v0 = pindex + d3[l,0]
+                    w0 = d3[l,3]
                     m = fpmask[v0]
                     if m:
-                        v1 = index + d3[l,1]
-                        v2 = index + d3[l,2]
+                        v1 = pindex + d3[l,1]
+                        v2 = pindex + d3[l,2]
+                        w1 = d3[l,4]
+                        w2 = d3[l,5]
+
                         m = m * fpmask[v1] * fpmask[v2]
+                        l2 = l2 + m * mu2_tri(D[w0][w0], D[w0][w1], D[w0][w2],
+                                              D[w1][w1], D[w1][w2], D[w2][w2])
+
+                        l1 = l1 - m * mu1_tri(D[w0][w0], D[w0][w1], D[w0][w2],
+                                              D[w1][w1], D[w1][w2], D[w2][w2])
+
                         l0 = l0 + m
 
-                for l in range(ds2):
-                    v0 = index + d2[l,0]
+                for l in range(d2.shape[0]):
+                    v0 = pindex + d2[l,0]
+                    w0 = d2[l,2]
                     m = fpmask[v0]
                     if m:
-                        v1 = index + d2[l,1]
+                        v1 = pindex + d2[l,1]
+                        w1 = d2[l,3]
                         m = m * fpmask[v1]
+                        l1 = l1 + m * mu1_edge(D[w0][w0], D[w0][w1], D[w1][w1])
+
                         l0 = l0 - m
-    l0 += mask.sum()
-    return l0
+
+    out[0] += l0
+    out[1] += l1
+    out[2] += l2
+    out[3] += l3
 
 
-def Lips3d(coords, mask):
+def _lips3d_slab(args):
+    """ Contribution of a slab of planes to Lips3d, computed without the GIL
+    """
+    cdef:
+        float[:, ::1] fcoords32
+        double[:, ::1] fcoords64
+        np.intp_t[::1] fmask, fpmask, cvertices
+        np.intp_t[:, ::1] d4, d3, d2
+        np.npy_intp i0, i1, s1, s2, ss0, ss1, ss2, ss0d, ss1d, ss2d
+        double out[4]
+    (fcoords, fmask, fpmask, d4, d3, d2, cvertices, i0, i1, s1, s2,
+     ss0, ss1, ss2, ss0d, ss1d, ss2d) = args
+    out[0] = 0; out[1] = 0; out[2] = 0; out[3] = 0
+    if fcoords.dtype == np.float32:
+        fcoords32 = fcoords
+        with nogil:
+            _lips3d_kernel(fcoords32, fmask, fpmask, d4, d3, d2, cvertices,
+                           i0, i1, s1, s2, ss0, ss1, ss2, ss0d, ss1d, ss2d,
+                           out)
+    else:
+        fcoords64 = fcoords
+        with nogil:
+            _lips3d_kernel(fcoords64, fmask, fpmask, d4, d3, d2, cvertices,
+                           i0, i1, s1, s2, ss0, ss1, ss2, ss0d, ss1d, ss2d,
+                           out)
+    return np.array([out[0], out[1], out[2], out[3]])
+
+
+def Lips3d(coords, mask, n_jobs=1):
     """ Estimated intrinsic volumes within masked region given coordinates
 
     Given a 3d `mask` and coordinates `coords`, estimate the intrinsic volumes
@@ -473,10 +676,15 @@ def Lips3d(coords, mask):
     ----------
     coords : ndarray((N,i,j,k))
          Coordinates for the voxels in the mask. ``N`` will often be 3 (for 3
-         dimensional coordinates, but can be any integer > 0
+         dimensional coordinates, but can be any integer > 0. Single
+         precision coordinates are used as such, which halves the memory
+         traffic; the other types are converted to double precision.
     mask : ndarray((i,j,k), np.int)
          Binary mask determining whether or not
          a voxel is in the mask.
+    n_jobs : int, optional
+         Number of threads. The volume is cut into slabs of planes along
+         the first axis, that are processed in parallel.
 
     Returns
     -------
@@ -519,11 +727,7 @@ def Lips3d(coords, mask):
                        'values, but be of type np.int')
     cdef:
         # c-level versions of the arrays
-        np.ndarray[np.float_t, ndim=4] coords_c
         np.ndarray[np.intp_t, ndim=3] mask_c
-        # 'flattened' coords (2d array)
-        np.ndarray[np.float_t, ndim=2] fcoords
-        np.ndarray[np.float_t, ndim=2] D
         # 'flattened' mask (1d array)
         np.ndarray[np.intp_t, ndim=1] fmask
         np.ndarray[np.intp_t, ndim=1] fpmask
@@ -538,17 +742,14 @@ def Lips3d(coords, mask):
         np.ndarray[np.intp_t, ndim=2] m2
         np.ndarray[np.intp_t, ndim=1] cvertices
         # scalars
-        np.npy_intp i, j, k, l, s0, s1, s2, ds4, ds3, ds2
-        np.npy_intp index, pindex, m, nvox, r, s, rr, ss, mr, ms
+        np.npy_intp i, s0, s1, s2
         np.npy_intp ss0, ss1, ss2 # strides
-        np.npy_intp v0, v1, v2, v3 # vertices for mask
-        np.npy_intp w0, w1, w2, w3 # vertices for data
-        double l0, l1, l2, l3
-        double res
 
-    coords_c = coords
+    # The coordinates of each voxel are made contiguous, in single or
+    # double precision
+    if coords.dtype != np.float32:
+        coords = np.asarray(coords, dtype=np.float64)
     mask_c = mask
-    l0 = 0; l1 = 0; l2 = 0; l3 = 0
 
     pmask_shape = np.array(mask.shape) + 1
     pmask = np.zeros(pmask_shape, np.int)
@@ -558,7 +759,7 @@ def Lips3d(coords, mask):
 
     fpmask = pmask.reshape(-1)
     fmask = mask_c.reshape(-1)
-    fcoords = coords_c.reshape((coords_c.shape[0], -1))
+    fcoords = np.ascontiguousarray(coords.reshape((coords.shape[0], -1)).T)
 
     # First do the interior contributions.
     # We first figure out which vertices, edges, triangles, tetrahedra
@@ -594,104 +795,19 @@ def Lips3d(coords, mask):
 
     d4 = np.array([[_convert_stride3(v, strides, (4,2,1)) for v in m4[i]] for i in range(m4.shape[0])])
     d4 = np.hstack([m4, d4])
-    ds4 = d4.shape[0]
 
     d3 = np.array([[_convert_stride3(v, strides, (4,2,1)) for v in m3[i]] for i in range(m3.shape[0])])
     d3 = np.hstack([m3, d3])
-    ds3 = d3.shape[0]
 
     d2 = np.array([[_convert_stride3(v, strides, (4,2,1)) for v in m2[i]] for i in range(m2.shape[0])])
     d2 = np.hstack([m2, d2])
-    ds2 = d2.shape[0]
-
-    nvox = mask.size
-
-    D = np.zeros((8,8))
-
-    for i in range(s0-1):
-        for j in range(s1-1):
-            for k in range(s2-1):
-
-                pindex = i*ss0+j*ss1+k*ss2
-                index = i*ss0d+j*ss1d+k*ss2d
-                for r in range(8):
-                    rr = (index+cvertices[r]) % nvox
-                    mr = fmask[rr]
-                    for s in range(r+1):
-                        res = 0
-                        ss = (index+cvertices[s]) % nvox
-                        ms = fmask[ss]
-                        if mr * ms:
-                            for l in range(fcoords.shape[0]):
-                                res += fcoords[l,ss] * fcoords[l,rr]
-                            D[r,s] = res
-                            D[s,r] = res
-                        else:
-                            D[r,s] = 0
-                            D[s,r] = 0
-
-                for l in range(ds4):
-                    v0 = pindex + d4[l,0]
-                    w0 = d4[l,4]
-                    m = fpmask[v0]
-                    if m:
-                        v1 = pindex + d4[l,1]
-                        v2 = pindex + d4[l,2]
-                        v3 = pindex + d4[l,3]
-                        w1 = d4[l,5]
-                        w2 = d4[l,6]
-                        w3 = d4[l,7]
-
-                        m = m * fpmask[v1] * fpmask[v2] * fpmask[v3]
-
-                        l3 = l3 + m * mu3_tet(D[w0,w0], D[w0,w1], D[w0,w2], 
-                                              D[w0,w3], D[w1,w1], D[w1,w2], 
-                                              D[w1,w3], D[w2,w2], D[w2,w3],
-                                              D[w3,w3])
-
-                        l2 = l2 - m * mu2_tet(D[w0,w0], D[w0,w1], D[w0,w2], 
-                                              D[w0,w3], D[w1,w1], D[w1,w2], 
-                                              D[w1,w3], D[w2,w2], D[w2,w3],
-                                              D[w3,w3])
-
-                        l1 = l1 + m * mu1_tet(D[w0,w0], D[w0,w1], D[w0,w2], 
-                                              D[w0,w3], D[w1,w1], D[w1,w2], 
-                                              D[w1,w3], D[w2,w2], D[w2,w3],
-                                              D[w3,w3])
-
-                        l0 = l0 - m
-
-                for l in range(ds3):
-                    v0 = pindex + d3[l,0]
-                    w0 = d3[l,3]
-                    m = fpmask[v0]
-                    if m:
-                        v1 = pindex + d3[l,1]
-                        v2 = pindex + d3[l,2]
-                        w1 = d3[l,4]
-                        w2 = d3[l,5]
-
-                        m = m * fpmask[v1] * fpmask[v2] 
-                        l2 = l2 + m * mu2_tri(D[w0,w0], D[w0,w1], D[w0,w2], 
-                                              D[w1,w1], D[w1,w2], D[w2,w2]) 
-
-                        l1 = l1 - m * mu1_tri(D[w0,w0], D[w0,w1], D[w0,w2], 
-                                              D[w1,w1], D[w1,w2], D[w2,w2]) 
-
-                        l0 = l0 + m
-
-                for l in range(ds2):
-                    v0 = pindex + d2[l,0]
-                    w0 = d2[l,2]
-                    m = fpmask[v0]
-                    if m:
-                        v1 = pindex + d2[l,1]
-                        w1 = d2[l,3]
-                        m = m * fpmask[v1]
-                        l1 = l1 + m * mu1_edge(D[w0,w0], D[w0,w1], D[w1,w1])
-
-                        l0 = l0 - m
 
+    slabs = [(fcoords, fmask, fpmask, d4, d3, d2, cvertices,
+              start, min(start + SLAB_PLANES, s0 - 1), s1, s2,
+              ss0, ss1, ss2, ss0d, ss1d, ss2d)
+             for start in range(0, s0 - 1, SLAB_PLANES)]
+    l0, l1, l2, l3 = np.sum(
+        parallel_map(_lips3d_slab, slabs, n_jobs, threads=True), 0)
     l0 += mask.sum()
     return np.array([l0, l1, l2, l3])
 
@@ -23,8 +23,14 @@ from __future__ import print_function
 
 import numpy as np
 
+from nipy.utils.parallel import parallel_map
+
 EPS = 100 * np.finfo(float).eps
 
+# maximal number of elements of the (n_samples, n_tests) arrays processed
+# at once when the chunk size is not specified
+CHUNK_ELEMENTS = 2 ** 20
+
 
 def generate_data(X, beta, V2, V1):
     """ Generate a group of individuals from the provided parameters
@@ -99,11 +105,98 @@ def t_stat(Y):
     return Y.mean(0) / Y.std(0) * np.sqrt(Y.shape[0] - 1)
 
 
+def _log_like(Y, V1, Y_, V2):
+    """ Log-likelihood of (Y, V1) given the fitted values Y_ and the
+    group variance V2, see MixedEffectsModel.log_like
+    """
+    tvar = V2 + V1
+    logl = np.sum(((Y - Y_) ** 2) / tvar, 0)
+    logl += np.sum(np.log(tvar), 0)
+    logl += np.log(2 * np.pi) * Y.shape[0]
+    logl *= (- 0.5)
+    return logl
+
+
+def _em_step(X, pinv_X, Y, V1, Y_, V2):
+    """ One step of the EM algorithm, see MixedEffectsModel.fit
+
+    Returns
+    -------
+    beta_, Y_, V2: the updated parameters
+    """
+    # E step
+    prec = 1. / (V2 + V1)
+    Y_ = prec * (V2 * Y + V1 * Y_)
+    cvar = V1 * V2 * prec
+
+    # M step
+    beta_ = np.dot(pinv_X, Y_)
+    fitted = np.dot(X, beta_)
+    V2 = np.mean((Y_ - fitted) ** 2, 0) + cvar.mean(0)
+    return beta_, fitted, V2
+
+
+def _fit_chunk(args):
+    """ Fit a MixedEffectsModel on a chunk of tests
+
+    Returns
+    -------
+    beta_, V2, n_iter_: the estimated parameters and the number of
+                        iterations run for each test
+    """
+    model, Y, V1 = args
+    X, pinv_X, tol = model.X, model.pinv_X, model.tol
+    beta = np.dot(pinv_X, Y)
+    Y_ = np.dot(X, beta)
+    V2 = np.mean((Y - Y_) ** 2, 0)
+    n_iter = np.zeros(Y.shape[1], np.int)
+
+    if model.verbose:
+        log_like_init = _log_like(Y, V1, Y_, V2)
+        print('Average log-likelihood: ', log_like_init.mean())
+
+    # the tests that have not converged yet, and their data
+    active = np.arange(Y.shape[1])
+    beta_a, Y_a, V2_a, Y_act, V1_act = beta, Y_, V2, Y, V1
+    for i in range(model.n_iter):
+        beta_new, Y_a, V2_new = _em_step(X, pinv_X, Y_act, V1_act, Y_a, V2_a)
+        n_iter[active] += 1
+
+        if model.verbose:
+            log_like_ = _log_like(Y_act, V1_act, Y_a, V2_new)
+            if (log_like_ < (log_like_init - EPS)).any():
+                raise ValueError('The log-likelihood cannot decrease')
+            log_like_init = log_like_
+            print('Iteration %d, average log-likelihood: %f' % (
+                    i, log_like_.mean()))
+
+        # relative changes of the group variance and of the effects
+        converged = np.abs(V2_new - V2_a) <= tol * V2_a
+        converged &= np.abs(beta_new - beta_a).max(0) <= \
+            tol * np.sqrt(V2_a)
+        beta_a, V2_a = beta_new, V2_new
+        if converged.any():
+            beta[:, active[converged]] = beta_a[:, converged]
+            V2[active[converged]] = V2_a[converged]
+            keep = np.logical_not(converged)
+            active = active[keep]
+            beta_a, Y_a, V2_a = beta_a[:, keep], Y_a[:, keep], V2_a[keep]
+            Y_act, V1_act = Y_act[:, keep], V1_act[:, keep]
+            if model.verbose:
+                log_like_init = log_like_init[keep]
+            if active.size == 0:
+                break
+    beta[:, active] = beta_a
+    V2[active] = V2_a
+    return beta, V2, n_iter
+
+
 class MixedEffectsModel(object):
     """Class to handle multiple one-sample mixed effects models
     """
 
-    def __init__(self, X, n_iter=5, verbose=False):
+    def __init__(self, X, n_iter=5, verbose=False, tol=0., chunk_size=None,
+                 n_jobs=1):
         """
         Set the effects and first-level variance,
         and initialize related quantities
@@ -113,14 +206,47 @@ class MixedEffectsModel(object):
         X: array of shape(n_samples, n_effects),
            the design matrix
         n_iter: int, optional,
-               number of iterations of the EM algorithm
+               maximal number of iterations of the EM algorithm
         verbose: bool, optional, verbosity mode
+        tol: float, optional,
+             convergence tolerance: a test is no longer updated once the
+             relative change of its group variance, and the change of its
+             effects relative to the group standard deviation, are below
+             tol. With the default 0, only the tests that have reached a
+             fixed point are dropped, so that all n_iter iterations are
+             effectively run
+        chunk_size: int, optional,
+                    number of tests processed at once, which bounds the
+                    memory used by the temporary arrays. By default, the
+                    chunks are made of about CHUNK_ELEMENTS data values
+        n_jobs: int, optional,
+                number of threads among which the chunks are shared,
+                see nipy.utils.parallel
         """
         self.n_iter = n_iter
         self.verbose = verbose
+        self.tol = tol
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs
         self.X = X
         self.pinv_X = np.linalg.pinv(X)
 
+    @property
+    def Y_(self):
+        """ The fitted values, array of shape (n_samples, n_tests)
+        """
+        return np.dot(self.X, self.beta_)
+
+    def _chunks(self, n_tests):
+        """ Return the slices of the successive chunks of tests
+        """
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_size = CHUNK_ELEMENTS // self.X.shape[0]
+        chunk_size = max(int(chunk_size), 1)
+        return [slice(i, i + chunk_size)
+                for i in range(0, max(n_tests, 1), chunk_size)]
+
     def log_like(self, Y, V1):
         """ Compute the log-likelihood of (Y, V1) under the model
 
@@ -137,11 +263,11 @@ class MixedEffectsModel(object):
               the log-likelihood of the model
         """
         Y, V1 = check_arrays(Y, V1)
-        tvar = self.V2 + V1
-        logl = np.sum(((Y - self.Y_) ** 2) / tvar, 0)
-        logl += np.sum(np.log(tvar), 0)
-        logl += np.log(2 * np.pi) * Y.shape[0]
-        logl *= (- 0.5)
+        logl = np.zeros(Y.shape[1])
+        for chunk in self._chunks(Y.shape[1]):
+            logl[chunk] = _log_like(Y[:, chunk], V1[:, chunk],
+                                    np.dot(self.X, self.beta_[:, chunk]),
+                                    self.V2[chunk])
         return logl
 
     def predict(self, Y, V1):
@@ -152,26 +278,6 @@ class MixedEffectsModel(object):
         """Return the log_likelihood of the data. See the log_like method"""
         return self.log_like(Y, V1)
 
-    def _one_step(self, Y, V1):
-        """Applies one step of an EM algorithm to estimate self.mean_, self.var
-
-        Parameters
-        ----------
-        Y, array of shape (n_samples, n_tests) or (n_samples)
-              the estimated effects
-        V1, array of shape (n_samples, n_tests) or (n_samples)
-                 first-level variance
-        """
-        # E step
-        prec = 1. / (self.V2 + V1)
-        Y_ = prec * (self.V2 * Y + V1 * self.Y_)
-        cvar = V1 * self.V2 * prec
-
-        # M step
-        self.beta_ = np.dot(self.pinv_X, Y_)
-        self.Y_ = np.dot(self.X, self.beta_)
-        self.V2 = np.mean((Y_ - self.Y_) ** 2, 0) + cvar.mean(0)
-
     def fit(self, Y, V1):
         """ Launches the EM algorithm to estimate self
 
@@ -190,28 +296,17 @@ class MixedEffectsModel(object):
         if self.X.shape[0] != Y.shape[0]:
             raise ValueError('X and Y must have the same numbers of rows')
         Y, V1 = check_arrays(Y, V1)
-        self.beta_ = np.dot(self.pinv_X, Y)
-        self.Y_ = np.dot(self.X, self.beta_)
-        self.V2 = np.mean((Y - self.Y_) ** 2, 0)
-
-        if self.verbose:
-            log_like_init = self.log_like(Y, V1)
-            print('Average log-likelihood: ', log_like_init.mean())
-
-        for i in range(self.n_iter):
-            self._one_step(Y, V1)
-
-            if self.verbose:
-                log_like_ = self.log_like(Y, V1)
-                if (log_like_ < (log_like_init - EPS)).any():
-                    raise ValueError('The log-likelihood cannot decrease')
-                log_like_init = log_like_
-                print('Iteration %d, average log-likelihood: %f' % (
-                        i, log_like_.mean()))
+        chunks = self._chunks(Y.shape[1])
+        results = parallel_map(
+            _fit_chunk, [(self, Y[:, chunk], V1[:, chunk])
+                         for chunk in chunks], self.n_jobs, threads=True)
+        self.beta_ = np.hstack([r[0] for r in results])
+        self.V2 = np.hstack([r[1] for r in results])
+        self.n_iter_ = np.hstack([r[2] for r in results])
         return self
 
 
-def two_sample_ftest(Y, V1, group, n_iter=5, verbose=False):
+def two_sample_ftest(Y, V1, group, n_iter=5, verbose=False, **kwargs):
     """Returns the mixed effects t-stat for each row of the X
     (one sample test)
     This uses the Formula in Roche et al., NeuroImage 2007
@@ -227,6 +322,8 @@ def two_sample_ftest(Y, V1, group, n_iter=5, verbose=False):
     n_iter: int, optional,
            number of iterations of the EM algorithm
     verbose: bool, optional, verbosity mode
+    kwargs: other keyword arguments (tol, chunk_size, n_jobs)
+            passed to mfx_stat
 
     Returns
     -------
@@ -242,10 +339,10 @@ def two_sample_ftest(Y, V1, group, n_iter=5, verbose=False):
     # create design matrices
     X = np.vstack((np.ones_like(group), group)).T
     return mfx_stat(Y, V1, X, 1, n_iter=n_iter, verbose=verbose,
-                    return_t=False, return_f=True)[0]
+                    return_t=False, return_f=True, **kwargs)[0]
 
 
-def two_sample_ttest(Y, V1, group, n_iter=5, verbose=False):
+def two_sample_ttest(Y, V1, group, n_iter=5, verbose=False, **kwargs):
     """Returns the mixed effects t-stat for each row of the X
     (one sample test)
     This uses the Formula in Roche et al., NeuroImage 2007
@@ -261,6 +358,8 @@ def two_sample_ttest(Y, V1, group, n_iter=5, verbose=False):
     n_iter: int, optional,
            number of iterations of the EM algorithm
     verbose: bool, optional, verbosity mode
+    kwargs: other keyword arguments (tol, chunk_size, n_jobs)
+            passed to mfx_stat
 
     Returns
     -------
@@ -269,10 +368,10 @@ def two_sample_ttest(Y, V1, group, n_iter=5, verbose=False):
     """
     X = np.vstack((np.ones_like(group), group)).T
     return mfx_stat(Y, V1, X, 1, n_iter=n_iter, verbose=verbose,
-                    return_t=True)[0]
+                    return_t=True, **kwargs)[0]
 
 
-def one_sample_ftest(Y, V1, n_iter=5, verbose=False):
+def one_sample_ftest(Y, V1, n_iter=5, verbose=False, **kwargs):
     """Returns the mixed effects F-stat for each row of the X
     (one sample test)
     This uses the Formula in Roche et al., NeuroImage 2007
@@ -286,6 +385,8 @@ def one_sample_ftest(Y, V1, n_iter=5, verbose=False):
     n_iter: int, optional,
            number of iterations of the EM algorithm
     verbose: bool, optional, verbosity mode
+    kwargs: other keyword arguments (tol, chunk_size, n_jobs)
+            passed to mfx_stat
 
     Returns
     -------
@@ -295,10 +396,11 @@ def one_sample_ftest(Y, V1, n_iter=5, verbose=False):
           sign of the mean for each test (allow for post-hoc signed tests)
     """
     return mfx_stat(Y, V1, np.ones((Y.shape[0], 1)), 0, n_iter=n_iter,
-                    verbose=verbose, return_t=False, return_f=True)[0]
+                    verbose=verbose, return_t=False, return_f=True,
+                    **kwargs)[0]
 
 
-def one_sample_ttest(Y, V1, n_iter=5, verbose=False):
+def one_sample_ttest(Y, V1, n_iter=5, verbose=False, **kwargs):
     """Returns the mixed effects t-stat for each row of the X
     (one sample test)
     This uses the Formula in Roche et al., NeuroImage 2007
@@ -312,6 +414,8 @@ def one_sample_ttest(Y, V1, n_iter=5, verbose=False):
     n_iter: int, optional,
            number of iterations of the EM algorithm
     verbose: bool, optional, verbosity mode
+    kwargs: other keyword arguments (tol, chunk_size, n_jobs)
+            passed to mfx_stat
 
     Returns
     -------
@@ -319,12 +423,13 @@ def one_sample_ttest(Y, V1, n_iter=5, verbose=False):
            statistical values obtained from the likelihood ratio test
     """
     return mfx_stat(Y, V1, np.ones((Y.shape[0], 1)), 0, n_iter=n_iter,
-                    verbose=verbose, return_t=True)[0]
+                    verbose=verbose, return_t=True, **kwargs)[0]
 
 
 def mfx_stat(Y, V1, X, column, n_iter=5, return_t=True,
              return_f=False, return_effect=False,
-             return_var=False, verbose=False):
+             return_var=False, verbose=False, tol=0., chunk_size=None,
+             n_jobs=1):
     """Run a mixed-effects model test on the column of the design matrix
 
     Parameters
@@ -349,6 +454,13 @@ def mfx_stat(Y, V1, X, column, n_iter=5, return_t=True,
               should one return the variance estimate (False by default)
 
     verbose: bool, optional, verbosity mode
+    tol: float, optional,
+         convergence tolerance of the EM algorithm
+    chunk_size: int, optional,
+                number of tests processed at once
+    n_jobs: int, optional,
+            number of threads among which the chunks of tests are shared
+            (see MixedEffectsModel for these three parameters)
 
     Returns
     -------
@@ -368,8 +480,10 @@ def mfx_stat(Y, V1, X, column, n_iter=5, return_t=True,
     X0 = X * contrast_mask
 
     # instantiate the mixed effects models
-    model_0 = MixedEffectsModel(X0, n_iter=n_iter, verbose=verbose).fit(Y, V1)
-    model_1 = MixedEffectsModel(X, n_iter=n_iter, verbose=verbose).fit(Y, V1)
+    kwargs = dict(n_iter=n_iter, verbose=verbose, tol=tol,
+                  chunk_size=chunk_size, n_jobs=n_jobs)
+    model_0 = MixedEffectsModel(X0, **kwargs).fit(Y, V1)
+    model_1 = MixedEffectsModel(X, **kwargs).fit(Y, V1)
 
     # compute the log-likelihood ratio statistic
     fstat = 2 * (model_1.log_like(Y, V1) - model_0.log_like(Y, V1))
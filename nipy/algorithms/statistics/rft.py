@@ -16,12 +16,20 @@ Taylor, J.E. & Worsley, K.J. (2008). "Random fields of multivariate
 from __future__ import print_function
 from __future__ import absolute_import
 
+from collections import OrderedDict
+
 import numpy as np
 from numpy.linalg import pinv    
 
 from scipy import stats
 from scipy.misc import factorial
-from scipy.special import gamma, gammaln, beta, hermitenorm
+from scipy.special import gamma, gammaln, beta, hermitenorm, ndtr, stdtr
+
+# Number of (quasi-)polynomial coefficient sets kept by ECcone, see
+# ECcone.coefficients
+EC_CACHE_SIZE = 256
+_EC_CACHE = OrderedDict()
+
 
 def binomial(n, k):
     """ Binomial coefficient
@@ -411,16 +419,7 @@ class IntrinsicVolumes(object):
     def __mul__(self, other):
         if not isinstance(other, IntrinsicVolumes):
             raise ValueError('expecting an IntrinsicVolumes instance')
-        order = self.order + other.order + 1
-        mu = np.zeros(order)
-
-        for i in range(order):
-            for j in range(i+1):
-                try:
-                    mu[i] += self.mu[j] * other.mu[i-j]
-                except:
-                    pass
-        return self.__class__(mu)
+        return self.__class__(np.convolve(self.mu, other.mu))
 
 
 class ECcone(IntrinsicVolumes):
@@ -457,12 +456,69 @@ class ECcone(IntrinsicVolumes):
 
         search *= self.product
 
+        c_even, e_even, c_odd, e_odd = self.coefficients(search)
+
+        if np.isfinite(self.dfd):
+            denom = 1 + x**2/self.dfd
+            _rho = (np.polyval(c_even, x) / np.power(denom, e_even) +
+                    np.polyval(c_odd, x) / np.power(denom, e_odd))
+            _rho *= np.power(denom, -(self.dfd-1)/2.)
+        else:
+            _rho = np.polyval(c_even, x)
+            _rho *= np.exp(-x**2/2.)
+
+        if search.mu[0] * self.mu[0] != 0.:
+            # tail probability is not "quasi-polynomial"
+            if not np.isfinite(self.dfd):
+                P = ndtr(-x)
+            else:
+                P = stdtr(self.dfd, -x)
+            _rho += P * search.mu[0] * self.mu[0]
+        return _rho
+
+    def coefficients(self, search):
+        """ Coefficients of the (quasi-)polynomial part of the EC density
+
+        The results are memoized, for the last `EC_CACHE_SIZE` different
+        sets of intrinsic volumes, degrees of freedom and search regions,
+        so that repeated evaluations only cost a polynomial evaluation.
+
+        Parameters
+        ----------
+        search : IntrinsicVolumes instance
+            the search region, including the product region
+
+        Returns
+        -------
+        c_even : array
+            coefficients of the polynomial with integer exponent
+        e_even : float
+            exponent of its premultiplier
+        c_odd : array
+            coefficients of the polynomial with half integer exponent,
+            zero if self.dfd is infinite
+        e_odd : float
+            exponent of its premultiplier
+        """
+        key = (self.__class__, tuple(self.mu), self.dfd, tuple(search.mu))
+        try:
+            value = _EC_CACHE.pop(key)
+        except KeyError:
+            value = self._coefficients(search)
+            if len(_EC_CACHE) >= EC_CACHE_SIZE:
+                _EC_CACHE.popitem(last=False)
+        _EC_CACHE[key] = value
+        return value
+
+    def _coefficients(self, search):
+        """ Compute the result of `coefficients`, without memoization
+        """
         if np.isfinite(self.dfd):
             q_even = ECquasi([0], m=self.dfd, exponent=0)
             q_odd = ECquasi([0], m=self.dfd, exponent=0.5)
         else:
             q_even = np.poly1d([0])
-            q_odd = np.poly1d([0])
+            q_odd = ECquasi([0])
 
         for k in range(search.mu.shape[0]):
             q = self.quasi(k)
@@ -473,21 +529,10 @@ class ECcone(IntrinsicVolumes):
             else:
                 q_even += q * c
 
-        _rho = q_even(x) + q_odd(x)
-
         if np.isfinite(self.dfd):
-            _rho *= np.power(1 + x**2/self.dfd, -(self.dfd-1)/2.)
-        else:
-            _rho *= np.exp(-x**2/2.)
-
-        if search.mu[0] * self.mu[0] != 0.:
-            # tail probability is not "quasi-polynomial"
-            if not np.isfinite(self.dfd):
-                P = stats.norm.sf
-            else:
-                P = lambda x: stats.t.sf(x, self.dfd)
-            _rho += P(x) * search.mu[0] * self.mu[0]
-        return _rho
+            return (q_even.coeffs, q_even.exponent,
+                    q_odd.coeffs, q_odd.exponent)
+        return q_even.coeffs, 0., q_odd.coeffs, 0.
 
     def pvalue(self, x, search=None):
         return self(x, search=search)
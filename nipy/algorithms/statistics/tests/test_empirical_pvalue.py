@@ -6,12 +6,14 @@ Test the empirical null estimator.
 from __future__ import absolute_import
 import warnings
 import numpy as np
-from nose.tools import assert_true
+import scipy.stats as st
+from numpy.testing import assert_array_almost_equal, assert_almost_equal
+from nose.tools import assert_true, assert_equal, assert_raises
 
 
 from ..empirical_pvalue import (
     NormalEmpiricalNull, smoothed_histogram_from_samples, fdr, fdr_threshold, 
-    gaussian_fdr_threshold, gaussian_fdr)
+    gaussian_fdr_threshold, gaussian_fdr, multiple_fdr)
 
 def setup():
     # Suppress warnings during tests to reduce noise
@@ -32,6 +34,54 @@ def test_efdr():
     np.testing.assert_array_less(-efdr.threshold(alpha=0.05), -2.8)
     np.testing.assert_array_less(-efdr.uncorrected_threshold(alpha=0.001), -2.5)
 
+def test_efdr_curve():
+    # the vectorized FDR curve matches the original loop
+    np.random.seed(0)
+    x = np.random.randn(1000)
+    x[:30] += 3
+    efdr = NormalEmpiricalNull(x)
+    efp = efdr.fdrcurve()
+    ref = np.minimum(efdr.p0 * st.norm.sf(efdr.x, efdr.mu, efdr.sigma)
+                     * efdr.n / np.arange(efdr.n, 0, -1), 1)
+    for i in range(efdr.n - 1, 0, -1):
+        ref[i - 1] = max(ref[i], ref[i - 1])
+    assert_array_almost_equal(efp, ref)
+    theta = np.array([-1., 2., 3.5, 100.])
+    assert_array_almost_equal(efdr.fdr(theta),
+                              [efdr.fdr(th) for th in theta])
+    assert_equal(efdr.fdr(100.), 0)
+
+
+def test_efdr_histogram():
+    # the histogram mode approximates the exact one
+    np.random.seed(0)
+    n = 100000
+    x = np.random.randn(n)
+    x[:3000] += 3
+    efdr = NormalEmpiricalNull(x)
+    theta = np.array([2., 3., 4.])
+    fdr_exact = efdr.fdr(theta)
+    th_exact = efdr.threshold(alpha=0.05)
+    chunks = (x[i: i + 7000] for i in range(0, n, 7000))
+    hfdr = NormalEmpiricalNull(chunks, bin_width=1.e-3)
+    assert_equal(hfdr.n, n)
+    assert_true(hfdr.x is None)
+    assert_true(hfdr.counts.size < 20000)
+    assert_array_almost_equal(
+        hfdr.fdr(theta), NormalEmpiricalNull(x, bin_width=1.e-3).fdr(theta))
+    assert_true(np.abs(hfdr.mu - efdr.mu) < 0.005)
+    assert_true(np.abs(hfdr.sigma - efdr.sigma) < 0.005)
+    assert_true(np.abs(hfdr.p0 - efdr.p0) < 0.005)
+    assert_true(np.abs(hfdr.fdr(theta) - fdr_exact).max() < 0.005)
+    assert_true(np.abs(hfdr.threshold(alpha=0.05) - th_exact) < 0.02)
+    assert_almost_equal(hfdr.uncorrected_threshold(alpha=0.001),
+                        efdr.uncorrected_threshold(alpha=0.001), 1)
+    assert_equal(hfdr.fdr(100.), 0)
+    x[0] = np.nan
+    assert_raises(ValueError, NormalEmpiricalNull, x, bin_width=1.e-3)
+    assert_raises(ValueError, NormalEmpiricalNull, [0, 1.e6], bin_width=1.e-3)
+
+
 def test_smooth_histo():
    n = 100
    x = np.random.randn(n)
@@ -59,6 +109,28 @@ def test_fdr_neg():
     pc = fdr_threshold(x)
     assert_true(pc == .05 / 100)
 
+def test_multiple_fdr():
+    np.random.seed([1])
+    p_values = np.random.rand(4, 100)
+    p_values[:, :10] *= (.05 / 10)
+    p_values[1] = np.round(p_values[1], 2)
+    p_values[3] *= .8
+    p_values[3] += .2
+    alphas = np.array([.01, .05, .2])
+    for n_jobs in (1, 2):
+        critical_p_values, q = multiple_fdr(p_values, alphas, n_jobs=n_jobs)
+        assert_equal(critical_p_values.shape, (4, 3))
+        for i, p in enumerate(p_values):
+            assert_array_almost_equal(q[i], fdr(p))
+            for j, alpha in enumerate(alphas):
+                assert_almost_equal(critical_p_values[i, j],
+                                    fdr_threshold(p, alpha))
+    pc, q = multiple_fdr(p_values[0])
+    assert_almost_equal(pc, fdr_threshold(p_values[0]))
+    assert_array_almost_equal(q, fdr(p_values[0]))
+    assert_raises(ValueError, multiple_fdr, p_values - 1)
+
+
 def test_gaussian_fdr():
     # Test that fdr works on Gaussian data
     np.random.seed([2])
@@ -323,6 +323,26 @@ def test_lips3_disjoint():
     assert_raises(ValueError, phi, c[:,:,:,1], box1)
 
 
+def test_lips3_n_jobs():
+    # Slabs processed by several threads give the same results, as do
+    # single precision coordinates
+    mask = np.zeros((30, 20, 25), dtype=np.int)
+    mask[3:27, 2:15, 5:20] = 1
+    mask[10:20, 5:10, 8:12] = 0
+    mask[0, 0, 0] = 1
+    d = np.random.standard_normal((10,) + mask.shape)
+    lips = intvol.Lips3d(d, mask)
+    for n_jobs in (2, 5):
+        assert_array_equal(intvol.Lips3d(d, mask, n_jobs), lips)
+        assert_equal(intvol.EC3d(mask, n_jobs), intvol.EC3d(mask))
+    # a box with a cavity, and an isolated voxel
+    assert_equal(intvol.EC3d(mask), 3)
+    assert_almost_equal(intvol.Lips3d(d.astype(np.float32), mask), lips, 3)
+    c = np.indices(mask.shape).astype(np.float32)
+    assert_almost_equal(intvol.Lips3d(c, mask, 3),
+                        intvol.Lips3d(c.astype(np.float), mask))
+
+
 def test_lips3_nans():
     # These boxes caused nans in the Lips3 disjoint box tests
     phi = intvol.Lips3d
@@ -14,8 +14,8 @@ import numpy.random as nr
 
 from ..mixed_effects_stat import (
     one_sample_ttest, one_sample_ftest, two_sample_ttest, two_sample_ftest, 
-    generate_data, t_stat, mfx_stat)
-from ..bayesian_mixed_effects import two_level_glm
+    generate_data, t_stat, mfx_stat, MixedEffectsModel)
+from ..bayesian_mixed_effects import two_level_glm, ragged_two_level_glm
 
 
 def test_mfx():
@@ -44,6 +44,46 @@ def test_mfx():
     fx, = mfx_stat(Y, V1, X, 1, return_t=False, return_effect=True)
     assert_true(fx.shape == (n_tests,))
 
+def test_mfx_chunks():
+    """ Test that chunking and threading do not change the results"""
+    n_samples, n_tests = 20, 100
+    np.random.seed(1)
+    V1 = np.random.rand(n_samples, n_tests)
+    Y = generate_data(np.ones((n_samples, 1)), 0, 1, V1)
+    X = np.random.randn(20, 3)
+    t1, v1 = mfx_stat(Y, V1, X, 1, return_var=True)
+    for chunk_size, n_jobs in [(7, 1), (7, 3), (1000, 2)]:
+        t2, v2 = mfx_stat(Y, V1, X, 1, return_var=True,
+                          chunk_size=chunk_size, n_jobs=n_jobs)
+        assert_array_almost_equal(t1, t2)
+        assert_array_almost_equal(v1, v2)
+    u = np.concatenate((np.ones(5), np.zeros(15)))
+    assert_array_almost_equal(two_sample_ttest(Y, V1, u),
+                              two_sample_ttest(Y, V1, u, chunk_size=9))
+
+
+def test_mfx_tol():
+    """ Test the convergence-based stopping of the EM algorithm"""
+    n_samples, n_tests = 20, 100
+    np.random.seed(1)
+    V1 = np.random.rand(n_samples, n_tests)
+    Y = generate_data(np.ones((n_samples, 1)), 0, 1, V1)
+    X = np.ones((n_samples, 1))
+    model = MixedEffectsModel(X, n_iter=100).fit(Y, V1)
+    model_tol = MixedEffectsModel(X, n_iter=100, tol=1.e-6,
+                                  chunk_size=30).fit(Y, V1)
+    assert_true((model.n_iter_ <= 100).all())
+    assert_true((model_tol.n_iter_ < model.n_iter_).any())
+    assert_array_almost_equal(model.V2, model_tol.V2, 4)
+    assert_array_almost_equal(model.beta_, model_tol.beta_, 4)
+    assert_array_almost_equal(model.log_like(Y, V1),
+                              model_tol.log_like(Y, V1), 4)
+    # verbose mode checks the monotonicity of the likelihood
+    t1 = one_sample_ttest(Y, V1, n_iter=20, tol=1.e-3)
+    t2 = one_sample_ttest(Y, V1, n_iter=20, tol=1.e-3, verbose=1)
+    assert_almost_equal(t1, t2)
+
+
 def test_t_test():
     """ test that the t test run
     """
@@ -163,6 +203,73 @@ def test_two_level_glm_novar():
     assert  s2_error < 0.1
 
 
+def test_ragged_two_level_glm():
+    sizes = np.array([2, 7, 3, 20])
+    y = np.random.normal(0, 1, size=sizes.sum())
+    vy = np.random.rand(sizes.sum())
+    beta, s2, dof = ragged_two_level_glm(y, vy, sizes)
+    start = 0
+    for i, size in enumerate(sizes):
+        b, s, d = two_level_glm(y[start:start + size],
+                                vy[start:start + size], np.ones(size))
+        assert_almost_equal(beta[i], b)
+        assert_almost_equal(s2[i], s)
+        assert_almost_equal(dof[i], d)
+        start += size
+    assert_raises(ValueError, ragged_two_level_glm, y, vy, [1, 31])
+    assert_raises(ValueError, ragged_two_level_glm, y, vy, [2, 3])
+
+
+def test_ragged_two_level_glm_design():
+    sizes = np.array([4, 7, 3, 20])
+    X = np.random.normal(0, 1, size=(sizes.sum(), 2))
+    y = np.random.normal(0, 1, size=sizes.sum())
+    vy = np.random.rand(sizes.sum())
+    beta, s2, dof = ragged_two_level_glm(y, vy, sizes, X)
+    assert_true(beta.shape == (4, 2))
+    start = 0
+    for i, size in enumerate(sizes):
+        sl = slice(start, start + size)
+        b, s, d = two_level_glm(y[sl], vy[sl], X[sl])
+        assert_array_almost_equal(beta[i], b.ravel())
+        assert_almost_equal(s2[i], s)
+        assert_almost_equal(dof[i], d)
+        start += size
+    # early stopping of the converged problems
+    beta1, s21, _ = ragged_two_level_glm(y, vy, sizes, X, niter=200)
+    beta2, s22, _ = ragged_two_level_glm(y, vy, sizes, X, niter=200,
+                                         tol=1.e-8)
+    assert_array_almost_equal(beta1, beta2)
+    assert_array_almost_equal(s21, s22)
+    assert_raises(ValueError, ragged_two_level_glm, y, vy, [2, 32], X)
+    assert_raises(ValueError, ragged_two_level_glm, y, vy, sizes, X[1:])
+
+
+def test_ragged_two_level_glm_rank_deficient():
+    # one problem with an all-zero regressor, another one with no data
+    # on the first regressor
+    sizes = np.array([5, 8, 6])
+    X = np.random.normal(0, 1, size=(sizes.sum(), 2))
+    X[5:13, 1] = 0
+    X[13:, 0] = 0
+    y = np.random.normal(0, 1, size=sizes.sum())
+    vy = np.random.rand(sizes.sum())
+    beta, s2, dof = ragged_two_level_glm(y, vy, sizes, X)
+    start = 0
+    for i, size in enumerate(sizes):
+        sl = slice(start, start + size)
+        b, s, d = two_level_glm(y[sl], vy[sl], X[sl])
+        assert_array_almost_equal(beta[i], b.ravel())
+        assert_almost_equal(s2[i], s)
+        start += size
+    # same with a single all-zero regressor
+    X1 = X[:, 1]
+    beta, s2, dof = ragged_two_level_glm(y, vy, sizes, X1)
+    b, s, d = two_level_glm(y[5:13], vy[5:13], X1[5:13])
+    assert_almost_equal(beta[1], b)
+    assert_almost_equal(s2[1], s)
+
+
 def test_two_level_glm_error():
     # this tests whether two_level_glm raises a value error if the
     # design matrix has more regressors than the number of
@@ -10,7 +10,7 @@ from scipy.misc import factorial
 
 from .. import rft
 
-from nose.tools import assert_raises
+from nose.tools import assert_raises, assert_equal
 
 from numpy.testing import assert_almost_equal, dec
 
@@ -251,6 +251,32 @@ def test_search():
     assert_almost_equal(v1, v2)
 
 
+def test_coefficients_cache():
+    # The memoized coefficients give the quasi-polynomial evaluation
+    x = np.linspace(0.1,10,100)
+    search = rft.IntrinsicVolumes([3,4,5])
+    for dfd in [np.inf, 20]:
+        stat = rft.TStat(dfd=dfd, search=search)
+        q = [stat.quasi(k) for k in range(3)]
+        if np.isfinite(dfd):
+            q = [q_even(x) + q_odd(x) for q_even, q_odd in q]
+        else:
+            q = [q_k(x) for q_k in q]
+        v = sum(q[k] * search.mu[k] * np.power(2*np.pi, -(k+1)/2.)
+                for k in range(3))
+        if np.isfinite(dfd):
+            v = v * np.power(1 + x**2/dfd, -(dfd-1)/2.)
+            v += 3 * scipy.stats.t.sf(x, dfd)
+        else:
+            v = v * np.exp(-x**2/2.) + 3 * scipy.stats.norm.sf(x)
+        assert_almost_equal(stat(x), v)
+        assert_almost_equal([stat(y) for y in x], v)
+    # the cache is bounded
+    for dfd in range(10, 10 + 2 * rft.EC_CACHE_SIZE):
+        rft.TStat(dfd=dfd)(x)
+    assert_equal(len(rft._EC_CACHE), rft.EC_CACHE_SIZE)
+
+
 @dec.slow
 def test_search1():
     # Test that the search region works.
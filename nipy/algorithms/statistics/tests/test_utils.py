@@ -9,7 +9,8 @@ import scipy.linalg as spl
 
 from ..utils import multiple_mahalanobis, z_score, multiple_fast_inv
 from nose.tools import assert_true
-from numpy.testing import assert_almost_equal, assert_array_almost_equal
+from numpy.testing import (assert_almost_equal, assert_array_almost_equal,
+                           assert_raises)
 
 def test_z_score():
     p = np.random.rand(10)
@@ -35,6 +36,36 @@ def test_mahalanobis2():
     f_mah = (multiple_mahalanobis(x, Aa))[i]
     assert_almost_equal(mah, f_mah)
 
+def test_mahalanobis_batch():
+    # positive definite, non-symmetric and indefinite covariances
+    n_samples = 50
+    x = np.random.randn(4, n_samples)
+    A = np.random.randn(4, 6, n_samples)
+    Aa = np.array([np.dot(A[:, :, i], A[:, :, i].T)
+                   for i in range(n_samples)]).T
+    Aa[0, 1, 3] += 1
+    Aa[:, :, 7] *= -1
+    mah = [np.dot(x[:, i], np.dot(np.linalg.inv(Aa[:, :, i]), x[:, i]))
+           for i in range(n_samples)]
+    assert_array_almost_equal(multiple_mahalanobis(x, Aa), mah)
+    # singular covariance
+    Aa[:, :, 5] = 0
+    assert_raises(np.linalg.LinAlgError, multiple_mahalanobis, x, Aa)
+
+
+def test_mahalanobis_broadcast():
+    # a single covariance shared by all the samples
+    x = np.random.randn(3, 5)
+    mah = np.sum(x ** 2, 0) / 2
+    assert_array_almost_equal(multiple_mahalanobis(x, 2 * np.eye(3)), mah)
+    # a single effect evaluated with several covariances
+    Aa = np.array([(i + 1) * np.eye(3) for i in range(4)]).T
+    assert_array_almost_equal(multiple_mahalanobis(x[:, 0], Aa),
+                              np.sum(x[:, 0] ** 2) / np.arange(1, 5))
+    # mismatched numbers of samples
+    assert_raises(ValueError, multiple_mahalanobis, x, Aa)
+
+
 def test_multiple_fast_inv():
     shape = (10, 20, 20)
     X = np.random.randn(*shape)
@@ -8,6 +8,11 @@ import numpy as np
 from scipy.stats import norm
 
 TINY = 1e-16
+EPS = np.finfo(np.float64).eps
+
+# Relative tolerance on the asymmetry of a covariance matrix, below which
+# it is handled by the Cholesky path of multiple_mahalanobis
+SYMMETRY_RTOL = 1e-8
 
 
 def z_score(pvalue):
@@ -111,17 +116,72 @@ def multiple_mahalanobis(effect, covariance):
     if covariance.shape[0] != covariance.shape[1]:
         raise ValueError('Inconsistant shape for covariance')
 
-    # transpose and make contuguous for the sake of speed
-    Xt, Kt = np.ascontiguousarray(effect.T), np.ascontiguousarray(covariance.T)
-
-    # compute the inverse of the covariances
-    Kt = multiple_fast_inv(Kt)
-    
-    # derive the squared Mahalanobis distances
-    sqd = np.sum(np.sum(Xt[:, :, np.newaxis] * Xt[:, np.newaxis] * Kt, 1), 1)
+    # repeat a single effect or covariance for all the samples
+    dim = effect.shape[0]
+    n_samples = max(effect.shape[1], covariance.shape[2])
+    if effect.shape[1] not in (1, n_samples) or \
+            covariance.shape[2] not in (1, n_samples):
+        raise ValueError('Inconsistant number of samples for effect and '
+                         'covariance')
+    if effect.shape[1] == 1:
+        effect = effect[:, np.zeros(n_samples, dtype=np.intp)]
+    if covariance.shape[2] == 1:
+        covariance = covariance[:, :, np.zeros(n_samples, dtype=np.intp)]
+
+    # solve with the Cholesky factors of the symmetric positive definite
+    # covariances
+    sqd, spd = _cholesky_mahalanobis(effect, covariance)
+    flat = covariance.reshape((dim * dim, n_samples))
+    asym = np.abs(flat - covariance.transpose((1, 0, 2)).reshape(flat.shape))
+    spd &= asym.max(0) <= SYMMETRY_RTOL * np.abs(flat).max(0)
+    if spd.all():
+        return sqd
+
+    # invert the other ones, transposed and made contiguous for the sake of
+    # speed
+    Xt = np.ascontiguousarray(effect.T[~spd])
+    Kt = multiple_fast_inv(np.ascontiguousarray(covariance.T[~spd]))
+    sqd[~spd] = np.sum(np.sum(Xt[:, :, np.newaxis] * Xt[:, np.newaxis] * Kt,
+                              1), 1)
     return sqd
 
 
+def _cholesky_mahalanobis(x, a):
+    """ Squared Mahalanobis distances through a batched Cholesky solve
+
+    The Cholesky factors L of all the matrices are computed column by
+    column, together with ``z = L^{-1} x``, so that ``x' a^{-1} x = z' z``
+    is obtained without inverting the matrices. All the operations are
+    vectorized along the last (sample) axis.
+
+    Parameters
+    ----------
+    x: array of shape (M, n_samples)
+    a: array of shape (M, M, n_samples)
+       symmetric matrices, only their lower triangle is used
+
+    Returns
+    -------
+    sqd: array of shape (n_samples,)
+         the squared distances, meaningless where `spd` is False
+    spd: array of shape (n_samples,)
+         whether the factorization succeeded, i.e. whether the matrix is
+         positive definite and not close to singular
+    """
+    dim, n_samples = x.shape
+    L = np.zeros((dim, dim, n_samples))
+    z = np.zeros((dim, n_samples))
+    spd = np.ones(n_samples, dtype=bool)
+    for j in range(dim):
+        v = a[j:, j] - np.sum(L[j:, :j] * L[j, :j], 1)
+        spd &= v[0] > dim * EPS * a[j, j]
+        d = np.sqrt(np.where(spd, v[0], 1))
+        L[j, j] = d
+        L[j + 1:, j] = v[1:] / d
+        z[j] = (x[j] - np.sum(L[j, :j] * z[:j], 0)) / d
+    return np.sum(z ** 2, 0), spd
+
+
 def complex(maximal=[(0, 3, 2, 7),
                      (0, 6, 2, 7),
                      (0, 7, 5, 4),
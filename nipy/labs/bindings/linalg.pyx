@@ -265,7 +265,8 @@ def vector_median(X):
     cdef fff_vector* x
     cdef double m
     x = fff_vector_fromPyArray(X)
-    m = fff_vector_median(x)
+    with nogil:
+        m = fff_vector_median(x)
     fff_vector_delete(x)
     return m
 
@@ -277,7 +278,8 @@ def vector_quantile(X, double r, int interp):
     cdef fff_vector* x
     cdef double q
     x = fff_vector_fromPyArray(X)
-    q = fff_vector_quantile(x, r, interp)
+    with nogil:
+        q = fff_vector_quantile(x, r, interp)
     fff_vector_delete(x)
     return q
 
@@ -14,7 +14,7 @@ __version__ = '0.1'
 from fff cimport *
 
 # Exports from fff_onesample_stat.h
-cdef extern from "fff_onesample_stat.h":
+cdef extern from "fff_onesample_stat.h" nogil:
 
   ctypedef enum fff_onesample_stat_flag:
     FFF_ONESAMPLE_EMPIRICAL_MEAN = 0
@@ -64,6 +64,8 @@ fffpy_import_array()
 import_array()
 import numpy as np
 
+from nipy.utils.parallel import chunk_slices, parallel_map
+
 
 # Stat dictionary
 stats = {'mean': FFF_ONESAMPLE_EMPIRICAL_MEAN,
@@ -85,143 +87,166 @@ stats = {'mean': FFF_ONESAMPLE_EMPIRICAL_MEAN,
 
 
 # Test stat without mixed-effect correction
-def stat(ndarray Y, id='student', double base=0.0,
-         int axis=0, ndarray Magics=None):
+def _stat_chunk(args):
   """
-  T = stat(Y, id='student', base=0.0, axis=0, magics=None).
-  
-  Compute a one-sample test statistic over a number of deterministic
-  or random permutations. 
+  Run `stat` on a chunk of voxels, without the GIL.
   """
-  cdef fff_vector *y, *t, *magics, *yp
+  cdef ndarray Y, T, Magics
+  cdef fff_vector *y, *t, *yp
   cdef fff_onesample_stat* stat
-  cdef fff_onesample_stat_flag flag_stat = stats[id]
-  cdef unsigned int n
+  cdef fff_onesample_stat_flag flag_stat
+  cdef double base, magic
+  cdef double* magics
+  cdef int axis
   cdef unsigned long int simu, nsimu, idx
-  cdef double magic
   cdef fffpy_multi_iterator* multi
+  Y, T, flag_stat, base, axis, Magics = args
 
-  # Get number of observations
-  n = <unsigned int>Y.shape[axis]
-
-  # Read out magic numbers
-  if Magics is None:
-    magics = fff_vector_new(1)
-    magics.data[0] = 0 ## Just to make sure
-  else:
-    magics = fff_vector_fromPyArray(Magics)
-    
-  # Create output array
-  nsimu = magics.size
-  dims = [Y.shape[i] for i in range(Y.ndim)]
-  dims[axis] = nsimu 
-  T = np.zeros(dims)
-
-  # Create local structure
-  stat = fff_onesample_stat_new(n, flag_stat, base)
-  yp = fff_vector_new(n)
-
-  # Multi-iterator 
+  # Create local structures
+  stat = fff_onesample_stat_new(Y.shape[axis], flag_stat, base)
+  yp = fff_vector_new(Y.shape[axis])
   multi = fffpy_multi_iterator_new(2, axis, <void*>Y, <void*>T)
-
-  # Vector views
   y = multi.vector[0]
   t = multi.vector[1]
-  
+  magics = <double*>Magics.data
+  nsimu = Magics.size
+
   # Loop
-  for simu from 0 <= simu < nsimu:
-    
-    # Set the magic number
-    magic = magics.data[simu*magics.stride]
-      
-    # Reset the multi-iterator
-    fffpy_multi_iterator_reset(multi); 
-    
-    # Perform the loop 
-    idx = simu*t.stride
-    while(multi.index < multi.size):
-      fff_onesample_permute_signs(yp, y, magic)
-      t.data[idx] = fff_onesample_stat_eval(stat, yp)
-      fffpy_multi_iterator_update(multi)
-
-  # Free memory 
+  with nogil:
+    for simu from 0 <= simu < nsimu:
+
+      # Set the magic number
+      magic = magics[simu]
+
+      # Reset the multi-iterator
+      fffpy_multi_iterator_reset(multi)
+
+      # Perform the loop
+      idx = simu*t.stride
+      while(multi.index < multi.size):
+        fff_onesample_permute_signs(yp, y, magic)
+        t.data[idx] = fff_onesample_stat_eval(stat, yp)
+        fffpy_multi_iterator_update(multi)
+
+  # Free memory
   fffpy_multi_iterator_delete(multi)
   fff_vector_delete(yp)
-  fff_vector_delete(magics)
   fff_onesample_stat_delete(stat)
 
-  # Return
-  return T
-
 
-def stat_mfx(ndarray Y, ndarray V, id='student_mfx', double base=0.0,
-             int axis=0, ndarray Magics=None, unsigned int niter=5):
+def stat(ndarray Y, id='student', double base=0.0,
+         int axis=0, ndarray Magics=None, n_jobs=1):
   """
-  T = stat_mfx(Y, V, id='student_mfx', base=0.0, axis=0, magics=None, niter=5).
+  T = stat(Y, id='student', base=0.0, axis=0, magics=None, n_jobs=1).
   
-  Compute a one-sample test statistic, with mixed-effect correction,
-  over a number of deterministic or random permutations.
+  Compute a one-sample test statistic over a number of deterministic
+  or random permutations. The voxels are split into `n_jobs` chunks
+  processed by concurrent threads; the result does not depend on
+  `n_jobs`.
   """
-  cdef fff_vector *y, *v, *t, *magics, *yp
-  cdef fff_onesample_stat_mfx* stat
   cdef fff_onesample_stat_flag flag_stat = stats[id]
-  cdef int n
-  cdef unsigned long int nsimu_max, simu, idx
-  cdef double magic
-  cdef fffpy_multi_iterator* multi
-
-  # Get number of observations
-  n = <int>Y.shape[axis]
 
   # Read out magic numbers
   if Magics is None:
-    magics = fff_vector_new(1)
-    magics.data[0] = 0 ## Just to make sure
-  else:
-    magics = fff_vector_fromPyArray(Magics)
-    
+    Magics = np.zeros(1)
+  Magics = np.ascontiguousarray(Magics, dtype=np.double).ravel()
+
   # Create output array
-  nsimu = magics.size
+  Y = np.asarray(Y, dtype=np.double)
   dims = [Y.shape[i] for i in range(Y.ndim)]
-  dims[axis] = nsimu 
+  dims[axis] = Magics.size
   T = np.zeros(dims)
 
-  # Create local structure
-  stat = fff_onesample_stat_mfx_new(n, flag_stat, base)
-  stat.niter = niter
-  yp = fff_vector_new(n)
+  # Loop over the chunks
+  chunks = [(Y[sl], T[sl], flag_stat, base, axis, Magics)
+            for sl in chunk_slices(dims, axis, n_jobs)]
+  parallel_map(_stat_chunk, chunks, n_jobs, threads=True)
+
+  # Return
+  return T
 
-  # Multi-iterator 
-  multi = fffpy_multi_iterator_new(3, axis, <void*>Y, <void*>V, <void*>T)
 
-  # Vector views
+def _stat_mfx_chunk(args):
+  """
+  Run `stat_mfx` on a chunk of voxels, without the GIL.
+  """
+  cdef ndarray Y, V, T, Magics
+  cdef fff_vector *y, *v, *t, *yp
+  cdef fff_onesample_stat_mfx* stat
+  cdef fff_onesample_stat_flag flag_stat
+  cdef double base, magic
+  cdef double* magics
+  cdef int axis
+  cdef unsigned int niter
+  cdef unsigned long int simu, nsimu, idx
+  cdef fffpy_multi_iterator* multi
+  Y, V, T, flag_stat, base, axis, Magics, niter = args
+
+  # Create local structures
+  stat = fff_onesample_stat_mfx_new(Y.shape[axis], flag_stat, base)
+  stat.niter = niter
+  yp = fff_vector_new(Y.shape[axis])
+  multi = fffpy_multi_iterator_new(3, axis, <void*>Y, <void*>V, <void*>T)
   y = multi.vector[0]
   v = multi.vector[1]
   t = multi.vector[2]
-  
-  # Loop  
-  for simu from 0 <= simu < nsimu:
+  magics = <double*>Magics.data
+  nsimu = Magics.size
 
-    # Set the magic number
-    magic = magics.data[simu*magics.stride]
-    
-    # Reset the multi-iterator      
-    fffpy_multi_iterator_reset(multi)
-    
-    # Perform the loop 
-    idx = simu*t.stride
-    while(multi.index < multi.size):
-      fff_onesample_permute_signs(yp, y, magic)
-      t.data[idx] = fff_onesample_stat_mfx_eval(stat, yp, v)
-      fffpy_multi_iterator_update(multi)
-      
+  # Loop
+  with nogil:
+    for simu from 0 <= simu < nsimu:
+
+      # Set the magic number
+      magic = magics[simu]
+
+      # Reset the multi-iterator
+      fffpy_multi_iterator_reset(multi)
+
+      # Perform the loop
+      idx = simu*t.stride
+      while(multi.index < multi.size):
+        fff_onesample_permute_signs(yp, y, magic)
+        t.data[idx] = fff_onesample_stat_mfx_eval(stat, yp, v)
+        fffpy_multi_iterator_update(multi)
 
   # Free memory
   fffpy_multi_iterator_delete(multi)
   fff_vector_delete(yp)
-  fff_vector_delete(magics)
   fff_onesample_stat_mfx_delete(stat)
+
+
+def stat_mfx(ndarray Y, ndarray V, id='student_mfx', double base=0.0,
+             int axis=0, ndarray Magics=None, unsigned int niter=5,
+             n_jobs=1):
+  """
+  T = stat_mfx(Y, V, id='student_mfx', base=0.0, axis=0, magics=None, niter=5,
+               n_jobs=1).
   
+  Compute a one-sample test statistic, with mixed-effect correction,
+  over a number of deterministic or random permutations. The voxels
+  are split into `n_jobs` chunks processed by concurrent threads; the
+  result does not depend on `n_jobs`.
+  """
+  cdef fff_onesample_stat_flag flag_stat = stats[id]
+
+  # Read out magic numbers
+  if Magics is None:
+    Magics = np.zeros(1)
+  Magics = np.ascontiguousarray(Magics, dtype=np.double).ravel()
+
+  # Create output array
+  Y = np.asarray(Y, dtype=np.double)
+  V = np.asarray(V, dtype=np.double)
+  dims = [Y.shape[i] for i in range(Y.ndim)]
+  dims[axis] = Magics.size
+  T = np.zeros(dims)
+
+  # Loop over the chunks
+  chunks = [(Y[sl], V[sl], T[sl], flag_stat, base, axis, Magics, niter)
+            for sl in chunk_slices(dims, axis, n_jobs)]
+  parallel_map(_stat_mfx_chunk, chunks, n_jobs, threads=True)
+
   # Return
   return T
 
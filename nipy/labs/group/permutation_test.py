@@ -207,23 +207,27 @@ def sorted_values(a):
 
 
 
-def onesample_stat(Y, V, stat_id, base=0.0, axis=0, Magics=None, niter=DEF_NITER):
+def onesample_stat(Y, V, stat_id, base=0.0, axis=0, Magics=None, niter=DEF_NITER,
+                   n_jobs=1):
     """
     Wrapper for os_stat and os_stat_mfx
     """
     if stat_id.find('_mfx')<0:
-        return os_stat(Y, stat_id, base, axis, Magics)
+        return os_stat(Y, stat_id, base, axis, Magics, n_jobs=n_jobs)
     else:
-        return os_stat_mfx(Y, V, stat_id, base, axis, Magics, niter)
+        return os_stat_mfx(Y, V, stat_id, base, axis, Magics, niter,
+                           n_jobs=n_jobs)
 
-def twosample_stat(Y1, V1, Y2, V2, stat_id, axis=0, Magics=None, niter=DEF_NITER):
+def twosample_stat(Y1, V1, Y2, V2, stat_id, axis=0, Magics=None, niter=DEF_NITER,
+                   n_jobs=1):
     """
     Wrapper for ts_stat and ts_stat_mfx
     """
     if stat_id.find('_mfx')<0:
-        return ts_stat(Y1, Y2, stat_id, axis, Magics)
+        return ts_stat(Y1, Y2, stat_id, axis, Magics, n_jobs=n_jobs)
     else:
-        return ts_stat_mfx(Y1, V1, Y2, V2, stat_id, axis, Magics, niter)
+        return ts_stat_mfx(Y1, V1, Y2, V2, stat_id, axis, Magics, niter,
+                           n_jobs=n_jobs)
 
 #=================================================
 #=================================================
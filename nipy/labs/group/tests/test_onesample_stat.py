@@ -4,7 +4,7 @@ from __future__ import absolute_import
 from numpy.testing import assert_equal, assert_almost_equal
 import numpy as np
 
-from .. import onesample
+from .. import onesample, twosample
 
 
 def test_onesample_stat():
@@ -27,9 +27,33 @@ def test_onesample_stat():
     xT = x.T.copy()
     y = onesample.stat(xT, axis=0).reshape(nvox)
     assert_equal(y, y_target)
-    
 
-    
+
+def test_stat_n_jobs():
+    # threading over chunks of voxels does not change the results
+    rng = np.random.RandomState(0)
+    Y = rng.randn(10, 7, 5)
+    V = rng.rand(10, 7, 5)
+    magics = np.arange(4) * 17.
+    for n_jobs in (2, 3, 8):
+        for id in ('student', 'wilcoxon'):
+            assert_equal(onesample.stat(Y, id, Magics=magics, n_jobs=n_jobs),
+                         onesample.stat(Y, id, Magics=magics))
+            assert_equal(
+                twosample.stat(Y[:4], Y[4:], id, Magics=magics,
+                               n_jobs=n_jobs),
+                twosample.stat(Y[:4], Y[4:], id, Magics=magics))
+        assert_equal(
+            onesample.stat_mfx(Y.T, V.T, 'wilcoxon_mfx', axis=2,
+                               Magics=magics, n_jobs=n_jobs),
+            onesample.stat_mfx(Y.T, V.T, 'wilcoxon_mfx', axis=2,
+                               Magics=magics))
+        assert_equal(
+            twosample.stat_mfx(Y[:4], V[:4], Y[4:], V[4:], Magics=magics,
+                               n_jobs=n_jobs),
+            twosample.stat_mfx(Y[:4], V[:4], Y[4:], V[4:], Magics=magics))
+
+
 if __name__ == "__main__":
     import nose
     nose.run(argv=['', __file__])
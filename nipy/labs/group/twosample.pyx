@@ -13,7 +13,7 @@ __version__ = '0.1'
 from fff cimport *
 
 # Exports from fff_twosample_stat.h
-cdef extern from "fff_twosample_stat.h":
+cdef extern from "fff_twosample_stat.h" nogil:
 
   ctypedef enum fff_twosample_stat_flag:
     FFF_TWOSAMPLE_STUDENT = 0,
@@ -50,6 +50,8 @@ fffpy_import_array()
 import_array()
 import numpy as np
 
+from nipy.utils.parallel import chunk_slices, parallel_map
+
 
 # Stat dictionary
 stats = {'student': FFF_TWOSAMPLE_STUDENT,
@@ -63,177 +65,203 @@ def count_permutations(unsigned int n1, unsigned int n2):
   return int(n)
   
 
-def stat(ndarray Y1, ndarray Y2, id='student', int axis=0, ndarray Magics=None):
+def _stat_chunk(args):
   """
-  T = stat(Y1, Y2, id='student', axis=0, magics=None).
-  
-  Compute a two-sample test statistic (Y1>Y2) over a number of
-  deterministic or random permutations.
+  Run `stat` on a chunk of voxels, without the GIL.
   """
-  cdef fff_vector *y1, *y2, *t, *yp, *magics
+  cdef ndarray Y1, Y2, T, Magics
+  cdef fff_vector *y1, *y2, *t, *yp
   cdef fff_array *idx1, *idx2
-  cdef unsigned int n, n1, n2, nex
+  cdef unsigned int n1, n2, nex
   cdef unsigned long int simu, nsimu, idx
   cdef fff_twosample_stat* stat
-  cdef fff_twosample_stat_flag flag_stat = stats[id]
+  cdef fff_twosample_stat_flag flag_stat
   cdef double magic
+  cdef double* magics
+  cdef int axis
   cdef fffpy_multi_iterator* multi
-
-  # Get number of observations
+  Y1, Y2, T, flag_stat, axis, Magics = args
   n1 = <unsigned int>Y1.shape[axis]
   n2 = <unsigned int>Y2.shape[axis]
-  n = n1 + n2
 
-  # Read out magic numbers
-  if Magics is None:
-    magics = fff_vector_new(1)
-    magics.data[0] = 0 ## Just to make sure
-  else:
-    magics = fff_vector_fromPyArray(Magics)
-
-  # Create output array
-  nsimu = magics.size
-  dims = [Y1.shape[i] for i in range(Y1.ndim)]
-  dims[axis] = nsimu
-  T = np.zeros(dims)
-
-  # Create local structure
-  yp = fff_vector_new(n)
+  # Create local structures
+  yp = fff_vector_new(n1 + n2)
   idx1 = fff_array_new1d(FFF_UINT, n1)
   idx2 = fff_array_new1d(FFF_UINT, n2)
   stat = fff_twosample_stat_new(n1, n2, flag_stat)
-
-  # Multi-iterator 
   multi = fffpy_multi_iterator_new(3, axis, <void*>Y1, <void*>Y2, <void*>T)
-
-  # Vector views
   y1 = multi.vector[0]
   y2 = multi.vector[1]
   t = multi.vector[2]
-  
+  magics = <double*>Magics.data
+  nsimu = Magics.size
+
   # Loop
-  for simu from 0 <= simu < nsimu:
-    
-    # Set the magic number
-    magic = magics.data[simu*magics.stride]
-
-    # Generate permutation 
-    nex = fff_twosample_permutation(<unsigned int*>idx1.data,
-                                    <unsigned int*>idx2.data,
-                                    n1, n2, &magic)
-   
-    # Reset the multi-iterator
-    fffpy_multi_iterator_reset(multi)
-    
-    # Perform the loop 
-    idx = simu*t.stride
-    while(multi.index < multi.size):
-      fff_twosample_apply_permutation(yp, NULL, y1, NULL, y2, NULL, nex,
-                                      <unsigned int*>idx1.data,
-                                      <unsigned int*>idx2.data)
-      t.data[idx] = fff_twosample_stat_eval(stat, yp)
-      fffpy_multi_iterator_update(multi)
+  with nogil:
+    for simu from 0 <= simu < nsimu:
+
+      # Set the magic number
+      magic = magics[simu]
+
+      # Generate permutation
+      nex = fff_twosample_permutation(<unsigned int*>idx1.data,
+                                      <unsigned int*>idx2.data,
+                                      n1, n2, &magic)
+
+      # Reset the multi-iterator
+      fffpy_multi_iterator_reset(multi)
+
+      # Perform the loop
+      idx = simu*t.stride
+      while(multi.index < multi.size):
+        fff_twosample_apply_permutation(yp, NULL, y1, NULL, y2, NULL, nex,
+                                        <unsigned int*>idx1.data,
+                                        <unsigned int*>idx2.data)
+        t.data[idx] = fff_twosample_stat_eval(stat, yp)
+        fffpy_multi_iterator_update(multi)
 
   # Delete local structures
   fffpy_multi_iterator_delete(multi)
-  fff_vector_delete(magics)
   fff_vector_delete(yp)
   fff_array_delete(idx1)
   fff_array_delete(idx2)
   fff_twosample_stat_delete(stat)
 
-  # Return
-  return T
-
 
-def stat_mfx(ndarray Y1, ndarray V1, ndarray Y2, ndarray V2,
-             id='student_mfx', int axis=0, ndarray Magics=None,
-             unsigned int niter=5):
+def stat(ndarray Y1, ndarray Y2, id='student', int axis=0, ndarray Magics=None,
+         n_jobs=1):
   """
-  T = stat(Y1, V1, Y2, V2, id='student', axis=0, magics=None, niter=5).
+  T = stat(Y1, Y2, id='student', axis=0, magics=None, n_jobs=1).
   
   Compute a two-sample test statistic (Y1>Y2) over a number of
-  deterministic or random permutations.
+  deterministic or random permutations. The voxels are split into
+  `n_jobs` chunks processed by concurrent threads; the result does not
+  depend on `n_jobs`.
   """
-  cdef fff_vector *y1, *y2, *v1, *v2, *t, *yp, *vp, *magics
-  cdef fff_array *idx1, *idx2
-  cdef unsigned int n, n1, n2, nex
-  cdef unsigned long int simu, nsimu, idx
-  cdef fff_twosample_stat_mfx* stat
   cdef fff_twosample_stat_flag flag_stat = stats[id]
-  cdef double magic
-  cdef fffpy_multi_iterator* multi
-
-  # Get number of observations
-  n1 = <unsigned int>Y1.shape[axis]
-  n2 = <unsigned int>Y2.shape[axis]
-  n = n1 + n2
 
   # Read out magic numbers
   if Magics is None:
-    magics = fff_vector_new(1)
-    magics.data[0] = 0 ## Just to make sure
-  else:
-    magics = fff_vector_fromPyArray(Magics)
+    Magics = np.zeros(1)
+  Magics = np.ascontiguousarray(Magics, dtype=np.double).ravel()
 
   # Create output array
-  nsimu = magics.size
+  Y1 = np.asarray(Y1, dtype=np.double)
+  Y2 = np.asarray(Y2, dtype=np.double)
   dims = [Y1.shape[i] for i in range(Y1.ndim)]
-  dims[axis] = nsimu 
+  dims[axis] = Magics.size
   T = np.zeros(dims)
 
-  # Create local structure
-  yp = fff_vector_new(n)
-  vp = fff_vector_new(n)
+  # Loop over the chunks
+  chunks = [(Y1[sl], Y2[sl], T[sl], flag_stat, axis, Magics)
+            for sl in chunk_slices(dims, axis, n_jobs)]
+  parallel_map(_stat_chunk, chunks, n_jobs, threads=True)
+
+  # Return
+  return T
+
+
+def _stat_mfx_chunk(args):
+  """
+  Run `stat_mfx` on a chunk of voxels, without the GIL.
+  """
+  cdef ndarray Y1, V1, Y2, V2, T, Magics
+  cdef fff_vector *y1, *y2, *v1, *v2, *t, *yp, *vp
+  cdef fff_array *idx1, *idx2
+  cdef unsigned int n1, n2, nex, niter
+  cdef unsigned long int simu, nsimu, idx
+  cdef fff_twosample_stat_mfx* stat
+  cdef fff_twosample_stat_flag flag_stat
+  cdef double magic
+  cdef double* magics
+  cdef int axis
+  cdef fffpy_multi_iterator* multi
+  Y1, V1, Y2, V2, T, flag_stat, axis, Magics, niter = args
+  n1 = <unsigned int>Y1.shape[axis]
+  n2 = <unsigned int>Y2.shape[axis]
+
+  # Create local structures
+  yp = fff_vector_new(n1 + n2)
+  vp = fff_vector_new(n1 + n2)
   idx1 = fff_array_new1d(FFF_UINT, n1)
   idx2 = fff_array_new1d(FFF_UINT, n2)
   stat = fff_twosample_stat_mfx_new(n1, n2, flag_stat)
   stat.niter = niter
-
-  # Multi-iterator 
   multi = fffpy_multi_iterator_new(5, axis,
                                    <void*>Y1, <void*>V1,
                                    <void*>Y2, <void*>V2,
                                    <void*>T)
-
-  # Vector views
   y1 = multi.vector[0]
   v1 = multi.vector[1]
   y2 = multi.vector[2]
   v2 = multi.vector[3]
   t = multi.vector[4]
-  
+  magics = <double*>Magics.data
+  nsimu = Magics.size
+
   # Loop
-  for simu from 0 <= simu < nsimu:
-    
-    # Set the magic number
-    magic = magics.data[simu*magics.stride]
-
-    # Generate permutation 
-    nex = fff_twosample_permutation(<unsigned int*>idx1.data,
-                                    <unsigned int*>idx2.data,
-                                    n1, n2, &magic)
-   
-    # Reset the multi-iterator      
-    fffpy_multi_iterator_reset(multi)
-    
-    # Perform the loop 
-    idx = simu*t.stride
-    while(multi.index < multi.size):
-      fff_twosample_apply_permutation(yp, vp, y1, v1, y2, v2, nex,
-                                      <unsigned int*>idx1.data,
-                                      <unsigned int*>idx2.data)
-      t.data[idx] = fff_twosample_stat_mfx_eval(stat, yp, vp)
-      fffpy_multi_iterator_update(multi)
+  with nogil:
+    for simu from 0 <= simu < nsimu:
+
+      # Set the magic number
+      magic = magics[simu]
+
+      # Generate permutation
+      nex = fff_twosample_permutation(<unsigned int*>idx1.data,
+                                      <unsigned int*>idx2.data,
+                                      n1, n2, &magic)
+
+      # Reset the multi-iterator
+      fffpy_multi_iterator_reset(multi)
+
+      # Perform the loop
+      idx = simu*t.stride
+      while(multi.index < multi.size):
+        fff_twosample_apply_permutation(yp, vp, y1, v1, y2, v2, nex,
+                                        <unsigned int*>idx1.data,
+                                        <unsigned int*>idx2.data)
+        t.data[idx] = fff_twosample_stat_mfx_eval(stat, yp, vp)
+        fffpy_multi_iterator_update(multi)
 
   # Delete local structures
   fffpy_multi_iterator_delete(multi)
-  fff_vector_delete(magics)
   fff_vector_delete(yp)
   fff_vector_delete(vp)
   fff_array_delete(idx1)
   fff_array_delete(idx2)
   fff_twosample_stat_mfx_delete(stat)
 
+
+def stat_mfx(ndarray Y1, ndarray V1, ndarray Y2, ndarray V2,
+             id='student_mfx', int axis=0, ndarray Magics=None,
+             unsigned int niter=5, n_jobs=1):
+  """
+  T = stat(Y1, V1, Y2, V2, id='student', axis=0, magics=None, niter=5,
+           n_jobs=1).
+  
+  Compute a two-sample test statistic (Y1>Y2) over a number of
+  deterministic or random permutations. The voxels are split into
+  `n_jobs` chunks processed by concurrent threads; the result does not
+  depend on `n_jobs`.
+  """
+  cdef fff_twosample_stat_flag flag_stat = stats[id]
+
+  # Read out magic numbers
+  if Magics is None:
+    Magics = np.zeros(1)
+  Magics = np.ascontiguousarray(Magics, dtype=np.double).ravel()
+
+  # Create output array
+  Y1, V1, Y2, V2 = [np.asarray(A, dtype=np.double) for A in (Y1, V1, Y2, V2)]
+  dims = [Y1.shape[i] for i in range(Y1.ndim)]
+  dims[axis] = Magics.size
+  T = np.zeros(dims)
+
+  # Loop over the chunks
+  chunks = [(Y1[sl], V1[sl], Y2[sl], V2[sl], T[sl], flag_stat, axis,
+             Magics, niter)
+            for sl in chunk_slices(dims, axis, n_jobs)]
+  parallel_map(_stat_mfx_chunk, chunks, n_jobs, threads=True)
+
   # Return
   return T
@@ -18,6 +18,7 @@ from __future__ import absolute_import
 
 import numpy as np
 import scipy.stats as st
+from scipy.spatial import cKDTree
 
 from .structural_bfls import build_landmarks
 from nipy.algorithms.graph import wgraph_from_coo_matrix
@@ -191,6 +192,38 @@ def _dpmm(coords, alpha, null_density, dof, prior_precision, prior_h0,
         return like, 1 - pproba
 
 
+def _nearest_sites(domain_coord, coords):
+    """Return the index of the closest domain site of each coordinate
+
+    The candidates are found with a KD-tree on the domain coordinates;
+    ties are resolved in favor of the lowest index, as np.argmin would.
+
+    Parameters
+    ----------
+    domain_coord: array of shape(n_sites, dim),
+                  the coordinates of the domain sites
+    coords: array of shape(n, dim),
+            the query coordinates
+
+    Returns
+    -------
+    idx: array of shape(n), type np.intp
+    """
+    coords = np.reshape(coords, (-1, domain_coord.shape[1]))
+    if not hasattr(cKDTree, 'query_ball_point'):
+        return np.array([np.argmin(np.sum((domain_coord - coord_) ** 2, 1))
+                         for coord_ in coords], np.intp)
+    tree = cKDTree(domain_coord)
+    dist, _ = tree.query(coords)
+    idx = np.zeros(coords.shape[0], np.intp)
+    for i, (coord_, dist_) in enumerate(zip(coords, dist)):
+        candidates = np.sort(tree.query_ball_point(
+            coord_, dist_ * (1 + 1.e-9) + 1.e-12))
+        idx[i] = candidates[np.argmin(
+            np.sum((domain_coord[candidates] - coord_) ** 2, 1))]
+    return idx
+
+
 def _update_hroi_labels(hrois, new_labels):
     """Update the labels of the hroisusing new_labels"""
     for subject in range(len(hrois)):
@@ -266,9 +299,7 @@ def _bsa_dpmm(hrois, prior_h0, subjects, coords, sigma, prevalence_pval,
             # associate labels with coords
         Fbeta = field_from_coo_matrix_and_data(domain.topology, density)
         _, label = Fbeta.custom_watershed(0, null_density)
-        midx = np.array([np.argmin(np.sum((domain.coord - coord_) ** 2, 1))
-                         for coord_ in coords])
-        components = label[midx]
+        components = label[_nearest_sites(domain.coord, coords)]
     elif algorithm == 'co-occurrence':
         post_proba, density, co_clustering = _dpmm(
             coords, alpha, null_density, dof, prior_precision, prior_h0,
@@ -7,14 +7,16 @@ This is meant to provide a unified API to deal with n-d imaged and meshes.
 Author: Bertrand Thirion, 2010
 """
 from __future__ import absolute_import
+import hashlib
+from collections import OrderedDict
+
 import numpy as np
 import scipy.sparse as sp
 
 from nibabel import load, Nifti1Image, save
 
 from nipy.io.nibcompat import get_header, get_affine
-from nipy.algorithms.graph import (WeightedGraph, wgraph_from_coo_matrix,
-                                   wgraph_from_3d_grid)
+from nipy.algorithms.graph import WeightedGraph, wgraph_from_coo_matrix
 
 from nipy.externals.six import string_types
 
@@ -23,6 +25,148 @@ from nipy.externals.six import string_types
 ##############################################################
 
 
+# number of grid topologies kept by _grid_topology, and bound on their
+# total number of stored entries (about 24 bytes each); larger
+# topologies are not cached
+TOPOLOGY_CACHE_SIZE = 8
+TOPOLOGY_CACHE_NNZ = 2 ** 23
+_topology_cache = OrderedDict()
+
+
+def _grid_offsets(dim, nn=0):
+    """Return the offsets of the neighbours of a grid point
+
+    Only one offset of each pair (o, -o) is returned.
+
+    Parameters
+    ----------
+    dim: int,
+         dimension of the grid
+    nn: int, optional
+        neighboring system: 0 stands for the 2 * dim closest neighbours
+        (in any dimension); in 3d, 6, 18 and 26 are also accepted
+
+    Returns
+    -------
+    offsets: array of shape (n_offsets, dim), type int
+    """
+    if nn == 0:
+        return np.eye(dim, dtype=np.intp)
+    if dim != 3 or nn not in (6, 18, 26):
+        raise ValueError('nn should be 0, or 6, 18 or 26 in 3d')
+    offsets = np.reshape(np.indices((3, 3, 3)), (3, -1)).T - 1
+    l1 = np.abs(offsets).sum(1)
+    # keep the offsets whose first nonzero coordinate is positive
+    first = offsets[np.arange(27), np.argmax(offsets != 0, 1)]
+    max_l1 = {6: 1, 18: 2, 26: 3}[nn]
+    return offsets[(first > 0) & (l1 <= max_l1)]
+
+
+def _grid_edges(idx, nn=0):
+    """Return the edges between neighbouring points of a grid
+
+    The neighbours of each point are found by adding the linear index
+    offsets of the neighboring system to the linear index of the point,
+    so that the cost is linear in the number of points.
+
+    Parameters
+    ----------
+    idx: array of shape (n_samples, dim), type int
+         indexes of certain positions in a nd space
+    nn: int, optional
+        neighboring system, see _grid_offsets
+
+    Returns
+    -------
+    i, j: arrays of shape (n_edges,), type int
+          the vertices of the (directed) edges, in both directions
+    weights: array of shape (n_edges,)
+          the euclidian length of the edges
+    """
+    n, dim = idx.shape
+    offsets = _grid_offsets(dim, nn)
+    if n == 0:
+        return np.zeros(0, np.intp), np.zeros(0, np.intp), np.zeros(0)
+    nidx = (idx - idx.min(0)).astype(np.int64)
+    box = nidx.max(0) + 1
+    strides = np.hstack((np.cumprod(box[::-1])[::-1][1:], 1))
+    lin = np.dot(nidx, strides)
+
+    # map linear indexes to vertices: a dense table when the bounding box
+    # is not much larger than the set of points, a sorted search otherwise
+    if np.prod(box) <= 8 * n + 1024:
+        table = - np.ones(np.prod(box), np.intp)
+        table[lin] = np.arange(n)
+        if (table[lin] != np.arange(n)).any():
+            raise ValueError('Provided indices are not unique')
+
+        def lookup(x):
+            return table[x]
+    else:
+        order = np.argsort(lin)
+        slin = lin[order]
+        if (slin[1:] == slin[:-1]).any():
+            raise ValueError('Provided indices are not unique')
+
+        def lookup(x):
+            pos = np.minimum(np.searchsorted(slin, x), n - 1)
+            return np.where(slin[pos] == x, order[pos], - 1)
+
+    eA, eB, weights = [], [], []
+    for offset in offsets:
+        target = nidx + offset
+        inside = np.all((target >= 0) & (target < box), 1)
+        i = np.nonzero(inside)[0]
+        j = lookup(lin[i] + np.dot(offset, strides))
+        valid = j > - 1
+        eA.append(i[valid])
+        eB.append(j[valid])
+        weights.append(np.sqrt(np.abs(offset).sum()) *
+                       np.ones(valid.sum()))
+    eA, eB = np.concatenate(eA), np.concatenate(eB)
+    weights = np.concatenate(weights)
+    return (np.hstack((eA, eB)), np.hstack((eB, eA)),
+            np.hstack((weights, weights)))
+
+
+def _grid_smatrix(idx, nn=0):
+    """Create the sparse adjacency matrix of grid points
+
+    The entries are sorted by row, then by column.
+    """
+    n = idx.shape[0]
+    i, j, weights = _grid_edges(idx, nn)
+    if i.size == 0:
+        return sp.coo_matrix((n, n))
+    return sp.coo_matrix((weights, (i, j)), shape=(n, n)).tocsr().tocoo()
+
+
+def _grid_topology(mask, nn=0):
+    """Return the adjacency matrix of the nonzero points of mask
+
+    The last results are cached, keyed by the shape and content of the
+    mask and the neighboring system, so that domains built repeatedly
+    on the same mask share the cost of the topology computation. The
+    cache holds at most TOPOLOGY_CACHE_SIZE topologies and
+    TOPOLOGY_CACHE_NNZ entries in total.
+    """
+    mask = np.asarray(mask) != 0
+    key = (mask.shape, nn, hashlib.sha1(np.packbits(mask)).hexdigest())
+    if key in _topology_cache:
+        topology = _topology_cache.pop(key)
+    else:
+        idx = np.array(np.where(mask)).T
+        topology = _grid_smatrix(idx, nn)
+    if topology.nnz > TOPOLOGY_CACHE_NNZ:
+        return topology
+    nnz = topology.nnz + sum(t.nnz for t in _topology_cache.values())
+    while _topology_cache and (nnz > TOPOLOGY_CACHE_NNZ or
+                               len(_topology_cache) >= TOPOLOGY_CACHE_SIZE):
+        nnz -= _topology_cache.popitem(last=False)[1].nnz
+    _topology_cache[key] = topology
+    return topology.copy()
+
+
 def smatrix_from_3d_array(mask, nn=18):
     """Create a sparse adjacency matrix from an array
 
@@ -39,8 +183,7 @@ def smatrix_from_3d_array(mask, nn=18):
              adjacency of the neighboring system
 
     """
-    ijk = np.array(np.where(mask)).T
-    return smatrix_from_3d_idx(ijk, nn)
+    return _grid_topology(mask, nn)
 
 
 def smatrix_from_3d_idx(ijk, nn=18):
@@ -59,8 +202,7 @@ def smatrix_from_3d_idx(ijk, nn=18):
              adjacency of the neighboring system
 
     """
-    G = wgraph_from_3d_grid(ijk, nn)
-    return G.to_coo_matrix()
+    return _grid_smatrix(ijk, nn)
 
 
 def smatrix_from_nd_array(mask, nn=0):
@@ -79,8 +221,7 @@ def smatrix_from_nd_array(mask, nn=0):
              adjacency of the neighboring system
 
     """
-    idx = np.array(np.where(mask)).T
-    return smatrix_from_nd_idx(idx, nn)
+    return _grid_topology(mask)
 
 
 def smatrix_from_nd_idx(idx, nn=0):
@@ -99,37 +240,7 @@ def smatrix_from_nd_idx(idx, nn=0):
              adjacency of the neighboring system
 
     """
-    n = idx.shape[0]
-    dim = idx.shape[1]
-    nidx = idx - idx.min(0)
-    eA = []
-    eB = []
-
-    # compute the edges in each possible direction
-    for d in range(dim):
-        mi = nidx.max(0) + 2
-        a = np.hstack((1, np.cumprod(mi[:dim - 1])))
-        v1 = np.dot(nidx, a)
-        assert(np.size(v1) == np.size(np.unique(v1)))
-        o1 = np.argsort(v1)
-        sv1 = v1[o1]
-        nz = np.squeeze(np.nonzero(sv1[:n - 1] - sv1[1:] == - 1))
-        nz = np.reshape(nz, np.size(nz))
-        eA.append(o1[nz])
-        eB.append(o1[nz + 1])
-        nidx = np.roll(nidx, 1, 1)
-
-    eA = np.concatenate(eA)
-    eB = np.concatenate(eB)
-    E = 2 * np.size(eA)
-    # create a graph structure
-    if E == 0:
-        return sp.coo_matrix((n, n))
-
-    edges = np.vstack((np.hstack((eA, eB)), np.hstack((eB, eA)))).T
-    weights = np.ones(E)
-    G = WeightedGraph(n, edges, weights)
-    return G.to_coo_matrix()
+    return _grid_smatrix(idx)
 
 
 def array_affine_coord(mask, affine):
@@ -185,11 +296,16 @@ def reduce_coo_matrix(mat, mask):
           desired elements
 
     """
-    G = wgraph_from_coo_matrix(mat)
-    K = G.subgraph(mask)
-    if K is None:
+    mask = np.asarray(mask) > 0
+    if mask.sum() == 0:
         return None
-    return K.to_coo_matrix()
+    # the entries are remapped rather than rebuilt, keeping their order
+    mat = sp.coo_matrix(mat)
+    keep = mask[mat.row] & mask[mat.col] & (mat.data != 0)
+    renumb = np.cumsum(mask) - 1
+    return sp.coo_matrix(
+        (mat.data[keep], (renumb[mat.row[keep]], renumb[mat.col[keep]])),
+        shape=(mask.sum(), mask.sum()))
 
 
 #################################################################
@@ -266,7 +382,7 @@ def grid_domain_from_binary_array(mask, affine=None, nn=0):
     mask = mask > 0
     ijk = np.array(np.where(mask)).T
     vol = np.absolute(np.linalg.det(affine[:3, 0:3])) * np.ones(np.sum(mask))
-    topology = smatrix_from_nd_idx(ijk, nn)
+    topology = smatrix_from_nd_array(mask, nn)
     return NDGridDomain(dim, ijk, shape, affine, vol, topology)
 
 
@@ -314,7 +430,7 @@ def grid_domain_from_shape(shape, affine=None):
     ijk = np.array(np.where(rect)).T
     vol = (np.absolute(np.linalg.det(affine[:3, 0:3])) *
            np.ones(int(np.sum(rect))))
-    topology = smatrix_from_nd_idx(ijk, 0)
+    topology = smatrix_from_nd_array(rect, 0)
     return NDGridDomain(dim, ijk, shape, affine, vol, topology)
 
 
@@ -16,6 +16,7 @@ from nipy.algorithms.clustering.utils import kmeans, voronoi
 from .parcellation import MultiSubjectParcellation
 from nipy.algorithms.graph.field import Field
 from nipy.algorithms.graph.graph import wgraph_from_coo_matrix
+from nipy.utils.parallel import parallel_map, random_seeds, local_random_state
 
 
 warn('Module nipy.labs.spatial_models.hierarchical_parcellation' + 
@@ -218,8 +219,79 @@ def _field_gradient_jac_Map(i, ref, target, targeti):
     return fgj
 
 
+def _subject_parcellation(args):
+    """ Update the parcellation of one subject, as a picklable task
+
+    The subject-specific seeds of the parcels are moved around the current
+    prototypes, then the subject's domain is parcelled by constrained
+    voronoi on these seeds.
+
+    Returns
+    -------
+    labels: array of shape (n_voxels_in_subject)
+            the subject-specific parcellation
+    energy: float, the feature discrepancy to the prototypes
+    lproto: array of shape (nb_parcel, feature_dim)
+            the subject-specific feature prototypes
+    lproto_anat: array of shape (nb_parcel, anat_dim)
+            the subject-specific anatomical prototypes
+    """
+    (Fs, lac, graph, proto, proto_anat, spatial_proto, order, lamb, dmax,
+     verbose) = args
+    nb_parcel = proto.shape[0]
+    target = proto_anat.copy()
+    lseeds = np.zeros(nb_parcel, np.int)
+    toto = np.zeros(lac.shape[0])
+    for i in order:
+        # b.1 speed-up :only take a small ball
+        dx = lac - target[i]
+        iz = np.nonzero(np.sum(dx ** 2, 1) < dmax ** 2)
+        iz = np.reshape(iz, np.size(iz))
+        if np.size(iz) == 0:
+            iz = np.array([np.argmin(np.sum(dx ** 2, 1))])
+
+        # b.2: anatomical constraints
+        lanat = np.reshape(lac[iz], (np.size(iz), lac.shape[1]))
+        pot = np.zeros(np.size(iz))
+        JM, rmin = _exclusion_map(i, spatial_proto, target, lanat)
+        pot[JM < 0] = np.inf
+        pot[JM >= 0] = - JM[JM >= 0]
+
+        # b.3: add feature discrepancy
+        df = Fs[iz] - proto[i]
+        df = np.reshape(df, (np.size(iz), proto.shape[1]))
+        pot += lamb * np.sum(df ** 2, 1)
+
+        # b.4: solution
+        if np.sum(np.isinf(pot)) == np.size(pot):
+            pot = np.sum(dx[iz] ** 2, 1)
+
+        sol = iz[np.argmin(pot)]
+        target[i] = lac[sol]
+        lseeds[i] = sol
+        toto[sol] = 1
+
+    if verbose > 1:
+        jm = _field_gradient_jac(spatial_proto, target)
+        print(jm.min(), jm.max(), np.sum(toto > 0))
+
+    # c.subject-specific parcellation
+    f = Field(graph.V, graph.edges, graph.weights, Fs)
+    labels = f.constrained_voronoi(lseeds)
+
+    energy = np.sum((Fs - proto[labels]) ** 2) / lac.shape[0]
+    # recompute the prototypes
+    # (average in subject s)
+    lproto = np.array([np.mean(Fs[labels == k], 0)
+                       for k in range(nb_parcel)])
+    lproto_anat = np.array([np.mean(lac[labels == k], 0)
+                            for k in range(nb_parcel)])
+    return labels, energy, lproto, lproto_anat
+
+
 def _optim_hparcel(feature, domain, graphs, nb_parcel, lamb=1., dmax=10.,
-                   niter=5, initial_mask=None, chunksize=1.e5, verbose=0):
+                   niter=5, initial_mask=None, chunksize=1.e5, verbose=0,
+                   n_jobs=1):
     """ Core function of the heirrachical parcellation procedure.
 
     Parameters
@@ -237,6 +309,8 @@ def _optim_hparcel(feature, domain, graphs, nb_parcel, lamb=1., dmax=10.,
     chunksize = int, optional
     niter = 5: number of iterations in the algorithm
     verbose=0: verbosity level
+    n_jobs = 1: number of processes over which the subjects are
+                distributed at each iteration
 
     Returns
     -------
@@ -269,70 +343,19 @@ def _optim_hparcel(feature, domain, graphs, nb_parcel, lamb=1., dmax=10.,
     spatial_proto.normalize()
 
     for git in range(niter):
-        LP = []
-        LPA = []
-        U = []
-        Energy = 0
-        for s in range(nb_subj):
-            # b.subject-specific instances of the model
-            # b.0 subject-specific information
-            Fs = feature[s]
-            lac = indiv_coord[s]
-            target = proto_anat.copy()
-            lseeds = np.zeros(nb_parcel, np.int)
-            aux = np.argsort(rand(nb_parcel))
-            toto = np.zeros(lac.shape[0])
-            for j in range(nb_parcel):
-                # b.1 speed-up :only take a small ball
-                i = aux[j]
-                dx = lac - target[i]
-                iz = np.nonzero(np.sum(dx ** 2, 1) < dmax ** 2)
-                iz = np.reshape(iz, np.size(iz))
-                if np.size(iz) == 0:
-                    iz = np.array([np.argmin(np.sum(dx ** 2, 1))])
-
-                # b.2: anatomical constraints
-                lanat = np.reshape(lac[iz], (np.size(iz),
-                                             domain.coord.shape[1]))
-                pot = np.zeros(np.size(iz))
-                JM, rmin = _exclusion_map(i, spatial_proto, target, lanat)
-                pot[JM < 0] = np.inf
-                pot[JM >= 0] = - JM[JM >= 0]
-
-                # b.3: add feature discrepancy
-                df = Fs[iz] - proto[i]
-                df = np.reshape(df, (np.size(iz), proto.shape[1]))
-                pot += lamb * np.sum(df ** 2, 1)
-
-                # b.4: solution
-                if np.sum(np.isinf(pot)) == np.size(pot):
-                    pot = np.sum(dx[iz] ** 2, 1)
-
-                sol = iz[np.argmin(pot)]
-                target[i] = lac[sol]
-                lseeds[i] = sol
-                toto[sol] = 1
-
-            if verbose > 1:
-                jm = _field_gradient_jac(spatial_proto, target)
-                print(jm.min(), jm.max(), np.sum(toto > 0))
-
-            # c.subject-specific parcellation
-            g = graphs[s]
-            f = Field(g.V, g.edges, g.weights, Fs)
-            U.append(f.constrained_voronoi(lseeds))
-
-            Energy += np.sum((Fs - proto[U[-1]]) ** 2) / \
-                np.sum(initial_mask[:, s] > - 1)
-            # recompute the prototypes
-            # (average in subject s)
-            lproto = [np.mean(Fs[U[-1] == k], 0) for k in range(nb_parcel)]
-            lproto = np.array(lproto)
-            lproto_anat = np.array([np.mean(lac[U[-1] == k], 0)
-                                    for k in range(nb_parcel)])
-
-            LP.append(lproto)
-            LPA.append(lproto_anat)
+        # b.subject-specific instances of the model
+        # the random visiting orders are drawn here, so that the subjects
+        # can be processed independently of each other
+        orders = [np.argsort(rand(nb_parcel)) for s in range(nb_subj)]
+        results = parallel_map(
+            _subject_parcellation,
+            [(feature[s], indiv_coord[s], graphs[s], proto, proto_anat,
+              spatial_proto, orders[s], lamb, dmax, verbose)
+             for s in range(nb_subj)], n_jobs)
+        U = [labels for labels, _, _, _ in results]
+        Energy = np.sum([energy for _, energy, _, _ in results])
+        LP = [lproto for _, _, lproto, _ in results]
+        LPA = [lproto_anat for _, _, _, lproto_anat in results]
 
         # recompute the prototypes across subjects
         proto_mem = proto.copy()
@@ -354,7 +377,8 @@ def _optim_hparcel(feature, domain, graphs, nb_parcel, lamb=1., dmax=10.,
 
 
 def hparcel(domain, ldata, nb_parcel, nb_perm=0, niter=5, mu=10., dmax=10.,
-            lamb=100.0, chunksize=1.e5, verbose=0, initial_mask=None):
+            lamb=100.0, chunksize=1.e5, verbose=0, initial_mask=None,
+            n_jobs=1):
     """
     Function that performs the parcellation by optimizing the
     inter-subject similarity while retaining the connectedness
@@ -386,6 +410,10 @@ def hparcel(domain, ldata, nb_parcel, nb_perm=0, niter=5, mu=10., dmax=10.,
              verbosity mode
     initial_mask: array of shape (domain.size, nb_subj), optional
                   initial subject-depedent masking of the domain
+    n_jobs: int, optional,
+            number of processes over which the subject-specific updates,
+            and the permutations if any, are distributed;
+            -1 means all the CPUs
 
     Returns
     -------
@@ -414,7 +442,7 @@ def hparcel(domain, ldata, nb_parcel, nb_perm=0, niter=5, mu=10., dmax=10.,
     # main function
     all_labels, proto_anat = _optim_hparcel(
         feature, domain, graphs, nb_parcel, lamb, dmax, niter, initial_mask,
-        chunksize=chunksize, verbose=verbose)
+        chunksize=chunksize, verbose=verbose, n_jobs=n_jobs)
 
     # write the individual labelling
     labels = - np.ones((nbvox, nb_subj)).astype(np.int)
@@ -432,24 +460,24 @@ def hparcel(domain, ldata, nb_parcel, nb_perm=0, niter=5, mu=10., dmax=10.,
 
     if nb_perm > 0:
         prfx0 = perm_prfx(domain, graphs, feature, nb_parcel, ldata,
-                          initial_mask, nb_perm, niter, dmax, lamb, chunksize)
+                          initial_mask, nb_perm, niter, dmax, lamb, chunksize,
+                          n_jobs=n_jobs)
         return pcl, prfx0
     else:
         return pcl
 
 
-def perm_prfx(domain, graphs, features, nb_parcel, ldata, initial_mask=None,
-              nb_perm=100, niter=5, dmax=10., lamb=100.0, chunksize=1.e5,
-              verbose=1):
-    """
-    caveat: assumes that the functional dimension is 1
+def _permuted_prfx(args):
+    """ Run the parcellation on sign-swapped data, as a picklable task
+
+    Returns the maximum across parcels of the random effects statistic.
     """
     from ..utils.reproducibility_measures import ttest
-    # permutations for the assesment of the results
-    prfx0 = []
+    (domain, graphs, features, nb_parcel, ldata, initial_mask, niter, dmax,
+     lamb, chunksize, seed) = args
     adim = domain.coord.shape[1]
     nb_subj = len(ldata)
-    for q in range(nb_perm):
+    with local_random_state(seed):
         feature = []
         sldata = []
         for s in range(nb_subj):
@@ -463,21 +491,38 @@ def perm_prfx(domain, graphs, features, nb_parcel, ldata, initial_mask=None,
         all_labels, proto_anat = _optim_hparcel(
             feature, domain, graphs, nb_parcel, lamb, dmax, niter,
             initial_mask, chunksize=chunksize)
-        labels = - np.ones((domain.size, nb_subj)).astype(np.int)
-        for s in range(nb_subj):
-            labels[initial_mask[:, s] > -1, s] = all_labels[s]
+    labels = - np.ones((domain.size, nb_subj)).astype(np.int)
+    for s in range(nb_subj):
+        labels[initial_mask[:, s] > -1, s] = all_labels[s]
+
+    # compute the group-level labels
+    template_labels = voronoi(domain.coord, proto_anat)
 
-        # compute the group-level labels
-        template_labels = voronoi(domain.coord, proto_anat)
+    # create the parcellation
+    pcl = MultiSubjectParcellation(domain, individual_labels=labels,
+                                   template_labels=template_labels)
+    pdata = pcl.make_feature('functional',
+                             np.rollaxis(np.array(ldata), 1, 0))
+    prfx = ttest(np.squeeze(pdata))
+    return prfx.max(0)
 
-        # create the parcellation
-        pcl = MultiSubjectParcellation(domain, individual_labels=labels,
-                                       template_labels=template_labels)
-        pdata = pcl.make_feature('functional',
-                                 np.rollaxis(np.array(ldata), 1, 0))
-        prfx = ttest(np.squeeze(pdata))
-        if verbose:
-            print(q, prfx.max(0))
-        prfx0.append(prfx.max(0))
 
+def perm_prfx(domain, graphs, features, nb_parcel, ldata, initial_mask=None,
+              nb_perm=100, niter=5, dmax=10., lamb=100.0, chunksize=1.e5,
+              verbose=1, n_jobs=1):
+    """
+    caveat: assumes that the functional dimension is 1
+
+    The permutations are independent: they are distributed over n_jobs
+    processes, and each one is seeded from a seed drawn beforehand, so
+    that the results do not depend on n_jobs.
+    """
+    # permutations for the assesment of the results
+    tasks = [(domain, graphs, features, nb_parcel, ldata, initial_mask,
+              niter, dmax, lamb, chunksize, seed)
+             for seed in random_seeds(nb_perm)]
+    prfx0 = parallel_map(_permuted_prfx, tasks, n_jobs)
+    if verbose:
+        for q, prfx in enumerate(prfx0):
+            print(q, prfx)
     return prfx0
@@ -18,7 +18,7 @@ import numpy as np
 from nipy.algorithms.graph.graph import WeightedGraph
 from nipy.algorithms.graph.forest import Forest
 from nipy.algorithms.graph.field import field_from_coo_matrix_and_data
-from .mroi import SubDomains
+from .mroi import SubDomains, _segment_representative
 
 NINF = - np.inf
 
@@ -107,7 +107,8 @@ def HROI_as_discrete_domain_blobs(domain, data, threshold=NINF, smin=0,
     nroi = HierarchicalROI(domain, label, parents)
     # create a signal feature
     data = np.ravel(data)
-    signal = [data[nroi.select_id(id, roi=False)] for id in nroi.get_id()]
+    order, size = nroi._voxel_order()
+    signal = np.split(data[order], np.cumsum(size)[:-1]) if nroi.k else []
     nroi.set_feature('signal', signal)
     # agglomerate regions in order to compact the structure if necessary
     nroi = hroi_agglomeration(nroi, criterion=criterion, smin=smin)
@@ -219,16 +220,7 @@ class HierarchicalROI(SubDomains):
                     volume = volume + SubDomains.get_volume(
                         self, self.get_id()[k])
             else:
-                volume = []
-                for id in self.get_id():
-                    roi_volume = SubDomains.get_volume(self, id)
-                    desc = self.make_forest().get_descendants(
-                        self.select_id(id), exclude_self=True)
-                    # get children volume
-                    for k in desc:
-                        roi_volume = roi_volume + SubDomains.get_volume(
-                            self, self.get_id()[k])
-                    volume.append(roi_volume)
+                volume = list(self._subtree_sum(SubDomains.get_volume(self)))
         return volume
 
     def get_size(self, id=None, ignore_children=True):
@@ -265,18 +257,37 @@ class HierarchicalROI(SubDomains):
                 for k in desc:
                     size = size + SubDomains.get_size(self, self.get_id()[k])
             else:
-                size = []
-                for id in self.get_id():
-                    roi_size = SubDomains.get_size(self, id)
-                    desc = self.make_forest().get_descendants(
-                        self.select_id(id), exclude_self=True)
-                    # get children size
-                    for k in desc:
-                        roi_size = roi_size + SubDomains.get_size(
-                            self, self.get_id()[k])
-                    size.append(roi_size)
+                size = list(self._subtree_sum(SubDomains.get_size(self)))
         return size
 
+    def _subtree_sum(self, values):
+        """Sum ROI-level values over the subtree of each ROI
+
+        Parameters
+        ----------
+        values: array of shape (self.k,)
+
+        Returns
+        -------
+        total: array of shape (self.k,),
+          total[i] is the sum of values over i and all its descendants
+        """
+        total = np.array(values)
+        # depth of each node in the hierarchy
+        depth = np.zeros(self.k, np.int)
+        ancestor = np.arange(self.k)
+        up = self.parents[ancestor] != ancestor
+        while up.any():
+            depth += up
+            ancestor[up] = self.parents[ancestor[up]]
+            up = self.parents[ancestor] != ancestor
+        # accumulate from the deepest nodes upwards
+        for d in range(depth.max() if self.k else 0, 0, -1):
+            nodes = np.where(depth == d)[0]
+            total += np.bincount(self.parents[nodes], total[nodes],
+                                 minlength=self.k).astype(total.dtype)
+        return total
+
     def select_roi(self, id_list):
         """Returns an instance of HROI with only the subset of chosen ROIs.
 
@@ -541,47 +552,19 @@ class HierarchicalROI(SubDomains):
           Default is False.
 
         """
-        rf = []
-        eps = 1.e-15
-        feature_quality = np.zeros(self.k)
-        for i, k in enumerate(self.get_id()):
-            f = self.get_feature(fid, k)
-            p_pos = self.select_id(k)
-            if not ignore_children:
-                # also include the children features
-                desc = np.nonzero(self.parents == p_pos)[0]
-                if p_pos in desc:
-                    desc = desc[desc != p_pos]
-                for c in desc:
-                    f = np.concatenate(
-                        (f, self.get_feature(fid, self.get_id()[c])))
-            # NaN-resistant representative
-            if f.ndim == 2:
-                nan = np.isnan(f.sum(1))
-            else:
-                nan = np.isnan(f)
-            # feature quality
-            feature_quality[i] = (~nan).sum() / float(nan.size)
-            # compute representative
-            if method == "mean":
-                rf.append(np.mean(f[~nan], 0))
-            if method == "weighted mean":
-                lvk = self.get_local_volume(k)
-                if not ignore_children:
-                    # append weights for children's voxels
-                    for c in desc:
-                        lvk = np.concatenate(
-                            (lvk,
-                             self.get_local_volume(fid, self.select_id(c))))
-                tmp = np.dot(lvk[~nan], f[~nan].reshape((-1, 1))) / \
-                    np.maximum(eps, np.sum(lvk[~nan]))
-                rf.append(tmp)
-            if method == "min":
-                rf.append(np.min(f[~nan]))
-            if method == "max":
-                rf.append(np.max(f[~nan]))
-            if method == "median":
-                rf.append(np.median(f[~nan], 0))
+        flat, roi = self._flat_feature(fid)
+        weights = None
+        if method == "weighted mean":
+            weights = self.domain.local_volume[self._voxel_order()[0]]
+        if not ignore_children:
+            # also include the features of the (direct) children
+            child = self.parents[roi] != roi
+            flat = np.concatenate((flat, flat[child]))
+            if weights is not None:
+                weights = np.concatenate((weights, weights[child]))
+            roi = np.concatenate((roi, self.parents[roi][child]))
+        rf, feature_quality = _segment_representative(
+            flat, roi, self.k, method, weights)
         if id is not None:
             summary_feature = rf[self.select_id(id)]
         else:
@@ -13,6 +13,101 @@ from . import discrete_domain as ddom
 
 from nipy.externals.six import string_types
 
+
+def _segment_representative(flat, segment, k, method='mean', weights=None):
+    """Compute a representative of each segment of a flat feature array
+
+    Parameters
+    ----------
+    flat: array of shape (n_items,) or (n_items, feature_dim)
+      The concatenated feature values
+    segment: array of shape (n_items,)
+      Index of the segment (ROI) of each item, in [0, k)
+    k: int
+      The number of segments
+    method: str, optional
+      Chosen among 'mean' (default), 'max', 'median', 'min',
+      'weighted mean'
+    weights: array of shape (n_items,), optional
+      Weights of the items, used by the 'weighted mean' method
+
+    Returns
+    -------
+    summary: array of shape (k,) or (k, feature_dim)
+      The representatives; 'min' and 'max' reduce over all the feature
+      dimensions, and 'weighted mean' always returns a 2D array.
+      Segments without any non-NaN value get a NaN representative.
+    quality: array of shape (k,)
+      The fraction of non-NaN values in each segment
+
+    Notes
+    -----
+    All the segments are handled at once, through bincount-based sums and
+    segmented reductions on the items sorted by segment; NaN-valued
+    items (rows, for 2D features) are ignored.
+    """
+    eps = 1.e-15
+    flat = np.asarray(flat)
+    segment = np.asarray(segment, dtype=np.intp)
+    if flat.ndim == 2:
+        nan = np.isnan(flat.sum(1))
+    else:
+        nan = np.isnan(flat)
+    size = np.bincount(segment, minlength=k)[:k]
+    values = flat[~nan].reshape(np.sum(~nan), int(np.prod(flat.shape[1:])))
+    segment = segment[~nan]
+    count = np.bincount(segment, minlength=k)[:k]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        quality = count / size.astype(np.float)
+    dim = values.shape[1]
+
+    if method in ('mean', 'weighted mean'):
+        if method == 'mean':
+            w = np.ones(segment.size)
+            norm = count.astype(np.float)
+        else:
+            w = np.asarray(weights)[~nan]
+            norm = np.maximum(eps, np.bincount(segment, w, minlength=k)[:k])
+        summary = np.zeros((k, dim))
+        for d in range(dim):
+            summary[:, d] = np.bincount(segment, w * values[:, d],
+                                        minlength=k)[:k]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            summary /= norm[:, np.newaxis]
+        if method == 'mean' and flat.ndim < 2:
+            summary = summary[:, 0]
+        return summary, quality
+
+    # the other representatives operate on the items sorted by segment
+    nonempty = count > 0
+    if method in ('min', 'max'):
+        order = np.argsort(segment, kind='mergesort')
+        starts = np.searchsorted(segment[order], np.arange(k))
+        if method == 'min':
+            reduction, values = np.minimum, values.min(1)
+        else:
+            reduction, values = np.maximum, values.max(1)
+        reduced = reduction.reduceat(values[order], starts[nonempty]) \
+            if nonempty.any() else values[:0]
+        if nonempty.all():
+            return reduced, quality
+        summary = np.nan * np.ones(k)
+        summary[nonempty] = reduced
+        return summary, quality
+    if method == 'median':
+        starts = np.concatenate(([0], np.cumsum(count)[:-1]))
+        low = (starts + (count - 1) // 2)[nonempty]
+        high = (starts + count // 2)[nonempty]
+        summary = np.nan * np.ones((k, dim))
+        for d in range(dim):
+            sorted_values = values[np.lexsort((values[:, d], segment)), d]
+            summary[nonempty, d] = (sorted_values[low] +
+                                    sorted_values[high]) / 2.
+        if flat.ndim < 2:
+            summary = summary[:, 0]
+        return summary, quality
+    raise ValueError('unknown method %s' % method)
+
 ##############################################################################
 # class SubDomains
 ##############################################################################
@@ -108,12 +203,45 @@ class SubDomains(object):
         -----
         This method must be called everytime the MROI structure is modified.
         """
-        lmap = np.unique(self.label[self.label > - 1])
-        for i, k in enumerate(lmap):
-            self.label[self.label == k] = i
+        valid = self.label > - 1
+        self.label[valid] = np.unique(self.label[valid],
+                                      return_inverse=True)[1]
         # number of ROIs: number of labels > -1
         self.k = np.amax(self.label) + 1
 
+    def _voxel_order(self):
+        """Return the voxels of all the ROIs, grouped by ROI.
+
+        Returns
+        -------
+        order: array of shape (n_voxels,)
+          The indices of the voxels that belong to a ROI, sorted by ROI
+          (and by position within each ROI), i.e. in the order of the
+          concatenated voxel-level features
+        size: array of shape (self.k,)
+          The number of voxels of each ROI
+        """
+        order = np.where(self.label > - 1)[0]
+        order = order[np.argsort(self.label[order], kind='mergesort')]
+        size = np.bincount(self.label[order], minlength=self.k)[:self.k]
+        return order, size
+
+    def _flat_feature(self, fid):
+        """Return a voxel-wise feature as one array, sorted by ROI.
+
+        Returns
+        -------
+        flat: array of shape (n_voxels,) or (n_voxels, feature_dim)
+          The feature values of all the ROIs, concatenated
+        roi: array of shape (n_voxels,)
+          The ROI index of each value
+        """
+        f = [np.asarray(fk) for fk in self.get_feature(fid)]
+        roi = np.repeat(np.arange(self.k), [fk.shape[0] for fk in f])
+        if len(f) == 0:
+            return np.array([]), roi
+        return np.concatenate(f), roi
+
     def get_id(self):
         """Return ROI's id list.
 
@@ -192,8 +320,8 @@ class SubDomains(object):
         if id is not None:
             coords = self.domain.coord[self.select_id(id, roi=False)]
         else:
-            coords = [self.domain.coord[self.select_id(k, roi=False)]
-                      for k in self.get_id()]
+            order, size = self._voxel_order()
+            coords = np.split(self.domain.coord[order], np.cumsum(size)[:-1])
         return coords
 
     def get_size(self, id=None):
@@ -216,8 +344,7 @@ class SubDomains(object):
         if id is not None:
             size = np.size(self.select_id(id, roi=False))
         else:
-            size = np.array(
-                [np.size(self.select_id(k, roi=False)) for k in self.get_id()])
+            size = self._voxel_order()[1]
         return size
 
     def get_local_volume(self, id=None):
@@ -241,8 +368,9 @@ class SubDomains(object):
             loc_volume = self.domain.local_volume[
                 self.select_id(id, roi=False)]
         else:
-            loc_volume = [self.domain.local_volume[
-                    self.select_id(k, roi=False)] for k in self.get_id()]
+            order, size = self._voxel_order()
+            loc_volume = np.split(self.domain.local_volume[order],
+                                  np.cumsum(size)[:-1])
         return loc_volume
 
     def get_volume(self, id=None):
@@ -265,7 +393,10 @@ class SubDomains(object):
         if id is not None:
             volume = np.sum(self.get_local_volume(id))
         else:
-            volume = np.asarray([np.sum(k) for k in self.get_local_volume()])
+            valid = self.label > - 1
+            volume = np.bincount(self.label[valid],
+                                 self.domain.local_volume[valid],
+                                 minlength=self.k)[:self.k]
         return volume
 
     ###
@@ -346,8 +477,9 @@ class SubDomains(object):
             # check data size
             if len(data) != self.k:
                 raise ValueError("data should have length %i" % self.k)
-            for k in self.get_id():
-                if len(data[self.select_id(k)]) != self.get_size(k):
+            size = self._voxel_order()[1]
+            for i, k in enumerate(self.get_id()):
+                if len(data[i]) != size[i]:
                     raise ValueError('Wrong data size for region `%i`' % k)
             self.features.update({fid: data})
 
@@ -376,32 +508,12 @@ class SubDomains(object):
         summary_feature: np.ndarray, shape=(self.k, feature_dim)
           Representative feature computed according to `method`.
         """
-        rf = []
-        eps = 1.e-15
-        feature_quality = np.zeros(self.k)
-        for i, k in enumerate(self.get_id()):
-            f = self.get_feature(fid, k)
-            # NaN-resistant representative
-            if f.ndim == 2:
-                nan = np.isnan(f.sum(1))
-            else:
-                nan = np.isnan(f)
-            # feature quality
-            feature_quality[i] = (~nan).sum() / float(nan.size)
-            # compute representative
-            if method == "mean":
-                rf.append(np.mean(f[~nan], 0))
-            if method == "weighted mean":
-                lvk = self.get_local_volume(k)[~nan]
-                tmp = np.dot(lvk, f[~nan].reshape((-1, 1))) / \
-                    np.maximum(eps, np.sum(lvk))
-                rf.append(tmp)
-            if method == "min":
-                rf.append(np.min(f[~nan]))
-            if method == "max":
-                rf.append(np.max(f[~nan]))
-            if method == "median":
-                rf.append(np.median(f[~nan], 0))
+        flat, roi = self._flat_feature(fid)
+        weights = None
+        if method == "weighted mean":
+            weights = self.domain.local_volume[self._voxel_order()[0]]
+        rf, feature_quality = _segment_representative(
+            flat, roi, self.k, method, weights)
         if id is not None:
             summary_feature = rf[self.select_id(id)]
         else:
@@ -447,20 +559,16 @@ class SubDomains(object):
         """
         res = np.zeros(self.label.size)
         if not roi:
-            f = self.get_feature(fid)
-            for id in self.get_id():
-                res[self.select_id(id, roi=False)] = f[self.select_id(id)]
+            res[self._voxel_order()[0]] = self._flat_feature(fid)[0]
         else:
             if fid in self.roi_features:
                 f = self.get_roi_feature(fid)
-                for id in self.get_id():
-                    res[self.select_id(id, roi=False)] = f[self.select_id(id)]
             elif fid in self.features.keys():
                 f = self.representative_feature(fid, method=method)
-                for id in self.get_id():
-                    res[self.select_id(id, roi=False)] = f[self.select_id(id)]
             else:
                 raise ValueError("Wrong feature id provided")
+            valid = self.label > - 1
+            res[valid] = np.reshape(f, self.k)[self.label[valid]]
         return res
 
     def integrate(self, fid=None, id=None):
@@ -486,7 +594,7 @@ class SubDomains(object):
             if id is not None:
                 lsum = self.get_volume(id)
             else:
-                lsum = [self.get_volume(k) for k in self.get_id()]
+                lsum = SubDomains.get_volume(self)
         else:
             if id is not None:
                 slvk = np.expand_dims(self.get_local_volume(id), 1)
@@ -494,13 +602,15 @@ class SubDomains(object):
                 sfk = np.reshape(sfk, (-1, 1))
                 lsum = np.sum(sfk * slvk, 0)
             else:
-                lsum = []
-                for k in self.get_id():
-                    slvk = np.expand_dims(self.get_local_volume(k), 1)
-                    sfk = self.get_feature(fid, k)
-                    sfk = np.reshape(sfk, (-1, 1))
-                    sumk = np.sum(sfk * slvk, 0)
-                    lsum.append(sumk)
+                # one product over all the voxels, then per-ROI sums
+                # (np.sum keeps the summation order of the per-ROI code)
+                flat, _ = self._flat_feature(fid)
+                order, size = self._voxel_order()
+                wf = np.reshape(flat, (-1, 1)) * \
+                    self.domain.local_volume[order][:, np.newaxis]
+                lsum = [np.sum(wk, 0)
+                        for wk in np.split(wf, np.cumsum(size)[:-1])]
+                lsum = np.reshape(lsum, (self.k, 1))
         return np.array(lsum)
 
     def plot_feature(self, fid, ax=None):
@@ -644,28 +754,25 @@ class SubDomains(object):
             data = -np.ones(self.label.size, dtype=np.int32)
             tmp_image = self.domain.to_image()
             mask = tmp_image.get_data().copy().astype(bool)
+            valid = self.label > - 1
             if not roi:
                 # write a feature
                 if fid not in self.features:
                     raise ValueError("`%s` feature could not be found" % fid)
-                for i in self.get_id():
-                    data[self.select_id(i, roi=False)] = \
-                        self.get_feature(fid, i)
+                data[self._voxel_order()[0]] = \
+                    np.ravel(self._flat_feature(fid)[0])
             else:
                 # write a roi feature
                 if fid in self.roi_features:
                     # write from existing roi feature
-                    for i in self.get_id():
-                        data[self.select_id(i, roi=False)] = \
-                            self.get_roi_feature(
-                            fid, i)
+                    data[valid] = np.reshape(
+                        self.get_roi_feature(fid), self.k)[self.label[valid]]
                 elif fid in self.features:
                     # write from representative feature
                     summary_feature = self.representative_feature(
                         fid, method=method)
-                    for i in self.get_id():
-                        data[self.select_id(i, roi=False)] = \
-                            summary_feature[self.select_id(i)]
+                    data[valid] = np.reshape(
+                        summary_feature, self.k)[self.label[valid]]
             # MROI object was defined on a masked image: we square it back.
             wdata = -np.ones(mask.shape, data.dtype)
             wdata[mask] = data
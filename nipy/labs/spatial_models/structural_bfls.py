@@ -19,6 +19,51 @@ from __future__ import absolute_import
 
 import numpy as np
 from scipy import stats
+from scipy.spatial import cKDTree
+
+from nipy.algorithms.utils.fast_distance import euclidean_distance
+
+
+def _gaussian_kernel_sum(pos, coord, sigma, cutoff=None, tree=None):
+    """Sum of Gaussian kernels centered on pos, sampled at coord
+
+    Parameters
+    ----------
+    pos: array of shape(n_pos, dim),
+         the kernel centers
+    coord: array of shape(n, dim),
+           the sampling coordinates
+    sigma: float,
+           kernel size
+    cutoff: float or None, optional
+            if not None, the kernels are truncated beyond cutoff * sigma
+            and only the (pos, coord) pairs closer than that are
+            considered; the pairs are found with a KD-tree on coord.
+            If None, all the pairs are evaluated.
+    tree: scipy.spatial.cKDTree instance, optional
+          a KD-tree built on coord, to be reused across calls
+
+    Returns
+    -------
+    ksum: array of shape(n)
+          sum_i exp(- ||coord - pos_i|| ** 2 / (2 * sigma ** 2))
+    """
+    if cutoff is None or not hasattr(cKDTree, 'query_ball_point'):
+        dist = euclidean_distance(pos, coord)
+        return np.exp(- dist ** 2 / (2 * sigma ** 2)).sum(0)
+    if tree is None:
+        tree = cKDTree(coord)
+    ksum = np.zeros(coord.shape[0])
+    if pos.shape[0] == 0:
+        return ksum
+    neighbors = tree.query_ball_point(pos, cutoff * sigma)
+    i = np.repeat(np.arange(pos.shape[0]), [len(nb) for nb in neighbors])
+    if i.size == 0:
+        return ksum
+    j = np.concatenate(neighbors).astype(np.intp)
+    sqdist = np.sum((coord[j] - pos[i]) ** 2, 1)
+    return np.bincount(j, np.exp(- sqdist / (2 * sigma ** 2)),
+                       minlength=coord.shape[0])
 
 
 def _threshold_weight_map(x, fraction):
@@ -76,7 +121,8 @@ class LandmarkRegions(object):
         centers_ = np.array([np.mean(pos[k], 0) for k in range(self.k)])
         return centers_
 
-    def kernel_density(self, k=None, coord=None, sigma=1.):
+    def kernel_density(self, k=None, coord=None, sigma=1., cutoff=6.,
+                       tree=None):
         """ Compute the density of a component as a kde
 
         Parameters
@@ -88,29 +134,36 @@ class LandmarkRegions(object):
             a set of input coordinates
         sigma: float, optional
                kernel size
+        cutoff: float or None, optional
+                the kernels are truncated beyond cutoff * sigma, which
+                makes the computation linear in the number of regions and
+                coordinates; the relative error on each kernel is below
+                exp(- cutoff ** 2 / 2). If None, the kernels are evaluated
+                at all the coordinates.
+        tree: scipy.spatial.cKDTree instance, optional
+              KD-tree built on coord, to be reused across calls
 
         Returns
         -------
         kde: array of shape(n)
              the density sampled at the coords
         """
-        from nipy.algorithms.utils.fast_distance import euclidean_distance
         if coord is None:
             coord = self.domain.coord
+        if cutoff is not None and tree is None:
+            tree = cKDTree(coord)
         if k is None:
             kde = np.zeros(coord.shape[0])
             for k in range(self.k):
-                pos = self.position[k]
-                dist = euclidean_distance(pos, coord)
-                kde += np.exp(- dist ** 2 / (2 * sigma ** 2)).sum(0)
+                kde += _gaussian_kernel_sum(
+                    self.position[k], coord, sigma, cutoff, tree)
         else:
             k = int(k)
-            pos = self.position[k]
-            dist = euclidean_distance(pos, coord)
-            kde = np.exp(- dist ** 2 / (2 * sigma ** 2)).sum(0)
-        return kde / (2 * np.pi * sigma ** 2) ** (pos.shape[1] / 2)
+            kde = _gaussian_kernel_sum(
+                self.position[k], coord, sigma, cutoff, tree)
+        return kde / (2 * np.pi * sigma ** 2) ** (coord.shape[1] / 2)
 
-    def map_label(self, coord=None, pval=1., sigma=1.):
+    def map_label(self, coord=None, pval=1., sigma=1., cutoff=6.):
         """Sample the set of landmark regions
         on the proposed coordiante set cs, assuming a Gaussian shape
 
@@ -122,6 +175,8 @@ class LandmarkRegions(object):
               cutoff for the CR, i.e.  highest posterior density threshold
         sigma: float, positive, optional
                spatial scale of the spatial model
+        cutoff: float or None, optional
+                kernel truncation, see kernel_density
 
         Returns
         -------
@@ -132,9 +187,12 @@ class LandmarkRegions(object):
         label = - np.ones(coord.shape[0])
         null_density = 1. / self.domain.local_volume.sum()
         if self.k > 0:
+            tree = None
+            if cutoff is not None:
+                tree = cKDTree(coord)
             aux = - np.zeros((coord.shape[0], self.k))
             for k in range(self.k):
-                kde = self.kernel_density(k, coord, sigma)
+                kde = self.kernel_density(k, coord, sigma, cutoff, tree)
                 aux[:, k] = _threshold_weight_map(kde, pval)
 
             aux[aux < null_density] = 0
@@ -210,6 +268,10 @@ def build_landmarks(domain, coords, subjects, labels, confidence=None,
         confidence = np.ones(labels.size)
     intrasubj = np.concatenate([np.arange(np.sum(subjects == s))
                                 for s in np.unique(subjects)])
+    # index in coords of the intrasubj-th region of each subject
+    subject_order = np.argsort(subjects, kind='mergesort')
+    region_index = subject_order[
+        np.searchsorted(subjects[subject_order], subjects) + intrasubj]
 
     coordinates = []
     subjs = []
@@ -233,10 +295,7 @@ def build_landmarks(domain, coords, subjects, labels, confidence=None,
         # if above threshold, get some information to create the landmarks
         if (stats.norm.sf(prevalence_threshold, mean_c, np.sqrt(var_c)) >
             prevalence_pval):
-            coord = np.vstack([
-                    coords[subjects == s][k] for (k, s) in zip(
-                        intrasubj[labels == i],
-                        subjects[labels == i])])
+            coord = coords[region_index[labels == i]]
             valid[i] = 1
             coordinates.append(coord)
             subjs.append(subjects_i)
@@ -12,10 +12,12 @@ import numpy as np
 import scipy.stats as st
 from nose.tools import assert_true
 
-from nipy.testing import dec, assert_array_equal
+from nipy.testing import dec, assert_array_equal, assert_almost_equal
 
 from ...utils.simul_multisubject_fmri_dataset import surrogate_2d_dataset
-from ..bayesian_structural_analysis import compute_landmarks, _stat_to_proba
+from ..bayesian_structural_analysis import (compute_landmarks, _stat_to_proba,
+                                            _nearest_sites)
+from ..structural_bfls import LandmarkRegions
 from ..discrete_domain import domain_from_binary_array
 
 
@@ -114,6 +116,30 @@ def test_pproba():
     
 
 
+def test_kernel_density_cutoff():
+    # the truncated kernels match the full ones
+    dom = domain_from_binary_array(np.ones((20, 20, 10)))
+    rng = np.random.RandomState(0)
+    position = [rng.rand(n, 3) * [20, 20, 10] for n in (3, 5)]
+    subjects = [np.arange(3), np.arange(5)]
+    confidence = [np.ones(3), np.ones(5)]
+    lr = LandmarkRegions(dom, 2, position, subjects, confidence)
+    for k in (None, 0, 1):
+        kde = lr.kernel_density(k, sigma=2.)
+        assert_almost_equal(kde, lr.kernel_density(k, sigma=2., cutoff=None))
+    assert_array_equal(lr.map_label(pval=.9, sigma=2.),
+                       lr.map_label(pval=.9, sigma=2., cutoff=None))
+
+
+def test_nearest_sites():
+    dom = domain_from_binary_array(np.ones((10, 10, 10)))
+    # half-integer coordinates are equidistant to several sites
+    coords = np.vstack((dom.coord[[3, 500, 999]] + .5,
+                        np.random.rand(20, 3) * 10))
+    ref = [np.argmin(np.sum((dom.coord - c) ** 2, 1)) for c in coords]
+    assert_array_equal(_nearest_sites(dom.coord, coords), ref)
+
+
 if __name__ == '__main__':
     import nose
     nose.run(argv=['', __file__])
@@ -10,10 +10,12 @@ from __future__ import print_function, absolute_import
 
 import numpy as np
 from numpy.testing import assert_almost_equal, assert_equal
+from nose.tools import assert_true
 from ..discrete_domain import smatrix_from_nd_idx, smatrix_from_3d_array, \
     smatrix_from_nd_array, domain_from_binary_array, domain_from_image, \
     domain_from_mesh, grid_domain_from_binary_array, grid_domain_from_image, \
     grid_domain_from_shape
+from .. import discrete_domain
 from nibabel import Nifti1Image
 import nibabel.gifti as nbg
 
@@ -108,6 +110,31 @@ def test_matrix_from_3d_array():
     assert_equal((sm.data > 0).sum(), ne)
 
 
+def test_matrix_from_3d_array_nn():
+    """Test the 18 and 26 neighboring systems against a brute force search
+    """
+    mask = np.random.rand(*shape[:3]) > .5
+    ijk = np.array(np.where(mask)).T
+    sqdist = ((ijk[:, np.newaxis] - ijk) ** 2).sum(2)
+    l_inf = np.abs(ijk[:, np.newaxis] - ijk).max(2)
+    for nn, max_sqdist in ((6, 1), (18, 2), (26, 3)):
+        sm = smatrix_from_3d_array(mask, nn).toarray()
+        ref = (l_inf == 1) & (sqdist <= max_sqdist)
+        assert_equal(sm > 0, ref)
+        assert_almost_equal(sm[ref], np.sqrt(sqdist[ref]))
+
+
+def test_smatrix_cache():
+    """Test that the cached topologies are not shared between domains
+    """
+    mask = np.random.rand(*shape[:3]) > .5
+    sm1 = smatrix_from_nd_array(mask)
+    sm2 = smatrix_from_nd_array(mask)
+    assert_equal(sm1.toarray(), sm2.toarray())
+    sm1.data[:] = 0
+    assert_equal(smatrix_from_nd_array(mask).toarray(), sm2.toarray())
+
+
 def test_array_domain():
     """Test the construction of domain based on array
     """
@@ -204,6 +231,9 @@ def test_domain_mask():
     ddom = domain_from_binary_array(toto)
     mdom = ddom.mask(np.ravel(toto > .5))
     assert_equal(mdom.size, np.sum(toto > .5))
+    ref = smatrix_from_nd_array(toto > .5)
+    assert_equal(mdom.topology.nnz, ref.nnz)
+    assert_equal((mdom.topology.tocsr() - ref.tocsr()).nnz, 0)
 
 
 def test_grid_domain_mask():
@@ -213,6 +243,9 @@ def test_grid_domain_mask():
     ddom = grid_domain_from_binary_array(toto)
     mdom = ddom.mask(np.ravel(toto > .5))
     assert_equal(mdom.size, np.sum(toto > .5))
+    ref = smatrix_from_nd_array(toto > .5)
+    assert_equal(mdom.topology.nnz, ref.nnz)
+    assert_equal((mdom.topology.tocsr() - ref.tocsr()).nnz, 0)
 
 
 @skipif(not GOOD_GIFTI)
@@ -271,6 +304,27 @@ def test_integrate_2d():
     assert_almost_equal(ddom.integrate('data'), ts)
 
 
+def test_topology_cache_bound():
+    # the cache never holds more entries than TOPOLOGY_CACHE_NNZ
+    nnz_max = discrete_domain.TOPOLOGY_CACHE_NNZ
+    cache = discrete_domain._topology_cache
+    cache.clear()
+    try:
+        discrete_domain.TOPOLOGY_CACHE_NNZ = 2000
+        for size in (4, 5, 6, 20, 7):
+            A = smatrix_from_3d_array(np.ones((size, size, size)), nn=6)
+            assert_equal(A.nnz, 6 * size ** 2 * (size - 1))
+            assert_true(sum(t.nnz for t in cache.values()) <= 2000)
+            if size == 20:
+                # too large to be cached
+                assert_equal(len(cache), 3)
+        # the oldest topologies were evicted to make room
+        assert_equal(len(cache), 1)
+    finally:
+        discrete_domain.TOPOLOGY_CACHE_NNZ = nnz_max
+        cache.clear()
+
+
 if __name__ == "__main__":
     import nose
     nose.run(argv=['', __file__])
@@ -222,6 +222,23 @@ def test_sd_representative():
             assert_equal(sums2[1], 17. / 9)
 
 
+def test_hroi_subtree_size():
+    """Test the sizes and volumes of the ROIs including their children
+    """
+    hroi = make_hroi()
+    hroi.parents = np.array([0, 0, 1, 1, 4, 4, 4, 4, 7])
+    size = hroi.get_size()
+    full_size = hroi.get_size(ignore_children=False)
+    full_volume = hroi.get_volume(ignore_children=False)
+    for k in hroi.get_id():
+        i = hroi.select_id(k)
+        desc = hroi.make_forest().get_descendants(i)
+        assert_equal(full_size[i], np.sum([size[j] for j in desc]))
+        assert_equal(full_size[i], hroi.get_size(k, ignore_children=False))
+        assert_equal(full_volume[i],
+                     hroi.get_volume(k, ignore_children=False))
+
+
 if __name__ == "__main__":
     import nose
     nose.run(argv=['', __file__])
@@ -157,6 +157,23 @@ def test_sd_representative():
         assert_equal(sums[mroi.select_id(k)], k)
 
 
+def test_sd_representative_methods():
+    """Test the representative features against per-ROI numpy reductions
+    """
+    mroi = make_subdomain()
+    rng = np.random.RandomState(0)
+    data = [rng.randn(mroi.get_size(k)) for k in mroi.get_id()]
+    data[1][1] = np.nan
+    mroi.set_feature('data', data)
+    for method, func in (('mean', np.mean), ('min', np.min),
+                         ('max', np.max), ('median', np.median)):
+        rf = mroi.representative_feature('data', method)
+        for k in range(mroi.k):
+            assert_almost_equal(rf[k], func(data[k][~np.isnan(data[k])]))
+    mroi.representative_feature('data', assess_quality=True)
+    assert_almost_equal(mroi.get_roi_feature('data_quality')[1], 7. / 8)
+
+
 def test_sd_from_ball():
     dom = domain_from_binary_array(np.ones((10, 10)))
     radii = np.array([2, 2, 2])
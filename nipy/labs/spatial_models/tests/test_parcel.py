@@ -160,6 +160,22 @@ def test_prfx():
     assert one_sample.mean() < 1
     assert one_sample.mean() > -1
 
+
+def test_hparcel_n_jobs():
+    """Test that the parcellation does not depend on the number of jobs
+    """
+    n_subj = 3
+    shape = (15, 15)
+    dataset = surrogate_2d_dataset(n_subj=n_subj, shape=shape)
+    domain = grid_domain_from_binary_array(dataset[0] ** 2, np.eye(3))
+    ldata = np.reshape(dataset, (n_subj, np.prod(shape), 1))
+    labels = []
+    for n_jobs in (1, 2):
+        np.random.seed(0)
+        Pa = hparcel(domain, ldata, 5, niter=2, n_jobs=n_jobs)
+        labels.append(Pa.individual_labels)
+    assert (labels[0] == labels[1]).all()
+
 if __name__ == '__main__':
     import nose
     nose.run(argv=['', __file__])
@@ -24,6 +24,12 @@ import numpy as np
 from nipy.io.nibcompat import get_affine
 from nipy.labs.spatial_models.discrete_domain import \
     grid_domain_from_binary_array
+from nipy.utils.parallel import (effective_n_jobs, parallel_map,
+                                 random_seeds, local_random_state)
+
+# maximal number of data elements gathered to compute the statistics of
+# several subgroups at once
+STAT_BATCH_SIZE = 2 ** 22
 
 # ---------------------------------------------------------
 # ----- cluster handling functions ------------------------
@@ -295,6 +301,88 @@ def voxel_thresholded_ttest(x, threshold):
     return t > threshold
 
 
+def statistic_map(x, vx, method='crfx', k=None):
+    """ Return the group statistic of the given method over each row of x
+
+    Parameters
+    ----------
+    x: array of shape(nrows, ncols): effect matrix
+    vx: array of shape(nrows, ncols) or None: variance matrix,
+        unused if method == 'crfx'
+    method: string, to be chosen among 'crfx', 'cmfx', 'cffx', 'cjt'
+            inference method
+    k: int, optional,
+       number of subjects in the conjunction (method == 'cjt'),
+       defaults to half of the columns
+
+    Returns
+    -------
+    t array of shape(nrows): the statistics
+    """
+    if method == 'crfx':
+        return ttest(x)
+    elif method == 'cffx':
+        return fttest(x, vx)
+    elif method == 'cmfx':
+        return mfx_ttest(x, vx)
+    elif method == 'cjt':
+        if k is None:
+            k = x.shape[1] // 2
+        return conjunction(x, vx, k)
+    raise ValueError('unknown method')
+
+
+def subgroup_statistic_maps(data, vardata, samples, method='crfx',
+                            swap=False, k=None):
+    """ Compute the statistic maps of several subgroups of subjects
+
+    Subgroups of the same size are stacked and their statistics computed
+    in one call, by batches of at most STAT_BATCH_SIZE data elements.
+
+    Parameters
+    ----------
+    data: array of shape (nvox, nsubj), the input effects
+    vardata: array of shape (nvox, nsubj) or None, the variance of data
+    samples: list of arrays, the indexes of the subjects in each subgroup,
+             e.g. as given by draw_samples
+    method: string, inference method, see statistic_map
+    swap: bool, optional,
+          if True, the sign of each subject's data is randomly swapped
+    k: int, optional, see statistic_map
+
+    Returns
+    -------
+    stat_maps: list of arrays of shape (nvox), one per subgroup
+    """
+    nvox = data.shape[0]
+    if swap:
+        signs = [2 * (np.random.rand(len(sample)) > 0.5) - 1
+                 for sample in samples]
+    stat_maps = [None] * len(samples)
+    i = 0
+    while i < len(samples):
+        size = len(samples[i])
+        max_batch = max(1, STAT_BATCH_SIZE // max(1, nvox * size))
+        batch = [i]
+        while (len(batch) < max_batch and batch[-1] + 1 < len(samples) and
+               len(samples[batch[-1] + 1]) == size):
+            batch.append(batch[-1] + 1)
+        x, vx = [], None
+        for j in batch:
+            if swap:
+                x.append(data[:, samples[j]] * signs[j])
+            else:
+                x.append(data[:, samples[j]])
+        x = np.vstack(x)
+        if method != 'crfx':
+            vx = np.vstack([vardata[:, samples[j]] for j in batch])
+        stat = np.reshape(statistic_map(x, vx, method, k), (len(batch), nvox))
+        for j, stat_map in zip(batch, stat):
+            stat_maps[j] = stat_map
+        i = batch[-1] + 1
+    return stat_maps
+
+
 def statistics_from_position(target, data, sigma=1.0):
     """ Return a number characterizing how close data is from
     target using a kernel-based statistic
@@ -432,36 +520,14 @@ def map_reproducibility(data, vardata, domain, ngroups, method='crfx',
     nvox = data.shape[0]
     samples = draw_samples(nsubj, ngroups)
     rmap = np.zeros(nvox)
+    csize = kwargs['csize']
+    threshold = kwargs['threshold']
 
-    for i in range(ngroups):
-        x = data[:, samples[i]]
-
-        if swap:
-            # randomly swap the sign of x
-            x *= (2 * (np.random.rand(len(samples[i])) > 0.5) - 1)
-
-        if method is not 'crfx':
-            vx = vardata[:, samples[i]]
-        csize = kwargs['csize']
-        threshold = kwargs['threshold']
-
-        # compute the statistical maps according to the method you like
-        if method == 'crfx':
-            stat_map = ttest(x)
-        elif method == 'cffx':
-            stat_map = fttest(x, vx)
-        elif method == 'cmfx':
-            stat_map = mfx_ttest(x, vx)
-        elif method == 'cjt':
-            # if kwargs.has_key('k'):
-            if 'k' in kwargs:
-                k = kwargs['k']
-            else:
-                k = nsubj / 2
-            stat_map = conjunction(x, vx, k)
-        else:
-            raise ValueError('unknown method')
+    # compute the statistical maps according to the method you like
+    stat_maps = subgroup_statistic_maps(
+        data, vardata, samples, method, swap, kwargs.get('k', nsubj // 2))
 
+    for stat_map in stat_maps:
         # add the binarized map to a reproducibility map
         rmap += cluster_threshold(stat_map, domain, threshold, csize) > 0
 
@@ -495,53 +561,20 @@ def peak_reproducibility(data, vardata, domain, ngroups, sigma, method='crfx',
     -------
     score (float): the desired  cluster-level reproducibility index
     """
-    tiny = 1.e-15
     nsubj = data.shape[1]
     samples = draw_samples(nsubj, ngroups)
-    all_pos = []
 
     # compute the positions in the different subgroups
-    for i in range(ngroups):
-        x = data[:, samples[i]]
-
-        if swap:
-            # apply a random sign swap to x
-            x *= (2 * (np.random.rand(len(samples[i])) > 0.5) - 1)
-
-        if method is not 'crfx':
-            vx = vardata[:, samples[i]]
-        if method is not 'bsa':
-            threshold = kwargs['threshold']
-
-            if method == 'crfx':
-                stat_map = ttest(x)
-            elif method == 'cmfx':
-                stat_map = mfx_ttest(x, vx)
-            elif method == 'cffx':
-                stat_map = fttest(x, vx)
-            elif method == 'cjt':
-                if 'k' in kwargs:
-                    k = kwargs['k']
-                else:
-                    k = nsubj / 2
-                stat_map = conjunction(x, vx, k)
-
-            pos = get_peak_position_from_thresholded_map(
-                stat_map, domain, threshold)
-            all_pos.append(pos)
-        else:
-            # method='bsa' is a special case
-            tx = x / (tiny + np.sqrt(vx))
-            afname = kwargs['afname']
-            theta = kwargs['theta']
-            dmax = kwargs['dmax']
-            ths = kwargs['ths']
-            thq = kwargs['thq']
-            smin = kwargs['smin']
-            niter = kwargs['niter']
-            afname = afname + '_%02d_%04d.pic' % (niter, i)
-            pos = coord_bsa(domain, tx, theta, dmax, ths, thq, smin, afname)
-            all_pos.append(pos)
+    if method != 'bsa':
+        threshold = kwargs['threshold']
+        stat_maps = subgroup_statistic_maps(
+            data, vardata, samples, method, swap, kwargs.get('k', nsubj // 2))
+        all_pos = [get_peak_position_from_thresholded_map(
+                stat_map, domain, threshold) for stat_map in stat_maps]
+    else:
+        # method='bsa' is a special case
+        all_pos = _bsa_positions(data, vardata, domain, samples, swap,
+                                 **kwargs)
 
     # derive a kernel-based goodness measure from the pairwise comparison
     # of sets of positions
@@ -554,6 +587,24 @@ def peak_reproducibility(data, vardata, domain, ngroups, sigma, method='crfx',
     return score
 
 
+def _bsa_positions(data, vardata, domain, samples, swap=False, **kwargs):
+    """ Return the landmark positions found by BSA in each subgroup
+    """
+    tiny = 1.e-15
+    all_pos = []
+    for i, sample in enumerate(samples):
+        x = data[:, sample]
+        if swap:
+            # apply a random sign swap to x
+            x *= (2 * (np.random.rand(len(sample)) > 0.5) - 1)
+        tx = x / (tiny + np.sqrt(vardata[:, sample]))
+        afname = kwargs['afname'] + '_%02d_%04d.pic' % (kwargs['niter'], i)
+        all_pos.append(coord_bsa(domain, tx, kwargs['theta'], kwargs['dmax'],
+                                 kwargs['ths'], kwargs['thq'], kwargs['smin'],
+                                 afname))
+    return all_pos
+
+
 def cluster_reproducibility(data, vardata, domain, ngroups, sigma,
                             method='crfx', swap=False, verbose=0,
                             **kwargs):
@@ -583,52 +634,21 @@ def cluster_reproducibility(data, vardata, domain, ngroups, sigma,
     -------
     score (float): the desired  cluster-level reproducibility index
     """
-    tiny = 1.e-15
     nsubj = data.shape[1]
     samples = draw_samples(nsubj, ngroups)
-    all_pos = []
 
     # compute the positions in the different subgroups
-    for i in range(ngroups):
-        x = data[:, samples[i]]
-
-        if swap:
-            # apply a random sign swap to x
-            x *= (2 * (np.random.rand(len(samples[i])) > 0.5) - 1)
-
-        if method is not 'crfx':
-            vx = vardata[:, samples[i]]
-        if method is not 'bsa':
-            csize = kwargs['csize']
-            threshold = kwargs['threshold']
-            if method == 'crfx':
-                stat_map = ttest(x)
-            elif method == 'cmfx':
-                stat_map = mfx_ttest(x, vx)
-            elif method == 'cffx':
-                stat_map = fttest(x, vx)
-            elif method == 'cjt':
-                if  'k' in kwargs:
-                    k = kwargs['k']
-                else:
-                    k = nsubj / 2
-                stat_map = conjunction(x, vx, k)
-            pos = get_cluster_position_from_thresholded_map(stat_map, domain,
-                                                            threshold, csize)
-            all_pos.append(pos)
-        else:
-            # method='bsa' is a special case
-            tx = x / (tiny + np.sqrt(vx))
-            afname = kwargs['afname']
-            theta = kwargs['theta']
-            dmax = kwargs['dmax']
-            ths = kwargs['ths']
-            thq = kwargs['thq']
-            smin = kwargs['smin']
-            niter = kwargs['niter']
-            afname = afname + '_%02d_%04d.pic' % (niter, i)
-            pos = coord_bsa(domain, tx, theta, dmax, ths, thq, smin, afname)
-        all_pos.append(pos)
+    if method != 'bsa':
+        csize = kwargs['csize']
+        threshold = kwargs['threshold']
+        stat_maps = subgroup_statistic_maps(
+            data, vardata, samples, method, swap, kwargs.get('k', nsubj // 2))
+        all_pos = [get_cluster_position_from_thresholded_map(
+                stat_map, domain, threshold, csize) for stat_map in stat_maps]
+    else:
+        # method='bsa' is a special case
+        all_pos = _bsa_positions(data, vardata, domain, samples, swap,
+                                 **kwargs)
 
     # derive a kernel-based goodness measure from the pairwise comparison
     # of sets of positions
@@ -642,10 +662,29 @@ def cluster_reproducibility(data, vardata, domain, ngroups, sigma,
     return score
 
 
+def _reproducibility_draw(args):
+    """ Compute the reproducibility measures of one random draw
+    """
+    (data, vardata, domain, ngroups, sigma, method, swap, kwargs,
+     do_voxels, do_clusters, do_peaks, seed) = args
+    kappa, cls, pk = None, None, None
+    with local_random_state(seed):
+        if do_voxels:
+            kappa = voxel_reproducibility(
+                data, vardata, domain, ngroups, method, swap, **kwargs)
+        if do_clusters:
+            cls = cluster_reproducibility(
+                data, vardata, domain, ngroups, sigma, method, swap, **kwargs)
+        if do_peaks:
+            pk = peak_reproducibility(
+                data, vardata, domain, ngroups, sigma, method, swap, **kwargs)
+    return kappa, cls, pk
+
+
 def group_reproducibility_metrics(
     mask_images, contrast_images, variance_images, thresholds, ngroups,
     method, cluster_threshold=10, number_of_samples=10, sigma=6.,
-    do_clusters=True, do_voxels=True, do_peaks=True, swap=False):
+    do_clusters=True, do_voxels=True, do_peaks=True, swap=False, n_jobs=1):
     """
     Main function to perform reproducibility analysis, including nifti1 io
 
@@ -653,6 +692,11 @@ def group_reproducibility_metrics(
     ----------
     threshold: list or 1-d array,
                the thresholds to be tested
+    n_jobs: int, optional,
+            number of processes among which the random draws are shared,
+            see nipy.utils.parallel. Each draw is seeded beforehand from
+            the global numpy generator, so that the results do not depend
+            on n_jobs
 
     Returns
     -------
@@ -696,6 +740,22 @@ def group_reproducibility_metrics(
     cluster_rep_results = {}
     peak_rep_results = {}
 
+    tasks = []
+    for ng in ngroups:
+        for th in thresholds:
+            kwargs = {'threshold': th, 'csize': cluster_threshold}
+            seeds = random_seeds(number_of_samples)
+            tasks += [(group_con, group_var, domain, ng, sigma, method, swap,
+                       kwargs, do_voxels, do_clusters, do_peaks, seed)
+                      for seed in seeds]
+
+    # send contiguous chunks of draws to the workers, so that the data,
+    # shared by all tasks, is pickled only once per chunk
+    n_workers = min(effective_n_jobs(n_jobs), max(len(tasks), 1))
+    chunksize = int(np.ceil(len(tasks) / float(n_workers)))
+    results = parallel_map(_reproducibility_draw, tasks, n_jobs,
+                           chunksize=max(chunksize, 1))
+
     for ng in ngroups:
         if do_voxels:
             voxel_rep_results.update({ng: {}})
@@ -704,31 +764,17 @@ def group_reproducibility_metrics(
         if do_peaks:
             peak_rep_results.update({ng: {}})
         for th in thresholds:
-            kappa = []
-            cls = []
-            pk = []
-            kwargs = {'threshold': th, 'csize': cluster_threshold}
-
-            for i in range(number_of_samples):
-                if do_voxels:
-                    kappa.append(voxel_reproducibility(
-                            group_con, group_var, domain, ng, method, swap,
-                            **kwargs))
-                if do_clusters:
-                    cls.append(cluster_reproducibility(
-                            group_con, group_var, domain, ng, sigma, method,
-                            swap, **kwargs))
-                if do_peaks:
-                    pk.append(peak_reproducibility(
-                            group_con, group_var, domain, ng, sigma, method,
-                            swap, **kwargs))
-
+            draws = results[:number_of_samples]
+            results = results[number_of_samples:]
             if do_voxels:
-                voxel_rep_results[ng].update({th: np.array(kappa)})
+                voxel_rep_results[ng].update(
+                    {th: np.array([draw[0] for draw in draws])})
             if do_clusters:
-                cluster_rep_results[ng].update({th: np.array(cls)})
+                cluster_rep_results[ng].update(
+                    {th: np.array([draw[1] for draw in draws])})
             if do_peaks:
-                peak_rep_results[ng].update({th: np.array(cls)})
+                peak_rep_results[ng].update(
+                    {th: np.array([draw[2] for draw in draws])})
 
     return voxel_rep_results, cluster_rep_results, peak_rep_results
 
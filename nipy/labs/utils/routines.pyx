@@ -20,7 +20,7 @@ warn('Module nipy.labs.utils.routines deprecated, will be removed',
 # Exports from fff_gen_stats.h
 cdef extern from "fff_gen_stats.h":
 
-    double fff_mahalanobis(fff_vector* x, fff_matrix* S, fff_matrix* Saux)
+    double fff_mahalanobis(fff_vector* x, fff_matrix* S, fff_matrix* Saux) nogil
     void fff_permutation(unsigned int* x, unsigned int n,
                          unsigned long int magic)
     void fff_combination(unsigned int* x, unsigned int k, unsigned int n,
@@ -45,36 +45,45 @@ fffpy_import_array()
 cnp.import_array()
 import numpy as np
 
+EPS = np.finfo(np.float64).eps
+
 # This is faster than scipy.stats.scoreatpercentile due to partial
 # sorting
 def quantile(X, double ratio, int interp=False, int axis=0):
     """
     q = quantile(data, ratio, interp=False, axis=0).
 
-    Partial sorting algorithm, very fast!!!
+    Partial sorting algorithm, very fast!!! The vectors along `axis` are
+    first gathered as the rows of a contiguous block of doubles (so that
+    `data` is left untouched), then processed without the GIL.
     """
-    cdef fff_vector *x, *y
-    cdef fffpy_multi_iterator* multi
+    cdef cnp.ndarray B, Y
+    cdef fff_vector x
+    cdef double *b, *y
+    cdef size_t k, nvec, n
 
     # Allocate output array Y
+    X = np.asarray(X)
     dims = list(X.shape)
     dims[axis] = 1
     Y = np.zeros(dims)
 
-    # Create a new array iterator 
-    multi = fffpy_multi_iterator_new(2, axis, <void*>X, <void*>Y)
+    # Gather the vectors in a C-contiguous copy
+    B = np.array(np.rollaxis(X, axis, X.ndim), dtype=np.double, order='C')
+    n = X.shape[axis]
+    nvec = Y.size
+    x.size = n
+    x.stride = 1
+    x.owner = 0
+    b = <double*>B.data
+    y = <double*>Y.data
 
-    # Create vector views on both X and Y 
-    x = multi.vector[0]
-    y = multi.vector[1]
+    # Loop
+    with nogil:
+        for k in range(nvec):
+            x.data = b + k * n
+            y[k] = fff_vector_quantile(&x, ratio, interp)
 
-    # Loop 
-    while(multi.index < multi.size):
-        y.data[0] = fff_vector_quantile(x, ratio, interp) 
-        fffpy_multi_iterator_update(multi)
-       
-    # Delete local structures
-    fffpy_multi_iterator_delete(multi)
     return Y
 
 # This is faster than numpy.stats
@@ -97,52 +106,77 @@ def mahalanobis(X, VX):
 
     axis == 0 assumed. If X is shaped (d,K), VX must be shaped
     (d,d,K).
+
+    The Cholesky solves run without the GIL. The covariances that are not
+    numerically positive definite, including singular ones, are handled
+    with a pseudo-inverse.
     """
-    cdef fff_vector *x, *vx, *x_tmp, *vx_tmp, *d2
-    cdef fff_matrix Sx 
+    cdef cnp.ndarray Xf, Vf, D2, Failed
+    cdef fff_vector *x, *vx, *diag
+    cdef fff_matrix Sx
     cdef fff_matrix *Sx_tmp
-    cdef fffpy_multi_iterator* multi
-    cdef int axis=0, n
-
-    # Allocate output array
-    dims = list(X.shape)
-    dim = dims[0]
-    dims[0] = 1
-    D2 = np.zeros(dims)
-
-    # Flatten input variance array
-    VX_flat = VX.reshape( [dim*dim]+list(VX.shape[2:]) )
-
-    # Create a new array iterator 
-    multi = fffpy_multi_iterator_new(3, axis, <void*>X, <void*>VX_flat, <void*>D2)
-
-    # Allocate local structures 
-    n = <int> X.shape[axis]
-    x_tmp = fff_vector_new(n)
-    vx_tmp = fff_vector_new(n*n) 
+    cdef char *xf, *vf, *failed
+    cdef double *d2
+    cdef double l, tol = EPS
+    cdef npy_intp k, i, nvec, n, xs0, xs1, vs0, vs1
+
+    # Flatten input arrays
+    n = X.shape[0]
+    shape = VX.shape[2:]
+    Xf = np.asarray(np.reshape(X, (n, -1)), dtype=np.double)
+    Vf = np.asarray(np.reshape(VX, (n * n, -1)), dtype=np.double)
+    nvec = Vf.shape[1]
+    D2 = np.zeros(nvec)
+    Failed = np.zeros(nvec, dtype=np.int8)
+
+    # Allocate local structures
+    x = fff_vector_new(n)
+    vx = fff_vector_new(n * n)
+    diag = fff_vector_new(n)
+    Sx = fff_matrix_view(vx.data, n, n, n) # OK because vx is contiguous
     Sx_tmp = fff_matrix_new(n, n)
+    xf, xs0, xs1 = Xf.data, Xf.strides[0], Xf.strides[1]
+    vf, vs0, vs1 = Vf.data, Vf.strides[0], Vf.strides[1]
+    d2 = <double*>D2.data
+    failed = <char*>Failed.data
+    tol *= n
 
-    # Create vector views on X, VX_flat and D2 
-    x = multi.vector[0]
-    vx = multi.vector[1] 
-    d2 = multi.vector[2] 
-
-    # Loop 
-    while(multi.index < multi.size):
-        fff_vector_memcpy(x_tmp, x)
-        fff_vector_memcpy(vx_tmp, vx) 
-        Sx = fff_matrix_view(vx_tmp.data, n, n, n) # OK because vx_tmp is contiguous  
-        d2.data[0] = fff_mahalanobis(x_tmp, &Sx, Sx_tmp)
-        fffpy_multi_iterator_update(multi)
+    # Loop
+    with nogil:
+        for k in range(nvec):
+            # copy the data, which the factorization overwrites
+            for i in range(n):
+                x.data[i] = (<double*>(xf + i * xs0 + k * xs1))[0]
+            for i in range(n * n):
+                vx.data[i] = (<double*>(vf + i * vs0 + k * vs1))[0]
+            for i in range(n):
+                diag.data[i] = Sx.data[i * (n + 1)]
+            d2[k] = fff_mahalanobis(x, &Sx, Sx_tmp)
+            # the diagonal of the Cholesky factor exposes the failed or
+            # ill-conditioned factorizations
+            for i in range(n):
+                l = Sx.data[i * (n + 1)]
+                if not (l > 0 and l * l > tol * diag.data[i]):
+                    failed[k] = 1
+                    break
 
-    # Delete local structs and views
-    fff_vector_delete(x_tmp)
-    fff_vector_delete(vx_tmp) 
+    # Delete local structures
+    fff_vector_delete(x)
+    fff_vector_delete(vx)
+    fff_vector_delete(diag)
     fff_matrix_delete(Sx_tmp)
-    fffpy_multi_iterator_delete(multi)
+
+    # Use a pseudo-inverse for those, unless they are not finite
+    if Failed.any():
+        index = np.flatnonzero(Failed)
+        xs = np.reshape(X, (n, -1)).T[index]
+        vxs = np.reshape(VX, (n, n, -1)).T[index]
+        for k, xk, vk in zip(index, xs, vxs):
+            if np.isfinite(vk).all():
+                D2[k] = np.dot(xk, np.dot(np.linalg.pinv(vk.T), xk))
 
     # Return
-    D2 = D2.reshape(VX.shape[2:])
+    D2 = D2.reshape(shape)
     return D2 
 
 
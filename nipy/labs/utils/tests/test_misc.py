@@ -4,7 +4,7 @@ from __future__ import absolute_import
 import numpy as np
 from scipy import special
 
-from ..routines import median, mahalanobis, gamln, psi
+from ..routines import quantile, median, mahalanobis, gamln, psi
 
 from nose.tools import assert_true
 from numpy.testing import assert_almost_equal, assert_equal, TestCase
@@ -24,6 +24,21 @@ class TestAll(TestCase):
         x = np.random.rand(10, 30, 11)
         assert_almost_equal(np.squeeze(median(x,axis=1)), np.median(x,axis=1))
 
+    def test_quantile(self):
+        x = np.random.rand(10, 30, 11)
+        x0 = x.copy()
+        for axis in range(3):
+            q = quantile(x, .3, interp=True, axis=axis)
+            assert_almost_equal(np.squeeze(q, axis),
+                                np.percentile(x, 30, axis=axis))
+            q = quantile(x.astype(np.float32), .3, interp=True, axis=axis)
+            assert_almost_equal(np.squeeze(q, axis),
+                                np.percentile(x, 30, axis=axis), decimal=6)
+        # the input is not reordered by the partial sorting
+        assert_equal(x, x0)
+        q = quantile(x, .5, axis=1)
+        assert_equal(q[:, 0], np.sort(x, 1)[:, 15])
+
     def test_mahalanobis(self):
         x = np.random.rand(100) / 100
         A = np.random.rand(100, 100) / 100
@@ -45,6 +60,17 @@ class TestAll(TestCase):
         f_mah = (mahalanobis(x, Aa))[i,j]
         assert_true(np.allclose(mah, f_mah))
 
+    def test_mahalanobis_singular(self):
+        x = np.random.rand(3, 4)
+        A = np.zeros((3, 3, 4))
+        A[:, :, 0] = np.eye(3)
+        A[:, :, 1] = - np.eye(3)
+        A[:, :, 2] = 1.
+        A[:2, :2, 3] = np.eye(2)
+        mah = [np.dot(x[:, i], np.dot(np.linalg.pinv(A[:, :, i]), x[:, i]))
+               for i in range(4)]
+        assert_almost_equal(mahalanobis(x, A), mah)
+
     def test_gamln(self):
         for x in (0.01+100*np.random.random(50)):
             scipy_gamln = special.gammaln(x)
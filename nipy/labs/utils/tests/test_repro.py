@@ -9,10 +9,17 @@ not whether it is exact
 from __future__ import absolute_import
 
 import numpy as np
+from numpy.testing import assert_array_equal
+from nibabel import Nifti1Image, save
+from nibabel.tmpdirs import InTemporaryDirectory
+
 from ..simul_multisubject_fmri_dataset import surrogate_2d_dataset
 from ..reproducibility_measures import (voxel_reproducibility, 
                                         cluster_reproducibility,
-                                        peak_reproducibility)
+                                        peak_reproducibility,
+                                        subgroup_statistic_maps,
+                                        statistic_map,
+                                        group_reproducibility_metrics)
 
 def make_dataset(ampli_factor=1.0, n_subj=10):
     """
@@ -121,6 +128,61 @@ def test_repro7():
     assert ((kap.mean() > 0.4))
     assert ((clt.mean() > 0.5))    
 
+def test_subgroup_statistic_maps():
+    """
+    Test that the batched statistics match the subgroup-wise ones
+    """
+    from .. import reproducibility_measures as rm
+    dataset = make_dataset()
+    func = np.reshape(dataset, (dataset.shape[0], -1)).T
+    var = np.ones_like(func) + np.random.rand(*func.shape)
+    samples = [np.array([0, 1, 2, 3]), np.array([4, 5, 6, 7]),
+               np.array([8, 9, 1]), np.array([2, 3, 4, 5])]
+    batch_size = rm.STAT_BATCH_SIZE
+    try:
+        for method in ['crfx', 'cffx', 'cmfx', 'cjt']:
+            expected = [statistic_map(func[:, s], var[:, s], method, 2)
+                        for s in samples]
+            for size in [1, func.shape[0] * 8, batch_size]:
+                rm.STAT_BATCH_SIZE = size
+                stat_maps = subgroup_statistic_maps(func, var, samples,
+                                                    method, k=2)
+                for sm, e in zip(stat_maps, expected):
+                    assert_array_equal(sm, e)
+    finally:
+        rm.STAT_BATCH_SIZE = batch_size
+
+
+def test_group_metrics_n_jobs():
+    """
+    Test that the group reproducibility metrics do not depend on n_jobs
+    """
+    dataset = make_dataset()
+    n_subj = dataset.shape[0]
+    affine = np.eye(4)
+    with InTemporaryDirectory():
+        mask_image = 'mask.nii'
+        save(Nifti1Image(np.ones((40, 40, 1), np.uint8), affine), mask_image)
+        contrast_images = []
+        for s in range(n_subj):
+            contrast_images.append('con_%02d.nii' % s)
+            save(Nifti1Image(dataset[s][:, :, np.newaxis], affine),
+                 contrast_images[-1])
+        results = []
+        for n_jobs in [1, 2]:
+            np.random.seed(0)
+            results.append(group_reproducibility_metrics(
+                    [mask_image], contrast_images, [], [3., 4.], [2, 3],
+                    'crfx', number_of_samples=3, sigma=2., n_jobs=n_jobs))
+    for res1, res2 in zip(*results):
+        for ng in [2, 3]:
+            for th in [3., 4.]:
+                assert_array_equal(res1[ng][th], res2[ng][th])
+                assert res1[ng][th].shape == (3,)
+    # the peak-level results are not the cluster-level ones
+    assert (results[0][1][2][3.] != results[0][2][2][3.]).any()
+
+
 if __name__ == "__main__":
     import nose
     nose.run(argv=['', __file__])
@@ -0,0 +1,168 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+""" Utilities to run independent tasks in parallel
+
+These are thin wrappers around the standard library ``multiprocessing``
+module, so that algorithms can expose an ``n_jobs`` keyword without
+depending on an external parallel computing package.
+
+The convention for ``n_jobs`` is the following: ``n_jobs == 1`` (the
+default everywhere) runs serially in the calling process, ``n_jobs > 1``
+uses that many workers, and negative values count back from the number of
+available CPUs, so that ``n_jobs=-1`` uses all of them.
+
+Functions sent to worker processes must be picklable, i.e. defined at the
+top level of a module.
+"""
+from __future__ import absolute_import
+
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+from contextlib import contextmanager
+
+import numpy as np
+
+# largest seed accepted by np.random.RandomState
+MAX_SEED = np.iinfo(np.int32).max
+
+
+def effective_n_jobs(n_jobs=1):
+    """ Return the actual number of workers implied by `n_jobs`
+
+    Parameters
+    ----------
+    n_jobs : int, optional
+        requested number of jobs. Negative values are counted from the
+        number of CPUs, -1 meaning all CPUs.
+
+    Returns
+    -------
+    n : int
+        number of workers, at least 1
+    """
+    n_jobs = int(n_jobs)
+    if n_jobs == 0:
+        raise ValueError('n_jobs == 0 has no meaning')
+    if n_jobs < 0:
+        n_jobs = max(multiprocessing.cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def parallel_map(func, iterable, n_jobs=1, threads=False, chunksize=1):
+    """ Apply `func` to each item of `iterable`, possibly in parallel
+
+    Parameters
+    ----------
+    func : callable
+        function of a single argument; must be picklable (defined at module
+        level) when process-based parallelism is used
+    iterable : iterable
+        the arguments
+    n_jobs : int, optional
+        number of workers, see :func:`effective_n_jobs`
+    threads : bool, optional
+        if True, use a pool of threads rather than of processes. This is
+        useful when `func` spends its time in code that releases the GIL
+        (numpy linear algebra, compiled extensions)
+    chunksize : int, optional
+        number of items sent to a worker at once
+
+    Returns
+    -------
+    results : list
+        ``[func(item) for item in iterable]``, in the same order
+    """
+    items = list(iterable)
+    n_jobs = min(effective_n_jobs(n_jobs), len(items))
+    if n_jobs <= 1:
+        return [func(item) for item in items]
+    if threads:
+        pool = ThreadPool(n_jobs)
+    else:
+        pool = multiprocessing.Pool(n_jobs)
+    try:
+        results = pool.map(func, items, chunksize)
+    finally:
+        pool.close()
+        pool.join()
+    return results
+
+
+def chunk_slices(shape, axis=None, n_jobs=1):
+    """ Index tuples cutting an array into chunks for `n_jobs` workers
+
+    The array is cut along its largest dimension other than `axis`, so
+    that each chunk holds complete vectors along `axis`.
+
+    Parameters
+    ----------
+    shape : sequence of int
+        shape of the array
+    axis : None or int, optional
+        axis that must not be cut
+    n_jobs : int, optional
+        number of workers, see :func:`effective_n_jobs`; at most that
+        many chunks are returned
+
+    Returns
+    -------
+    slices : list
+        indices of the successive chunks, ``[Ellipsis]`` when the array
+        is not cut
+    """
+    ndim = len(shape)
+    other = [i for i in range(ndim) if axis is None or i != axis % ndim]
+    n_chunks = effective_n_jobs(n_jobs)
+    if len(other) == 0 or n_chunks == 1:
+        return [Ellipsis]
+    dim = max(other, key=lambda i: shape[i])
+    bounds = np.linspace(0, shape[dim], min(n_chunks, shape[dim]) + 1)
+    bounds = bounds.astype(np.intp)
+    return [(slice(None),) * dim + (slice(a, b),)
+            for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def random_seeds(n, rng=None):
+    """ Draw `n` seeds to initialize independent random generators
+
+    Drawing the seeds up-front in the calling process makes the outcome of
+    randomized tasks independent of the number of workers that run them.
+
+    Parameters
+    ----------
+    n : int
+        number of seeds
+    rng : None or np.random.RandomState, optional
+        generator used to draw the seeds; defaults to the global numpy
+        generator, so that ``np.random.seed`` controls the results
+
+    Returns
+    -------
+    seeds : array of shape (n,)
+    """
+    if rng is None:
+        rng = np.random
+    return rng.randint(MAX_SEED, size=n)
+
+
+@contextmanager
+def local_random_state(seed):
+    """ Context manager seeding the global numpy generator temporarily
+
+    Code that draws from ``np.random`` inside the context gets a stream
+    that only depends on `seed`; the state of the global generator is
+    restored on exit. This lets a task seeded with :func:`random_seeds`
+    give the same result whether it runs in the calling process or in a
+    worker.
+
+    Parameters
+    ----------
+    seed : int
+        seed of the generator within the context
+    """
+    state = np.random.get_state()
+    np.random.seed(seed)
+    try:
+        yield
+    finally:
+        np.random.set_state(state)
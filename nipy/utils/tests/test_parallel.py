@@ -0,0 +1,69 @@
+""" Testing parallel utilities
+"""
+from __future__ import absolute_import
+
+import multiprocessing
+
+import numpy as np
+
+from ..parallel import (effective_n_jobs, parallel_map, chunk_slices,
+                        random_seeds, local_random_state)
+
+from numpy.testing import assert_array_equal
+
+from nose.tools import assert_equal, assert_true, assert_raises
+
+
+def _square(x):
+    return x ** 2
+
+
+def test_effective_n_jobs():
+    assert_equal(effective_n_jobs(1), 1)
+    assert_equal(effective_n_jobs(3), 3)
+    assert_equal(effective_n_jobs(-1), multiprocessing.cpu_count())
+    assert_equal(effective_n_jobs(-10000), 1)
+    assert_raises(ValueError, effective_n_jobs, 0)
+
+
+def test_parallel_map():
+    expected = [x ** 2 for x in range(7)]
+    for n_jobs in (1, 2, -1):
+        assert_equal(parallel_map(_square, range(7), n_jobs), expected)
+        assert_equal(parallel_map(_square, range(7), n_jobs, threads=True),
+                     expected)
+    assert_equal(parallel_map(_square, [], 2), [])
+
+
+def test_chunk_slices():
+    x = np.random.rand(4, 7, 5)
+    assert_equal(chunk_slices(x.shape, 0, 1), [Ellipsis])
+    assert_equal(chunk_slices((4,), 0, 3), [Ellipsis])
+    for axis, n_jobs in [(0, 3), (1, 2), (2, 10), (None, 4)]:
+        slices = chunk_slices(x.shape, axis, n_jobs)
+        assert_true(len(slices) <= n_jobs)
+        # the chunks partition the array and keep whole vectors along axis
+        dim = 2 if axis == 1 else 1
+        assert_array_equal(np.concatenate([x[sl] for sl in slices], dim), x)
+
+
+def test_random_seeds():
+    np.random.seed(1)
+    s1 = random_seeds(5)
+    np.random.seed(1)
+    s2 = random_seeds(5)
+    assert_array_equal(s1, s2)
+    assert_equal(s1.shape, (5,))
+    s3 = random_seeds(5, np.random.RandomState(1))
+    assert_array_equal(s1, s3)
+
+
+def test_local_random_state():
+    np.random.seed(0)
+    with local_random_state(3):
+        a = np.random.rand(3)
+    b = np.random.rand(3)
+    np.random.seed(3)
+    assert_array_equal(np.random.rand(3), a)
+    np.random.seed(0)
+    assert_array_equal(np.random.rand(3), b)